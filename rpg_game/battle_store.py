@@ -0,0 +1,434 @@
+"""Module containing array storage and bulk systems for large battles.
+
+Design Decisions:
+- Every combatant is a row in a set of NumPy columns (health, damage,
+  defence, weapon and armour bonus, team, special, level), so a round for
+  hundreds of combatants is a handful of array operations instead of
+  hundreds of method calls
+- Systems are plain functions over the store: targeting, attacks, specials,
+  damage and deaths each run once per team turn for every row at once
+- Combatant objects are thin views holding only a store and a row; they
+  offer the Character methods the combat code uses, so a single row can
+  still be fought through CombatEngine or inspected like a character
+- Rows are never removed, only marked dead, so row numbers and the views
+  holding them stay valid while summons append new rows
+- Damage rules mirror Character.attack and take_damage, and specials mirror
+  goblin_attack, necromancer_attack and fire_attack; in a battle a summoned
+  skeleton stays on the field after its first attack
+
+Requires NumPy.
+"""
+
+from typing import List, Optional
+import numpy as np
+from character import Character
+from villain import (
+    Goblin, Orc, Necromancer,
+    GOBLIN_DODGE_CHANCE, NECROMANCER_SUMMON_CHANCE, SKELETON_DAMAGE, SKELETON_STATS
+)
+from boss import FireBoss, IceBoss, FIRE_DAMAGE_MIN, FIRE_DAMAGE_MAX
+from items import ROCK
+
+# Special attack kinds stored in the special column
+SPECIAL_NONE = 0
+SPECIAL_DODGE = 1
+SPECIAL_STUN = 2
+SPECIAL_SUMMON = 3
+SPECIAL_FIRE = 4
+SPECIAL_FREEZE = 5
+
+# Stun and freeze are flavour only, so they deal the same damage as an attack
+SPECIAL_KINDS = (
+    (Goblin, SPECIAL_DODGE),
+    (Orc, SPECIAL_STUN),
+    (Necromancer, SPECIAL_SUMMON),
+    (FireBoss, SPECIAL_FIRE),
+    (IceBoss, SPECIAL_FREEZE),
+)
+
+PLAYER_TEAM = 0
+ENEMY_TEAM = 1
+DEFAULT_CAPACITY = 64
+# Same cap Character.set_health applies
+HEALTH_CAP = 1000
+
+
+def special_kind(character: Character) -> int:
+    """Return the special attack kind a character uses in battle."""
+    for character_class, kind in SPECIAL_KINDS:
+        if isinstance(character, character_class):
+            return kind
+    return SPECIAL_NONE
+
+
+class BattleStore:
+    """Structure-of-arrays storage for every combatant in a battle.
+
+    Design Decisions:
+    - Columns are preallocated and doubled when full, so adding rows during
+      a battle is cheap on average
+    - Only the first len(store) entries of each column are meaningful
+    """
+    _COLUMNS = ("health", "damage", "defense", "weapon_bonus", "armor_bonus",
+                "team", "special", "level", "alive")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Args:
+            capacity: Rows to allocate up front
+        """
+        capacity = max(1, capacity)
+        self.health = np.zeros(capacity, dtype=np.int64)
+        self.damage = np.zeros(capacity, dtype=np.int64)
+        self.defense = np.zeros(capacity, dtype=np.int64)
+        self.weapon_bonus = np.zeros(capacity, dtype=np.int64)
+        self.armor_bonus = np.zeros(capacity, dtype=np.int64)
+        self.team = np.zeros(capacity, dtype=np.int8)
+        self.special = np.zeros(capacity, dtype=np.int8)
+        self.level = np.zeros(capacity, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.names: List[str] = []
+        # Character each row was copied from, for write_back()
+        self.sources: List[Optional[Character]] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _grow(self, needed: int) -> None:
+        """Make room for at least needed rows."""
+        capacity = len(self.health)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for column in self._COLUMNS:
+            old = getattr(self, column)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, column, new)
+
+    def add(self, name: str, team: int, health: int, damage: int, defense: int = 0,
+            weapon_bonus: int = 0, armor_bonus: int = 0, special: int = SPECIAL_NONE,
+            level: int = 1) -> int:
+        """
+        Add a combatant.
+
+        Args:
+            name: Display name
+            team: Team number; combatants attack rows of other teams
+            health: Starting health
+            damage: Base damage
+            defense: Base defence
+            weapon_bonus: Damage bonus of the equipped weapon
+            armor_bonus: Defence bonus of the equipped armour
+            special: One of the SPECIAL_* kinds
+            level: Level of the combatant
+
+        Returns:
+            The new row
+        """
+        row = self._size
+        self._grow(row + 1)
+        self.health[row] = health
+        self.damage[row] = damage
+        self.defense[row] = defense
+        self.weapon_bonus[row] = weapon_bonus
+        self.armor_bonus[row] = armor_bonus
+        self.team[row] = team
+        self.special[row] = special
+        self.level[row] = level
+        self.alive[row] = health > 0
+        self.names.append(name)
+        self.sources.append(None)
+        self._size = row + 1
+        return row
+
+    def add_character(self, character: Character, team: int) -> "Combatant":
+        """
+        Copy a character's current stats into a new row.
+
+        Args:
+            character: Player, villain or boss to copy
+            team: Team the character fights for
+
+        Returns:
+            A view over the new row
+        """
+        inventory = character.inventory
+        row = self.add(character.name, team, character.get_health(), character.damage, character.defense,
+                       inventory.weapon_bonus, inventory.armor_bonus,
+                       special_kind(character), getattr(character, "level", 1))
+        self.sources[row] = character
+        return Combatant(self, row)
+
+    def view(self, row: int) -> "Combatant":
+        """Return a view over a row."""
+        if not 0 <= row < self._size:
+            raise IndexError(row)
+        return Combatant(self, row)
+
+    def attack_power(self) -> np.ndarray:
+        """Attack power of every row (damage plus weapon bonus)."""
+        size = self._size
+        return self.damage[:size] + self.weapon_bonus[:size]
+
+    def effective_defense(self) -> np.ndarray:
+        """Effective defence of every row (defence plus armour bonus)."""
+        size = self._size
+        return self.defense[:size] + self.armor_bonus[:size]
+
+    def living(self, team: Optional[int] = None) -> np.ndarray:
+        """
+        Rows still standing.
+
+        Args:
+            team: Only rows of this team (every team if omitted)
+        """
+        size = self._size
+        mask = self.alive[:size]
+        if team is not None:
+            mask = mask & (self.team[:size] == team)
+        return np.flatnonzero(mask)
+
+    def teams_standing(self) -> np.ndarray:
+        """Teams with at least one row still standing."""
+        size = self._size
+        return np.unique(self.team[:size][self.alive[:size]])
+
+    def write_back(self) -> None:
+        """Copy the health of every row back to the character it came from."""
+        for row, character in enumerate(self.sources):
+            if character is not None:
+                character.set_health(int(self.health[row]))
+
+
+class Combatant:
+    """A thin, Character-compatible view over one row of a BattleStore.
+
+    Design Decisions:
+    - Holds nothing but the store and the row, so views are cheap to create
+      and always show the row's current values
+    - Health goes through the same bounds as Character.set_health
+    """
+    __slots__ = ("store", "row")
+
+    def __init__(self, store: BattleStore, row: int):
+        self.store = store
+        self.row = row
+
+    @property
+    def name(self) -> str:
+        return self.store.names[self.row]
+
+    @property
+    def level(self) -> int:
+        return int(self.store.level[self.row])
+
+    @property
+    def team(self) -> int:
+        return int(self.store.team[self.row])
+
+    @property
+    def damage(self) -> int:
+        return int(self.store.damage[self.row])
+
+    @damage.setter
+    def damage(self, value: int) -> None:
+        self.store.damage[self.row] = value
+
+    @property
+    def defense(self) -> int:
+        return int(self.store.defense[self.row])
+
+    @defense.setter
+    def defense(self, value: int) -> None:
+        self.store.defense[self.row] = value
+
+    def is_alive(self) -> bool:
+        """Return True while the row is still in the battle."""
+        return bool(self.store.alive[self.row])
+
+    def get_health(self) -> int:
+        return int(self.store.health[self.row])
+
+    def set_health(self, new_health: int) -> None:
+        self.store.health[self.row] = min(max(new_health, 0), HEALTH_CAP)
+
+    def get_attack_power(self) -> int:
+        return int(self.store.damage[self.row] + self.store.weapon_bonus[self.row])
+
+    def get_effective_defense(self) -> int:
+        return int(self.store.defense[self.row] + self.store.armor_bonus[self.row])
+
+    def damage_against(self, enemy) -> int:
+        """Damage one normal attack would deal to an enemy."""
+        return max(0, self.get_attack_power() - enemy.get_effective_defense())
+
+    def attack(self, enemy) -> int:
+        """Attack an enemy, as Character.attack does."""
+        damage_dealt = self.damage_against(enemy)
+        enemy.set_health(enemy.get_health() - damage_dealt)
+        return damage_dealt
+
+    def take_damage(self, damage: int) -> int:
+        """Take damage reduced by defence, as Character.take_damage does."""
+        actual_damage = max(0, damage - self.get_effective_defense())
+        self.set_health(self.get_health() - actual_damage)
+        return actual_damage
+
+    def status_lines(self, empty_bonus: bool = True) -> List[str]:
+        """Return the lines describing the combatant, like Character.status_lines.
+
+        The bonuses are always shown, so empty_bonus has no effect here.
+        """
+        store, row = self.store, self.row
+        return [
+            f"Name: {self.name}",
+            f"Health: {self.get_health()}",
+            f"Damage: {self.damage}",
+            f"Defense: {self.get_effective_defense()}",
+            "",
+            "Equipment:",
+            f"Weapon bonus: +{store.weapon_bonus[row]} Damage",
+            f"Armor bonus: +{store.armor_bonus[row]} Defense",
+        ]
+
+
+def choose_targets(store: BattleStore, attackers: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Pick a random living opponent for each attacker.
+
+    Args:
+        store: The battle
+        attackers: Rows that attack, all of one team
+        rng: Source of the choices
+
+    Returns:
+        Target row per attacker (empty if there is nobody left to attack)
+    """
+    if not len(attackers):
+        return attackers
+    size = len(store)
+    candidates = np.flatnonzero(store.alive[:size] & (store.team[:size] != store.team[attackers[0]]))
+    if not len(candidates):
+        return candidates
+    return candidates[rng.integers(0, len(candidates), size=len(attackers))]
+
+
+def resolve_attacks(store: BattleStore, attackers: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """Damage each attacker's normal attack deals to its target."""
+    return np.maximum(0, store.attack_power()[attackers] - store.effective_defense()[targets])
+
+
+def resolve_specials(store: BattleStore, attackers: np.ndarray, targets: np.ndarray,
+                     hits: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Apply the attackers' special attacks to their hits.
+
+    Goblins may dodge and deal nothing, Necromancers may summon a skeleton
+    that strikes in their place and then joins their team, and Fire Bosses
+    add fire damage reduced by the target's defence.
+
+    Args:
+        store: The battle
+        attackers: Rows that attack
+        targets: Target row per attacker
+        hits: Normal attack damage per attacker
+        rng: Source of the rolls
+
+    Returns:
+        Damage per attacker after specials
+    """
+    special = store.special[attackers]
+    if not special.any():
+        return hits
+    hits = hits.copy()
+    rolls = rng.random(len(attackers))
+    target_defense = store.defense[targets] + store.armor_bonus[targets]
+
+    hits[(special == SPECIAL_DODGE) & (rolls < GOBLIN_DODGE_CHANCE)] = 0
+
+    summons = (special == SPECIAL_SUMMON) & (rolls < NECROMANCER_SUMMON_CHANCE)
+    if summons.any():
+        for necromancer in attackers[summons]:
+            level = int(store.level[necromancer]) - 1
+            store.add(SKELETON_STATS.name, int(store.team[necromancer]), SKELETON_STATS.health_at(level),
+                      SKELETON_STATS.damage_at(level), weapon_bonus=ROCK.damage_bonus, level=level)
+        skeleton_attack = SKELETON_DAMAGE + ROCK.damage_bonus
+        hits[summons] = np.maximum(0, skeleton_attack - target_defense[summons])
+
+    fire = special == SPECIAL_FIRE
+    if fire.any():
+        burn = rng.integers(FIRE_DAMAGE_MIN, FIRE_DAMAGE_MAX + 1, size=len(attackers))
+        hits[fire] += np.maximum(0, burn[fire] - target_defense[fire])
+    return hits
+
+
+def apply_damage(store: BattleStore, targets: np.ndarray, hits: np.ndarray) -> None:
+    """Take every hit off its target's health, keeping it between zero and the cap."""
+    damage = np.zeros(len(store), dtype=np.int64)
+    np.add.at(damage, targets, hits)
+    # As with set_health, only rows that were hit are brought under the cap
+    hit = np.unique(targets)
+    store.health[hit] = np.clip(store.health[hit] - damage[hit], 0, HEALTH_CAP)
+
+
+def resolve_deaths(store: BattleStore) -> np.ndarray:
+    """
+    Mark rows whose health reached zero as dead.
+
+    Returns:
+        Rows that died since the last call
+    """
+    size = len(store)
+    died = np.flatnonzero(store.alive[:size] & (store.health[:size] <= 0))
+    store.alive[died] = False
+    return died
+
+
+def run_team_turn(store: BattleStore, team: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Let every living row of one team attack.
+
+    Returns:
+        Rows that died during the turn
+    """
+    attackers = store.living(team)
+    targets = choose_targets(store, attackers, rng)
+    if not len(targets):
+        return targets
+    hits = resolve_attacks(store, attackers, targets)
+    hits = resolve_specials(store, attackers, targets, hits, rng)
+    apply_damage(store, targets, hits)
+    return resolve_deaths(store)
+
+
+def run_battle(store: BattleStore, rng: Optional[np.random.Generator] = None,
+               max_rounds: int = 1000) -> Optional[int]:
+    """
+    Fight until only one team is left standing.
+
+    Teams take their turns in ascending order each round, so the player team
+    strikes first, as in a duel; rows killed in a turn do not act later in
+    the round.
+
+    Args:
+        store: The battle
+        rng: NumPy generator supplying the rolls (a fresh one if omitted)
+        max_rounds: Safety cap for battles where nobody can hurt anybody
+
+    Returns:
+        The winning team, or None if no team won within max_rounds
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    resolve_deaths(store)
+    for _ in range(max_rounds):
+        for team in store.teams_standing():
+            if len(store.teams_standing()) < 2:
+                break
+            run_team_turn(store, int(team), rng)
+        standing = store.teams_standing()
+        if len(standing) < 2:
+            return int(standing[0]) if len(standing) else None
+    return None
@@ -0,0 +1,334 @@
+"""Module containing the speed benchmarks for the game's hot paths.
+
+Design Decisions:
+- Each benchmark builds its objects first and returns a runner, so only the
+  operation itself is timed; the loop lives inside the runner to keep call
+  overhead out of the figures
+- The best of several repeats is reported, with garbage collection paused,
+  as timeit does, because the minimum is the least noisy estimate
+- Results are plain JSON, so a saved run can serve as the baseline that
+  later runs are compared against
+
+Usage:
+    python benchmarks.py --save results.json
+    python benchmarks.py --save-baseline
+    python benchmarks.py --compare benchmark_baseline.json --tolerance 0.15
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+from character import Character
+from inventory import Inventory
+from items import HEALING_POTION, FIREBALL_SCROLL, LEATHER_ARMOR, IRON_SWORD, ROCK
+from villain import Villain, Skeleton, SKELETON_STATS
+from entity_pool import EntityPool
+from game import Game
+from player_policies import greedy_policy, headless_campaign
+from constants import DEFAULT_PLAYER_NAME, PLAYER_START_HEALTH, PLAYER_START_DAMAGE
+
+RESULTS_VERSION = 1
+DEFAULT_BASELINE = "benchmark_baseline.json"
+DEFAULT_REPEATS = 5
+DEFAULT_TOLERANCE = 0.10
+
+Runner = Callable[[], None]
+
+
+def _new_player() -> Character:
+    return Character(DEFAULT_PLAYER_NAME, PLAYER_START_HEALTH, PLAYER_START_DAMAGE)
+
+
+def bench_attack(ops: int) -> Runner:
+    """Character.attack against a villain."""
+    player, enemy = _new_player(), Villain("Goblin", 1, 35, 6)
+    attack = player.attack
+
+    def run() -> None:
+        for _ in range(ops):
+            attack(enemy)
+    return run
+
+
+def bench_take_damage(ops: int) -> Runner:
+    """Character.take_damage with armour equipped."""
+    player = _new_player()
+    player.inventory.equip_armor(LEATHER_ARMOR)
+    take_damage = player.take_damage
+
+    def run() -> None:
+        for _ in range(ops):
+            take_damage(12)
+    return run
+
+
+def bench_villain_attack(ops: int) -> Runner:
+    """Villain.attack against an armoured player."""
+    player, enemy = _new_player(), Villain("Goblin", 1, 35, 6)
+    player.inventory.equip_armor(LEATHER_ARMOR)
+    player.set_health(1000)
+    attack = enemy.attack
+
+    def run() -> None:
+        for _ in range(ops):
+            attack(player)
+    return run
+
+
+def bench_effective_defense(ops: int) -> Runner:
+    """Character.get_effective_defense with armour equipped."""
+    player = _new_player()
+    player.inventory.equip_armor(LEATHER_ARMOR)
+    get_effective_defense = player.get_effective_defense
+
+    def run() -> None:
+        for _ in range(ops):
+            get_effective_defense()
+    return run
+
+
+def bench_game_init(ops: int) -> Runner:
+    """Game construction."""
+    def run() -> None:
+        for _ in range(ops):
+            Game()
+    return run
+
+
+def bench_character_init(ops: int) -> Runner:
+    """Character construction, including its default items."""
+    def run() -> None:
+        for _ in range(ops):
+            Character(DEFAULT_PLAYER_NAME, PLAYER_START_HEALTH, PLAYER_START_DAMAGE)
+    return run
+
+
+def bench_inventory_add_item(ops: int) -> Runner:
+    """Filling a fresh inventory with four items."""
+    def run() -> None:
+        for _ in range(ops):
+            inventory = Inventory()
+            add_item = inventory.add_item
+            add_item(HEALING_POTION)
+            add_item(FIREBALL_SCROLL)
+            add_item(LEATHER_ARMOR)
+            add_item(ROCK)
+    return run
+
+
+def bench_use_consumable(ops: int) -> Runner:
+    """Inventory.use_consumable on a stack of potions."""
+    player = _new_player()
+    inventory = player.inventory
+    for _ in range(ops):
+        inventory.add_item(HEALING_POTION)
+    use_consumable = inventory.use_consumable
+
+    def run() -> None:
+        for _ in range(ops):
+            use_consumable(HEALING_POTION.name, player)
+    return run
+
+
+def bench_equip_weapon(ops: int) -> Runner:
+    """Inventory.equip_weapon, switching between two weapons."""
+    inventory = _new_player().inventory
+    inventory.add_item(IRON_SWORD)
+    equip_weapon = inventory.equip_weapon
+
+    def run() -> None:
+        for _ in range(ops // 2):
+            equip_weapon(IRON_SWORD)
+            equip_weapon(ROCK)
+    return run
+
+
+def bench_skeleton_spawn(ops: int) -> Runner:
+    """Building a summoned skeleton from scratch."""
+    def run() -> None:
+        for _ in range(ops):
+            Skeleton(1, SKELETON_STATS)
+    return run
+
+
+def bench_pooled_skeleton_spawn(ops: int) -> Runner:
+    """Acquiring and releasing a skeleton through an EntityPool."""
+    pool = EntityPool()
+    acquire, release = pool.acquire, pool.release
+
+    def run() -> None:
+        for _ in range(ops):
+            release(acquire(Skeleton, 1, SKELETON_STATS))
+    return run
+
+
+def bench_headless_campaign(ops: int) -> Runner:
+    """A whole headless game with the greedy policy."""
+    def run() -> None:
+        for seed in range(ops):
+            headless_campaign(greedy_policy, seed)
+    return run
+
+
+# Name -> (runner factory, operations per repeat)
+BENCHMARKS: Dict[str, tuple] = {
+    "character_attack": (bench_attack, 200000),
+    "character_take_damage": (bench_take_damage, 200000),
+    "villain_attack": (bench_villain_attack, 200000),
+    "character_effective_defense": (bench_effective_defense, 500000),
+    "game_init": (bench_game_init, 20000),
+    "character_init": (bench_character_init, 20000),
+    "inventory_add_item": (bench_inventory_add_item, 50000),
+    "inventory_use_consumable": (bench_use_consumable, 100000),
+    "inventory_equip_weapon": (bench_equip_weapon, 200000),
+    "skeleton_spawn": (bench_skeleton_spawn, 20000),
+    "pooled_skeleton_spawn": (bench_pooled_skeleton_spawn, 20000),
+    "headless_campaign": (bench_headless_campaign, 200),
+}
+
+
+def time_benchmark(factory: Callable[[int], Runner], ops: int, repeats: int = DEFAULT_REPEATS) -> float:
+    """
+    Time one benchmark.
+
+    Args:
+        factory: Builds a runner for a number of operations
+        ops: Operations per repeat
+        repeats: Times to run; the fastest counts
+
+    Returns:
+        Nanoseconds per operation
+    """
+    best = None
+    gc_was_enabled = gc.isenabled()
+    for _ in range(repeats):
+        run = factory(ops)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter_ns()
+            run()
+            elapsed = time.perf_counter_ns() - start
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+    return best / ops
+
+
+def run_benchmarks(names: Optional[List[str]] = None, scale: float = 1.0,
+                   repeats: int = DEFAULT_REPEATS) -> dict:
+    """
+    Run benchmarks and collect their results.
+
+    Args:
+        names: Benchmarks to run (all of them if omitted)
+        scale: Multiplier on each benchmark's operation count
+        repeats: Repeats per benchmark
+
+    Returns:
+        Results document ready to be saved as JSON
+    """
+    results = {}
+    for name in names or BENCHMARKS:
+        factory, ops = BENCHMARKS[name]
+        ops = max(2, int(ops * scale))
+        ns_per_op = time_benchmark(factory, ops, repeats)
+        results[name] = {"ns_per_op": ns_per_op, "ops_per_second": 1e9 / ns_per_op, "ops": ops}
+    return {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+
+def save_results(results: dict, path: str) -> None:
+    """Write results as JSON."""
+    with open(path, "w") as results_file:
+        json.dump(results, results_file, indent=2)
+
+
+def load_results(path: str) -> dict:
+    """Read results written by save_results()."""
+    with open(path) as results_file:
+        results = json.load(results_file)
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Unsupported benchmark results version: {results.get('version')}")
+    return results
+
+
+def compare_results(current: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> Dict[str, dict]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        current: Results of this run
+        baseline: Stored baseline results
+        tolerance: Allowed slowdown as a fraction (0.10 is 10% slower)
+
+    Returns:
+        Dict mapping benchmark name to {"ratio": current / baseline, "regressed": bool}
+        for every benchmark present in both
+    """
+    comparison = {}
+    for name, result in current["results"].items():
+        reference = baseline["results"].get(name)
+        if not reference:
+            continue
+        ratio = result["ns_per_op"] / reference["ns_per_op"]
+        comparison[name] = {"ratio": ratio, "regressed": ratio > 1 + tolerance}
+    return comparison
+
+
+def print_results(results: dict, comparison: Optional[Dict[str, dict]] = None) -> None:
+    """Print results, with the baseline comparison if there is one."""
+    for name, result in results["results"].items():
+        line = f"{name:28} {result['ns_per_op']:>14,.0f} ns/op {result['ops_per_second']:>14,.0f} ops/s"
+        if comparison and name in comparison:
+            entry = comparison[name]
+            line += f"  {entry['ratio']:.2f}x baseline"
+            if entry["regressed"]:
+                line += "  REGRESSION"
+        print(line)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point for the benchmark suite.
+
+    Returns:
+        Exit status: 1 if any benchmark regressed against the baseline, else 0
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths.")
+    parser.add_argument("names", nargs="*", help=f"benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument("--save", default=None, help="write results to this JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help=f"write results to {DEFAULT_BASELINE}")
+    parser.add_argument("--compare", default=None, help="baseline JSON file to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed slowdown before failing")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier on operation counts")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="repeats per benchmark")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results = run_benchmarks(args.names or None, args.scale, args.repeats)
+    comparison = None
+    if args.compare:
+        comparison = compare_results(results, load_results(args.compare), args.tolerance)
+    print_results(results, comparison)
+    if args.save:
+        save_results(results, args.save)
+    if args.save_baseline:
+        save_results(results, DEFAULT_BASELINE)
+    return 1 if comparison and any(entry["regressed"] for entry in comparison.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
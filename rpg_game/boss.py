@@ -7,10 +7,16 @@ Design Decisions:
 """
 
 from character import Character
-from weapon import Weapon
+from items import BOSS_WEAPON
+from content import EnemyStats, enemy_stats
 from typing import Optional
 import random
 
+# Special attack tuning
+FIRE_DAMAGE_MIN = 5
+FIRE_DAMAGE_MAX = 10
+ICE_FREEZE_CHANCE = 0.3
+
 class Boss(Character):
     """Base class for boss enemies.
     
@@ -32,9 +38,21 @@ class Boss(Character):
         self.level = level
         
         # Add and equip boss weapon
-        boss_weapon = Weapon("Boss Weapon", "A powerful weapon", 5)
-        self.inventory.add_item(boss_weapon)
-        self.inventory.equip_weapon(boss_weapon)
+        self.inventory.add_item(BOSS_WEAPON)
+        self.inventory.equip_weapon(BOSS_WEAPON)
+
+    def respawn(self, level: int, stats: EnemyStats) -> None:
+        """
+        Turn this boss back into a fresh one, as its constructor would.
+        
+        Args:
+            level: Level to spawn it at
+            stats: Compiled stats of its boss type
+        """
+        self.reset(stats.name, stats.health_at(level), stats.damage_at(level))
+        self.level = level
+        self.inventory.add_item(BOSS_WEAPON)
+        self.inventory.equip_weapon(BOSS_WEAPON)
 
     def special_ability(self) -> None:
         """Base special ability method.
@@ -53,8 +71,9 @@ class FireBoss(Boss):
     - Area-of-effect damage creates strategic positioning
     - Higher damage output for boss status
     """
-    def __init__(self, level: int):
-        super().__init__("Fire Boss", level, 80 + (10 * level), 12 + level)
+    def __init__(self, level: int, stats: Optional[EnemyStats] = None):
+        stats = stats or enemy_stats("FireBoss")
+        super().__init__(stats.name, level, stats.health_at(level), stats.damage_at(level))
 
     def fire_attack(self, enemy) -> int:
         """
@@ -66,8 +85,8 @@ class FireBoss(Boss):
         - Clear feedback about fire damage
         """
         base_damage = self.attack(enemy)
-        fire_damage = random.randint(5, 10)
-        print(f"{self.name} burns you with fire! Extra {fire_damage} damage!")
+        fire_damage = self.rng.randint(FIRE_DAMAGE_MIN, FIRE_DAMAGE_MAX)
+        self.narrate(f"{self.name} burns you with fire! Extra {fire_damage} damage!")
         enemy.take_damage(fire_damage)
         return base_damage + fire_damage
 
@@ -78,7 +97,7 @@ class FireBoss(Boss):
         - Signature ability for boss identification
         - Creates dramatic combat moments
         """
-        print(f"{self.name} unleashes a Firestorm!")
+        self.narrate(f"{self.name} unleashes a Firestorm!")
 
 class IceBoss(Boss):
     """A boss that uses ice-based attacks.
@@ -88,8 +107,9 @@ class IceBoss(Boss):
     - Status effects create gameplay variety
     - Balanced stats for challenging combat
     """
-    def __init__(self, level: int):
-        super().__init__("Ice Boss", level, 90 + (10 * level), 10 + level)
+    def __init__(self, level: int, stats: Optional[EnemyStats] = None):
+        stats = stats or enemy_stats("IceBoss")
+        super().__init__(stats.name, level, stats.health_at(level), stats.damage_at(level))
 
     def ice_attack(self, enemy) -> int:
         """
@@ -100,9 +120,9 @@ class IceBoss(Boss):
         - Probability-based effect maintains balance
         - Clear feedback about status changes
         """
-        base_damage = self.attack(enemy)
-        if random.random() < 0.3:  # 30% chance to freeze
-            print(f"{self.name} freezes you! Your attacks are slowed!")
+        base_damage = super().attack(enemy)
+        if self.rng.random() < ICE_FREEZE_CHANCE:
+            self.narrate(f"{self.name} freezes you! Your attacks are slowed!")
         return base_damage
 
     def special_ability(self) -> None:
@@ -112,7 +132,7 @@ class IceBoss(Boss):
         - Signature ability for boss identification
         - Creates dramatic combat moments
         """
-        print(f"{self.name} summons a Blizzard!")
+        self.narrate(f"{self.name} summons a Blizzard!")
 
     def attack(self, enemy) -> int:
         """
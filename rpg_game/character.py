@@ -7,10 +7,10 @@ Design Decisions:
 - Equipment system allows for stat customization
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import random
-from inventory import Inventory
-from items import HEALING_POTION, FIREBALL_SCROLL, LEATHER_ARMOR
+from inventory import Inventory, Armor
+from items import HEALING_POTION, FIREBALL_SCROLL, LEATHER_ARMOR, ROCK
 from weapon import Weapon
 from constants import (
     MAX_HEALTH, MIN_HEALTH,
@@ -26,7 +26,13 @@ class Character:
     - Encapsulates core gameplay mechanics (attack, defense, health)
     - Provides foundation for enemy and player subclasses
     - Manages equipment and inventory through composition
+    - Flavour text goes through narrate so headless runs can silence it
+    - Random rolls go through rng so simulations can supply their own stream
     """
+    # Class-level defaults keep instances small; sessions may override per object
+    narrate = staticmethod(print)
+    rng = random
+
     def __init__(self, name: str, health: int, damage: int):
         """
         Initialize a character with basic attributes.
@@ -35,6 +41,7 @@ class Character:
         - Default weapon ensures all characters can attack
         - Inventory initialized for item management
         - Default items provide basic gameplay tools
+        - Items are shared catalog templates, so nothing is copied per character
         """
         self.name = name
         self._health = health
@@ -44,9 +51,8 @@ class Character:
         self._initialize_default_items()
         
         # Default weapon ensures all characters can attack
-        default_weapon = Weapon("Rock", "A simple rock", 2)
-        self.inventory.add_item(default_weapon)
-        self.inventory.equip_weapon(default_weapon)
+        self.inventory.add_item(ROCK)
+        self.inventory.equip_weapon(ROCK)
 
     def _initialize_default_items(self) -> None:
         """Initialize default items for new characters.
@@ -63,6 +69,25 @@ class Character:
         # Default armor
         self.inventory.add_item(LEATHER_ARMOR)
 
+    def reset(self, name: str, health: int, damage: int) -> None:
+        """Return the character to the state __init__ leaves it in.
+        
+        Design Decisions:
+        - The inventory and its containers are reused, so a reset allocates
+          nothing beyond what refilling the default items needs
+        - Per-object narrate and rng overrides are dropped with the rest
+        """
+        self.__dict__.pop("narrate", None)
+        self.__dict__.pop("rng", None)
+        self.name = name
+        self._health = health
+        self.damage = damage
+        self.defense = 0
+        self.inventory.clear()
+        self._initialize_default_items()
+        self.inventory.add_item(ROCK)
+        self.inventory.equip_weapon(ROCK)
+
     def get_health(self) -> int:
         """Get the current health of the character.
         
@@ -86,14 +111,24 @@ class Character:
         else:
             self._health = new_health
 
+    def get_attack_power(self) -> int:
+        """Get the character's damage including the equipped weapon."""
+        return self.damage + self.inventory.weapon_bonus
+
     def get_effective_defense(self) -> int:
         """Get the character's total defense including armor.
         
         Design Decisions:
         - Defense calculation includes equipped armor
         - Provides stat stacking for equipment
+        - The armour bonus is kept up to date by the inventory when armour
+          is equipped, so this is two attribute reads
         """
-        return self.defense + (self.inventory.equipped_armor.defense_bonus if self.inventory.equipped_armor else 0)
+        return self.defense + self.inventory.armor_bonus
+
+    def damage_against(self, enemy) -> int:
+        """Damage one normal attack would deal to an enemy."""
+        return max(0, self.damage + self.inventory.weapon_bonus - enemy.get_effective_defense())
 
     def attack(self, enemy) -> int:
         """Attack an enemy character.
@@ -102,11 +137,8 @@ class Character:
         - Damage calculation includes equipped weapon
         - Defense system prevents one-hit kills
         """
-        total_damage = self.damage + (self.inventory.equipped_weapon.damage_bonus if self.inventory.equipped_weapon else 0)
-        current_health = enemy.get_health()
-        effective_defense = enemy.get_effective_defense()
-        damage_dealt = max(0, total_damage - effective_defense)
-        enemy.set_health(current_health - damage_dealt)
+        damage_dealt = max(0, self.damage + self.inventory.weapon_bonus - enemy.get_effective_defense())
+        enemy.set_health(enemy.get_health() - damage_dealt)
         return damage_dealt
 
     def take_damage(self, damage: int) -> int:
@@ -130,22 +162,61 @@ class Character:
         """
         return self.inventory.use_consumable(item_name, self)
 
+    def equip_item(self, item_name: str) -> str:
+        """Equip a weapon or armour from inventory.
+        
+        Design Decisions:
+        - Item type decides which equipment slot is used
+        - Mirrors use_item by returning feedback instead of printing
+        """
+        item = self.inventory.items.get(item_name)
+        if isinstance(item, Weapon) and self.inventory.equip_weapon(item):
+            return f"Equipped {item.name}"
+        if isinstance(item, Armor) and self.inventory.equip_armor(item):
+            return f"Equipped {item.name}"
+        return "Item not found or not equippable"
+
+    def status_lines(self, empty_bonus: bool = True) -> List[str]:
+        """
+        Return the lines shown by display(), for callers that batch output.
+
+        Args:
+            empty_bonus: Show "(+0 ...)" after an empty equipment slot, as
+                display() does; the combat screen leaves it out
+
+        Returns:
+            List[str]: Lines without line endings
+        """
+        weapon = self.inventory.equipped_weapon
+        armor = self.inventory.equipped_armor
+        if weapon:
+            weapon_line = f"Weapon: {weapon.name} (+{weapon.damage_bonus} Damage)"
+        else:
+            weapon_line = "Weapon: None (+0 Damage)" if empty_bonus else "Weapon: None"
+        if armor:
+            armor_line = f"Armor: {armor.name} (+{armor.defense_bonus} Defense)"
+        else:
+            armor_line = "Armor: None (+0 Defense)" if empty_bonus else "Armor: None"
+        return [
+            f"Name: {self.name}",
+            f"Health: {self.get_health()}",
+            f"Damage: {self.damage}",
+            f"Defense: {self.get_effective_defense()}",
+            "",
+            "Equipment:",
+            weapon_line,
+            armor_line,
+        ]
+
     def display(self) -> None:
         """Display character stats and equipment.
         
         Design Decisions:
         - Shows both base and equipped stats
         - Provides clear equipment status
+        - Printed in one call rather than line by line
         """
-        print(f"\nName: {self.name}")
-        print(f"Health: {self.get_health()}")
-        print(f"Damage: {self.damage}")
-        print(f"Defense: {self.get_effective_defense()}")
-        print("\nEquipment:")
-        weapon = self.inventory.equipped_weapon
-        armor = self.inventory.equipped_armor
-        print(f"Weapon: {weapon.name if weapon else 'None'} (+{weapon.damage_bonus if weapon else 0} Damage)")
-        print(f"Armor: {armor.name if armor else 'None'} (+{armor.defense_bonus if armor else 0} Defense)")
+        print("\n" + "\n".join(self.status_lines()))
 
     def display_inventory(self) -> None:
         """Display the character's inventory."""
@@ -0,0 +1,247 @@
+"""Module containing the headless combat engine.
+
+Design Decisions:
+- Combat rules live here without any print or input calls, so fights can be
+  simulated as fast as the damage maths allows
+- A policy chooses the player's action each round, so the same engine serves
+  the interactive game, bots and batch simulations
+- An optional observer receives round events, which is how the console game
+  narrates the fight on top of the engine
+- The fight loop is a generator that pauses whenever the player must act,
+  so run() and hosts that wait for input asynchronously drive the same loop
+"""
+
+from enum import Enum
+from typing import Callable, Generator, Optional, Tuple
+from character import Character
+
+
+class CombatAction(Enum):
+    """Actions the player can take on their turn."""
+    ATTACK = "attack"
+    USE_ITEM = "use item"
+    EQUIP = "equip"
+
+
+# A policy receives (player, enemy) and returns (action, item_name).
+# item_name is only read for USE_ITEM and EQUIP.
+PlayerPolicy = Callable[[Character, Character], Tuple[CombatAction, Optional[str]]]
+
+# An enemy policy receives (enemy, player), acts for the enemy and returns
+# the damage it dealt to the player.
+EnemyPolicy = Callable[[Character, Character], int]
+
+# Yields when the player must act, receives (action, item_name), returns the result
+FightSteps = Generator[None, Tuple["CombatAction", Optional[str]], "CombatResult"]
+
+
+def always_attack(player: Character, enemy: Character) -> Tuple[CombatAction, Optional[str]]:
+    """Policy that attacks every round, matching the non-interactive fallback."""
+    return CombatAction.ATTACK, None
+
+
+class CombatObserver:
+    """Receives combat events from the engine.
+
+    Design Decisions:
+    - Every hook is a no-op so observers only override what they need
+    - The engine never depends on what an observer does with an event
+    """
+    def on_round_start(self, player: Character, enemy: Character, round_number: int) -> None:
+        """Called before the player chooses an action."""
+
+    def on_player_action(self, player: Character, enemy: Character,
+                         action: CombatAction, damage: int, message: str) -> None:
+        """Called after the player's action has been resolved."""
+
+    def on_enemy_turn(self, player: Character, enemy: Character) -> None:
+        """Called before the enemy attacks."""
+
+    def on_enemy_attack(self, player: Character, enemy: Character, damage: int) -> None:
+        """Called after the enemy's attack has been resolved."""
+
+    def on_combat_end(self, player: Character, enemy: Character, player_won: bool) -> None:
+        """Called once the fight is decided."""
+
+
+class ObserverGroup(CombatObserver):
+    """Forwards every event to several observers in order."""
+    def __init__(self, *observers: CombatObserver):
+        self.observers = observers
+
+    def on_round_start(self, player: Character, enemy: Character, round_number: int) -> None:
+        for observer in self.observers:
+            observer.on_round_start(player, enemy, round_number)
+
+    def on_player_action(self, player: Character, enemy: Character,
+                         action: CombatAction, damage: int, message: str) -> None:
+        for observer in self.observers:
+            observer.on_player_action(player, enemy, action, damage, message)
+
+    def on_enemy_turn(self, player: Character, enemy: Character) -> None:
+        for observer in self.observers:
+            observer.on_enemy_turn(player, enemy)
+
+    def on_enemy_attack(self, player: Character, enemy: Character, damage: int) -> None:
+        for observer in self.observers:
+            observer.on_enemy_attack(player, enemy, damage)
+
+    def on_combat_end(self, player: Character, enemy: Character, player_won: bool) -> None:
+        for observer in self.observers:
+            observer.on_combat_end(player, enemy, player_won)
+
+
+class CombatResult:
+    """Structured outcome of a single fight."""
+    def __init__(self, player_won: bool, rounds: int, damage_dealt: int,
+                 damage_taken: int, player_health: int, enemy_health: int):
+        """
+        Store the outcome of a fight.
+
+        Args:
+            player_won: True if the enemy was defeated
+            rounds: Number of rounds played
+            damage_dealt: Total damage the player dealt
+            damage_taken: Total damage the enemy dealt
+            player_health: Player health when the fight ended
+            enemy_health: Enemy health when the fight ended
+        """
+        self.player_won = player_won
+        self.rounds = rounds
+        self.damage_dealt = damage_dealt
+        self.damage_taken = damage_taken
+        self.player_health = player_health
+        self.enemy_health = enemy_health
+
+    def __repr__(self) -> str:
+        return (f"CombatResult(player_won={self.player_won}, rounds={self.rounds}, "
+                f"player_health={self.player_health}, enemy_health={self.enemy_health})")
+
+
+class CombatEngine:
+    """Resolves fights between a player and a single enemy.
+
+    Design Decisions:
+    - Round resolution is split into player and enemy steps so hosts that
+      gather input asynchronously can drive the fight one step at a time
+    - run() is the simple loop used by the console game and simulations
+    """
+    def __init__(self, policy: PlayerPolicy = always_attack,
+                 observer: Optional[CombatObserver] = None,
+                 enemy_policy: Optional[EnemyPolicy] = None):
+        """
+        Initialise the engine.
+
+        Args:
+            policy: Chooses the player's action each round
+            observer: Optional receiver for combat events
+            enemy_policy: Acts for the enemy each round (a plain attack if omitted)
+        """
+        self.policy = policy
+        self.observer = observer
+        self.enemy_policy = enemy_policy
+
+    def resolve_player_action(self, player: Character, enemy: Character,
+                              action: CombatAction, item_name: Optional[str] = None) -> Tuple[int, str]:
+        """
+        Apply the player's chosen action.
+
+        Args:
+            player: The player character
+            enemy: The enemy character
+            action: The chosen action
+            item_name: Item to use or equip, if the action needs one
+
+        Returns:
+            Tuple of (damage dealt to the enemy, message describing the result)
+        """
+        if action is CombatAction.ATTACK:
+            damage = player.attack(enemy)
+            return damage, f"You dealt {damage} damage to {enemy.name}"
+        if action is CombatAction.USE_ITEM:
+            return 0, player.use_item(item_name or "")
+        if action is CombatAction.EQUIP:
+            return 0, player.equip_item(item_name or "")
+        return 0, ""
+
+    def resolve_enemy_turn(self, player: Character, enemy: Character) -> int:
+        """
+        Let the enemy attack the player.
+
+        Returns:
+            Damage dealt to the player
+        """
+        if self.observer:
+            self.observer.on_enemy_turn(player, enemy)
+        if self.enemy_policy:
+            damage = self.enemy_policy(enemy, player)
+        else:
+            damage = enemy.attack(player)
+        if self.observer:
+            self.observer.on_enemy_attack(player, enemy, damage)
+        return damage
+
+    def fight(self, player: Character, enemy: Character,
+              max_rounds: Optional[int] = None) -> FightSteps:
+        """
+        Step through a fight, pausing each time the player must choose.
+
+        Prime the generator with next(), then send() the player's
+        (action, item_name) at each pause; the CombatResult is the
+        generator's return value, carried by StopIteration.
+
+        Args:
+            player: The player character
+            enemy: The enemy character
+            max_rounds: Optional cap on rounds; the player loses if it is reached
+        """
+        observer = self.observer
+        rounds = 0
+        damage_dealt = 0
+        damage_taken = 0
+        player_won = False
+        while player.get_health() > 0 and enemy.get_health() > 0:
+            if max_rounds is not None and rounds >= max_rounds:
+                break
+            rounds += 1
+            if observer:
+                observer.on_round_start(player, enemy, rounds)
+
+            action, item_name = yield
+            damage, message = self.resolve_player_action(player, enemy, action, item_name)
+            damage_dealt += damage
+            if observer:
+                observer.on_player_action(player, enemy, action, damage, message)
+
+            if enemy.get_health() <= 0:
+                player_won = True
+                break
+
+            damage_taken += self.resolve_enemy_turn(player, enemy)
+
+        if observer and (player_won or player.get_health() <= 0):
+            observer.on_combat_end(player, enemy, player_won)
+        return CombatResult(player_won, rounds, damage_dealt, damage_taken,
+                            player.get_health(), enemy.get_health())
+
+    def run(self, player: Character, enemy: Character,
+            max_rounds: Optional[int] = None) -> CombatResult:
+        """
+        Fight until one side is defeated, asking the policy for every action.
+
+        Args:
+            player: The player character
+            enemy: The enemy character
+            max_rounds: Optional cap on rounds; the player loses if it is reached
+
+        Returns:
+            CombatResult describing the fight
+        """
+        policy = self.policy
+        steps = self.fight(player, enemy, max_rounds)
+        try:
+            next(steps)
+            while True:
+                steps.send(policy(player, enemy))
+        except StopIteration as finished:
+            return finished.value
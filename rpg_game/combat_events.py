@@ -0,0 +1,267 @@
+"""Module for the binary combat event log.
+
+Design Decisions:
+- Every event is a fixed-size 20-byte little-endian record, so the file is a
+  plain array that can be appended to and scanned without any parsing state
+- Names are stored as small integer codes rather than text, which keeps each
+  record a fraction of the size of a log line
+- The reader maps the file into memory and unpacks it in chunks, so files far
+  larger than RAM can be scanned with a flat memory footprint
+- A record left half-written by an interrupted writer is cut off when the log
+  is reopened, so later records stay aligned
+- Version 1 logs (one-byte level) can still be read but not appended to
+
+File layout:
+    header: magic b"RPGE", format version (uint16), record size (uint16)
+    records: combat_id (uint32), round (uint16), attacker (uint8),
+             defender (uint8), action (uint8), 1 padding byte, level (uint32),
+             damage (uint16), defender_hp (uint16), 2 padding bytes
+    Version 1 records were 16 bytes with a uint8 level and no padding before it
+
+Usage:
+    python combat_events.py events.bin
+"""
+
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, Iterator, Optional, Tuple
+from character import Character
+from combat_engine import CombatAction, CombatObserver
+
+MAGIC = b"RPGE"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sHH")
+RECORD = struct.Struct("<IHBBBxIHHxx")
+# Record layout of each readable format version
+RECORDS = {1: struct.Struct("<IHBBBBHHxx"), FORMAT_VERSION: RECORD}
+
+EVENT_FIELDS = ("combat_id", "round", "attacker", "defender", "action", "level", "damage", "defender_hp")
+
+# Entity codes by class name; anything unknown is stored as 0
+ENTITY_CODES: Dict[str, int] = {
+    "Character": 1,
+    "Villain": 2,
+    "Goblin": 3,
+    "Orc": 4,
+    "Necromancer": 5,
+    "Boss": 6,
+    "FireBoss": 7,
+    "IceBoss": 8,
+    "Skeleton": 9,
+}
+ENTITY_NAMES = {code: name for name, code in ENTITY_CODES.items()}
+
+ACTION_CODES: Dict[CombatAction, int] = {
+    CombatAction.ATTACK: 1,
+    CombatAction.USE_ITEM: 2,
+    CombatAction.EQUIP: 3,
+}
+ENEMY_ATTACK = 4
+ACTION_NAMES = {code: action.value for action, code in ACTION_CODES.items()}
+ACTION_NAMES[ENEMY_ATTACK] = "enemy attack"
+
+Event = Tuple[int, int, int, int, int, int, int, int]
+
+
+def entity_code(character: Character) -> int:
+    """Return the entity code stored for a character."""
+    return ENTITY_CODES.get(type(character).__name__, 0)
+
+
+class CombatEventWriter:
+    """Appends fixed-size combat events to a binary file.
+
+    Design Decisions:
+    - Records are packed into a preallocated buffer and written when it fills,
+      so most events cost one struct.pack_into and no system call
+    - Opening an existing log continues it, after checking its header
+    """
+    def __init__(self, path: str, buffer_records: int = 4096):
+        """
+        Open (or create) an event log for appending.
+
+        Args:
+            path: File to append to
+            buffer_records: Events held in memory between writes
+        """
+        self.path = path
+        self._buffer = bytearray(RECORD.size * buffer_records)
+        self._offset = 0
+        self._next_combat_id = 1
+        existing = os.path.exists(path) and os.path.getsize(path) > 0
+        if existing:
+            if self._check_header(path) is not RECORD:
+                raise ValueError(f"{path} is an older combat event log; start a new file to append to")
+            self._drop_partial_record(path)
+            self._next_combat_id = self._last_combat_id(path) + 1
+        self._file = open(path, "ab")
+        if not existing:
+            self._file.write(HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size))
+
+    @staticmethod
+    def _check_header(path: str) -> struct.Struct:
+        """
+        Check that a file is a readable event log.
+
+        Returns:
+            The record layout of the log's format version
+
+        Raises:
+            ValueError: If the file is not an event log of a readable version
+        """
+        with open(path, "rb") as log_file:
+            header = log_file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"{path} is too short to be a combat event log")
+        magic, version, record_size = HEADER.unpack(header)
+        record = RECORDS.get(version)
+        if magic != MAGIC or record is None or record_size != record.size:
+            raise ValueError(f"{path} is not a readable combat event log")
+        return record
+
+    @staticmethod
+    def _drop_partial_record(path: str) -> None:
+        """Cut off a trailing record an interrupted writer left incomplete."""
+        size = os.path.getsize(path)
+        partial = (size - HEADER.size) % RECORD.size
+        if partial:
+            os.truncate(path, size - partial)
+
+    @staticmethod
+    def _last_combat_id(path: str) -> int:
+        """Read the combat id of the final record, or 0 if there is none."""
+        size = os.path.getsize(path)
+        if size < HEADER.size + RECORD.size:
+            return 0
+        with open(path, "rb") as log_file:
+            log_file.seek(size - (size - HEADER.size) % RECORD.size - RECORD.size)
+            return RECORD.unpack(log_file.read(RECORD.size))[0]
+
+    def start_combat(self) -> int:
+        """Allocate an id for a new combat."""
+        combat_id = self._next_combat_id
+        self._next_combat_id += 1
+        return combat_id
+
+    def write_event(self, combat_id: int, round_number: int, attacker: int, defender: int,
+                    action: int, level: int, damage: int, defender_hp: int) -> None:
+        """Append one event; values are clamped to their field ranges."""
+        RECORD.pack_into(self._buffer, self._offset, combat_id, min(round_number, 0xFFFF),
+                         attacker, defender, action, min(level, 0xFFFFFFFF),
+                         min(max(damage, 0), 0xFFFF), min(max(defender_hp, 0), 0xFFFF))
+        self._offset += RECORD.size
+        if self._offset == len(self._buffer):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered events to the file."""
+        if self._offset:
+            self._file.write(memoryview(self._buffer)[:self._offset])
+            self._offset = 0
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "CombatEventWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class EventLogObserver(CombatObserver):
+    """Records each turn of a combat engine fight into an event log."""
+    def __init__(self, writer: CombatEventWriter, level: int = 0):
+        """
+        Args:
+            writer: Event log to append to
+            level: Level the fight takes place on
+        """
+        self.writer = writer
+        self.level = level
+        self.combat_id = 0
+        self.round_number = 0
+
+    def on_round_start(self, player: Character, enemy: Character, round_number: int) -> None:
+        if round_number == 1:
+            self.combat_id = self.writer.start_combat()
+        self.round_number = round_number
+
+    def on_player_action(self, player: Character, enemy: Character,
+                         action: CombatAction, damage: int, message: str) -> None:
+        self.writer.write_event(self.combat_id, self.round_number, entity_code(player), entity_code(enemy),
+                                ACTION_CODES[action], self.level, damage, enemy.get_health())
+
+    def on_enemy_attack(self, player: Character, enemy: Character, damage: int) -> None:
+        self.writer.write_event(self.combat_id, self.round_number, entity_code(enemy), entity_code(player),
+                                ENEMY_ATTACK, self.level, damage, player.get_health())
+
+
+def iter_events(path: str, chunk_records: int = 65536) -> Iterator[Event]:
+    """
+    Stream every event in a log without loading the file into memory.
+
+    Args:
+        path: Event log to read
+        chunk_records: Records unpacked per chunk
+
+    Yields:
+        Event tuples in EVENT_FIELDS order
+    """
+    record = CombatEventWriter._check_header(path)
+    size = os.path.getsize(path)
+    # Ignore a partly written trailing record from an interrupted writer
+    end = size - (size - HEADER.size) % record.size
+    if end <= HEADER.size:
+        return
+    chunk_bytes = record.size * chunk_records
+    with open(path, "rb") as log_file, mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped)
+        try:
+            for start in range(HEADER.size, end, chunk_bytes):
+                yield from record.iter_unpack(view[start:min(start + chunk_bytes, end)])
+        finally:
+            view.release()
+
+
+def count_events(path: str) -> int:
+    """Return the number of complete events in a log."""
+    record = CombatEventWriter._check_header(path)
+    return max(0, (os.path.getsize(path) - HEADER.size) // record.size)
+
+
+def summarise(path: str) -> Dict[str, Dict[str, int]]:
+    """
+    Total event counts and damage per action.
+
+    Returns:
+        Dict mapping action name to {"events": n, "damage": total}
+    """
+    totals: Dict[int, list] = {}
+    for event in iter_events(path):
+        entry = totals.setdefault(event[4], [0, 0])
+        entry[0] += 1
+        entry[1] += event[6]
+    return {ACTION_NAMES.get(code, str(code)): {"events": events, "damage": damage}
+            for code, (events, damage) in sorted(totals.items())}
+
+
+def main(argv: Optional[list] = None) -> None:
+    """Print a summary of an event log."""
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) != 1:
+        print("Usage: python combat_events.py EVENT_LOG")
+        return
+    print(f"Events: {count_events(args[0])}")
+    for action, totals in summarise(args[0]).items():
+        print(f"  {action}: {totals['events']} events, {totals['damage']} damage")
+
+
+if __name__ == "__main__":
+    main()
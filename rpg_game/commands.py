@@ -0,0 +1,216 @@
+"""Module containing precompiled command tables for player input.
+
+Design Decisions:
+- Each prompt has a CommandTable built once at import time; every name,
+  alias and unambiguous prefix is a key in one dict, so reading a command
+  is a strip, a lower and a single lookup
+- Tables return typed values (CombatAction, EquipSlot, weapons) rather than
+  menu indices, so callers dispatch on the value itself
+- The same table serves the blocking console loop, the async session loop
+  and one-shot parsing for hosts that receive input as events, so no host
+  needs a thread parked in a retry loop
+- Dialogues are generators that yield each prompt and are sent the reply
+  (or have EOFError thrown in when input ends), so the retry rules are
+  written once and every host only supplies how a line is read
+"""
+
+from enum import Enum
+from typing import Awaitable, Callable, Dict, Generator, Generic, List, Optional, Sequence, Tuple, TypeVar
+from combat_engine import CombatAction
+from items import WEAPONS
+
+T = TypeVar("T")
+
+# A dialogue with the player: yields prompts, is sent replies, returns its result
+Steps = Generator[str, str, T]
+
+
+class EquipSlot(Enum):
+    """Equipment slots the player can choose from."""
+    WEAPON = "weapon"
+    ARMOR = "armor"
+
+
+class CommandTable(Generic[T]):
+    """Lookup from typed player input to a command value.
+
+    Design Decisions:
+    - Prefixes shared by two commands are left out, so a prefix only
+      matches when it is unambiguous; full names and aliases always win
+    - The first command is the default used when input runs out
+    """
+    def __init__(self, commands: Sequence[Tuple[T, Sequence[str]]], prefixes: bool = True):
+        """
+        Args:
+            commands: (value, names) pairs in menu order; the first name is the one shown
+            prefixes: Also accept unambiguous prefixes of each name
+
+        Raises:
+            ValueError: If two commands claim the same name or alias
+        """
+        if not commands:
+            raise ValueError("A command table needs at least one command")
+        self.commands = list(commands)
+        self.default: T = self.commands[0][0]
+        lookup: Dict[str, T] = {}
+        for value, names in self.commands:
+            for name in names:
+                name = name.lower()
+                if lookup.get(name, value) is not value:
+                    raise ValueError(f"Command name {name!r} is used twice")
+                lookup[name] = value
+        if prefixes:
+            claimed: Dict[str, Optional[T]] = {}
+            for value, names in self.commands:
+                for name in names:
+                    name = name.lower()
+                    for end in range(1, len(name)):
+                        prefix = name[:end]
+                        # None marks a prefix two different commands share
+                        claimed[prefix] = value if claimed.get(prefix, value) is value else None
+            for prefix, value in claimed.items():
+                if value is not None and prefix not in lookup:
+                    lookup[prefix] = value
+        self._lookup = lookup
+
+    def parse(self, text: str) -> Optional[T]:
+        """
+        Look up one line of input.
+
+        Returns:
+            The matching command, or None if nothing matches
+        """
+        return self._lookup.get(text.strip().lower())
+
+    def names(self) -> List[str]:
+        """Return the name shown for each command, in menu order."""
+        return [names[0] for _, names in self.commands]
+
+    def name_of(self, value: T) -> str:
+        """Return the name shown for a command."""
+        for command, names in self.commands:
+            if command is value:
+                return names[0]
+        raise KeyError(value)
+
+
+def command_steps(table: CommandTable[T], prompt: str, write: Callable[[str], None] = print) -> Steps[T]:
+    """
+    Ask until the reply matches a command, as a dialogue.
+
+    Args:
+        table: Commands accepted at this prompt
+        prompt: Prompt yielded for each attempt
+        write: Shows messages to the player
+
+    Returns:
+        The chosen command (the table's default once input runs out)
+    """
+    while True:
+        try:
+            command = table.parse((yield prompt))
+        except EOFError:
+            write(f"\nUsing default option: {table.name_of(table.default)}")
+            return table.default
+        if command is not None:
+            return command
+        write("Invalid input, please try again.")
+
+
+def run_steps(steps: Steps[T], read: Callable[[str], str] = input) -> T:
+    """
+    Play a dialogue with a blocking read function.
+
+    Args:
+        steps: The dialogue
+        read: Reads one line for a prompt; an EOFError it raises is passed into the dialogue
+
+    Returns:
+        The dialogue's result
+    """
+    try:
+        prompt = next(steps)
+        while True:
+            try:
+                reply = read(prompt)
+            except EOFError:
+                prompt = steps.throw(EOFError)
+            else:
+                prompt = steps.send(reply)
+    except StopIteration as finished:
+        return finished.value
+    finally:
+        steps.close()
+
+
+async def run_steps_async(steps: Steps[T], read_line: Callable[[str], Awaitable[str]]) -> T:
+    """
+    Async counterpart of run_steps; waiting for a line suspends the coroutine.
+
+    Args:
+        steps: The dialogue
+        read_line: Coroutine function returning the next line; an EOFError it
+            raises is passed into the dialogue, anything else ends it
+    """
+    try:
+        prompt = next(steps)
+        while True:
+            try:
+                reply = await read_line(prompt)
+            except EOFError:
+                prompt = steps.throw(EOFError)
+            else:
+                prompt = steps.send(reply)
+    except StopIteration as finished:
+        return finished.value
+    finally:
+        steps.close()
+
+
+def read_command(table: CommandTable[T], prompt: str, read: Callable[[str], str] = input,
+                 write: Callable[[str], None] = print) -> T:
+    """
+    Ask until the input matches a command.
+
+    Args:
+        table: Commands accepted at this prompt
+        prompt: Prompt shown for each attempt
+        read: Reads one line of input for a prompt
+        write: Shows messages to the player
+
+    Returns:
+        The chosen command (the table's default once input runs out)
+    """
+    return run_steps(command_steps(table, prompt, write), read)
+
+
+async def read_command_async(table: CommandTable[T], prompt: str, read_line: Callable[[str], Awaitable[str]],
+                             write: Callable[[str], None]) -> T:
+    """
+    Async counterpart of read_command; waiting for a line suspends the coroutine.
+
+    Args:
+        table: Commands accepted at this prompt
+        prompt: Prompt shown for each attempt
+        read_line: Coroutine function returning the next line, raising EOFError when input ends
+        write: Shows messages to the player
+    """
+    return await run_steps_async(command_steps(table, prompt, write), read_line)
+
+
+COMBAT_COMMANDS: CommandTable[CombatAction] = CommandTable([
+    (CombatAction.ATTACK, ("attack", "1", "hit", "fight")),
+    (CombatAction.USE_ITEM, ("use item", "2", "use", "item")),
+    (CombatAction.EQUIP, ("equip", "3", "wear", "wield")),
+])
+
+EQUIP_SLOTS: CommandTable[EquipSlot] = CommandTable([
+    (EquipSlot.WEAPON, ("weapon", "1")),
+    (EquipSlot.ARMOR, ("armor", "2", "armour")),
+])
+
+STARTING_WEAPONS = CommandTable([
+    (WEAPONS["Rock"], ("rock", "1")),
+    (WEAPONS["Paper"], ("paper", "2")),
+    (WEAPONS["Scissors"], ("scissors", "3")),
+])
@@ -0,0 +1,240 @@
+"""Module containing compact, __slots__-based variants of the game entities.
+
+Design Decisions:
+- Each variant declares __slots__, so instances carry no per-object __dict__
+- Game rules are shared with the standard classes by reusing their methods,
+  so the two representations cannot drift apart
+- Variants are duck-type compatible with the combat engine, but per-object
+  narrate and rng overrides are not available (they would need extra slots)
+- Every enemy type has its own variant carrying its special attacks, so a
+  compact enemy fights exactly like the one it was converted from
+"""
+
+from inventory import Item, Armor, Consumable, Inventory, next_revision
+from weapon import Weapon
+from character import Character
+from villain import Villain, Goblin, Orc, Skeleton, Necromancer
+from boss import Boss, FireBoss, IceBoss, ICE_FREEZE_CHANCE
+from items import ROCK, BOSS_WEAPON
+
+
+class CompactItem:
+    """Slotted counterpart of Item."""
+    __slots__ = ("name", "description")
+    __init__ = Item.__init__
+
+
+class CompactWeapon(CompactItem):
+    """Slotted counterpart of Weapon."""
+    __slots__ = ("damage_bonus",)
+
+    def __init__(self, name: str, description: str, damage_bonus: int):
+        self.name = name
+        self.description = description
+        self.damage_bonus = damage_bonus
+
+
+class CompactArmor(CompactItem):
+    """Slotted counterpart of Armor."""
+    __slots__ = ("defense_bonus",)
+
+    def __init__(self, name: str, description: str, defense_bonus: int):
+        self.name = name
+        self.description = description
+        self.defense_bonus = defense_bonus
+
+
+class CompactConsumable(CompactItem):
+    """Slotted counterpart of Consumable."""
+    __slots__ = ("effect", "value")
+    use = Consumable.use
+
+    def __init__(self, name: str, description: str, effect: str, value: int):
+        self.name = name
+        self.description = description
+        self.effect = effect
+        self.value = value
+
+
+class CompactInventory:
+    """Slotted counterpart of Inventory."""
+    __slots__ = ("max_size", "items", "charges", "equipped_weapon", "equipped_armor",
+                 "weapon_bonus", "armor_bonus", "revision")
+    __init__ = Inventory.__init__
+    add_item = Inventory.add_item
+    remove_item = Inventory.remove_item
+    equip_weapon = Inventory.equip_weapon
+    equip_armor = Inventory.equip_armor
+    display_inventory = Inventory.display_inventory
+    _spend_charge = Inventory._spend_charge
+
+    def use_consumable(self, consumable_name: str, character) -> str:
+        """
+        Use a consumable item.
+
+        Returns:
+            Message describing the effect
+        """
+        consumable = self.items.get(consumable_name)
+        if isinstance(consumable, (Consumable, CompactConsumable)):
+            message = consumable.use(character)
+            self._spend_charge(consumable_name)
+            return message
+        return "Item not found or not consumable"
+
+
+class CompactCharacter:
+    """Slotted counterpart of Character.
+
+    Design Decisions:
+    - Default items are the same shared catalog templates Character uses
+    """
+    __slots__ = ("name", "_health", "damage", "defense", "inventory")
+    narrate = Character.narrate
+    rng = Character.rng
+
+    _initialize_default_items = Character._initialize_default_items
+    get_health = Character.get_health
+    set_health = Character.set_health
+    get_attack_power = Character.get_attack_power
+    get_effective_defense = Character.get_effective_defense
+    damage_against = Character.damage_against
+    attack = Character.attack
+    take_damage = Character.take_damage
+    use_item = Character.use_item
+    status_lines = Character.status_lines
+    display = Character.display
+    display_inventory = Character.display_inventory
+
+    def __init__(self, name: str, health: int, damage: int):
+        """Initialise a character with the same defaults as Character."""
+        self.name = name
+        self._health = health
+        self.damage = damage
+        self.defense = 0
+        self.inventory = CompactInventory()
+        self._initialize_default_items()
+        self.inventory.add_item(ROCK)
+        self.inventory.equip_weapon(ROCK)
+
+    def equip_item(self, item_name: str) -> str:
+        """Equip a weapon or armour from inventory."""
+        item = self.inventory.items.get(item_name)
+        if isinstance(item, (Weapon, CompactWeapon)) and self.inventory.equip_weapon(item):
+            return f"Equipped {item.name}"
+        if isinstance(item, (Armor, CompactArmor)) and self.inventory.equip_armor(item):
+            return f"Equipped {item.name}"
+        return "Item not found or not equippable"
+
+
+class CompactVillain(CompactCharacter):
+    """Slotted counterpart of Villain."""
+    __slots__ = ("level",)
+    attack = Villain.attack
+
+    def __init__(self, name: str, level: int, health: int, damage: int):
+        super().__init__(name, health, damage)
+        self.level = level
+
+
+class CompactBoss(CompactCharacter):
+    """Slotted counterpart of Boss."""
+    __slots__ = ("level",)
+    special_ability = Boss.special_ability
+
+    def __init__(self, name: str, level: int, health: int, damage: int):
+        super().__init__(name, health, damage)
+        self.level = level
+
+        self.inventory.add_item(BOSS_WEAPON)
+        self.inventory.equip_weapon(BOSS_WEAPON)
+
+
+class CompactGoblin(CompactVillain):
+    """Slotted counterpart of Goblin."""
+    __slots__ = ()
+    goblin_attack = Goblin.goblin_attack
+
+
+class CompactOrc(CompactVillain):
+    """Slotted counterpart of Orc."""
+    __slots__ = ()
+    orc_attack = Orc.orc_attack
+
+
+class CompactSkeleton(CompactVillain):
+    """Slotted counterpart of Skeleton."""
+    __slots__ = ()
+
+
+class CompactNecromancer(CompactVillain):
+    """Slotted counterpart of Necromancer; its summons are standard pooled skeletons."""
+    __slots__ = ()
+    summon_skeleton = Necromancer.summon_skeleton
+    necromancer_attack = Necromancer.necromancer_attack
+
+
+class CompactFireBoss(CompactBoss):
+    """Slotted counterpart of FireBoss."""
+    __slots__ = ()
+    fire_attack = FireBoss.fire_attack
+    special_ability = FireBoss.special_ability
+
+
+class CompactIceBoss(CompactBoss):
+    """Slotted counterpart of IceBoss."""
+    __slots__ = ()
+    special_ability = IceBoss.special_ability
+
+    def ice_attack(self, enemy) -> int:
+        """Ice-based attack; IceBoss.ice_attack calls super(), which only works on IceBoss itself."""
+        base_damage = Character.attack(self, enemy)
+        if self.rng.random() < ICE_FREEZE_CHANCE:
+            self.narrate(f"{self.name} freezes you! Your attacks are slowed!")
+        return base_damage
+
+    attack = ice_attack
+
+
+# Standard class -> compact class taking (name, level, health, damage)
+COMPACT_CLASSES = {
+    Goblin: CompactGoblin,
+    Orc: CompactOrc,
+    Skeleton: CompactSkeleton,
+    Necromancer: CompactNecromancer,
+    FireBoss: CompactFireBoss,
+    IceBoss: CompactIceBoss,
+}
+
+
+def to_compact(character: Character) -> CompactCharacter:
+    """
+    Build the compact variant of a character in its current state.
+
+    Args:
+        character: A Character, Villain or Boss
+
+    Returns:
+        The matching compact entity, holding the same stats, items, charges
+        and equipment
+    """
+    compact_class = COMPACT_CLASSES.get(type(character))
+    if compact_class is not None:
+        compact = compact_class(character.name, character.level, character.get_health(), character.damage)
+    elif isinstance(character, Boss):
+        compact = CompactBoss(character.name, character.level, character.get_health(), character.damage)
+    elif isinstance(character, Villain):
+        compact = CompactVillain(character.name, character.level, character.get_health(), character.damage)
+    else:
+        compact = CompactCharacter(character.name, character.get_health(), character.damage)
+    compact.defense = character.defense
+    source, inventory = character.inventory, compact.inventory
+    inventory.max_size = source.max_size
+    inventory.items = dict(source.items)
+    inventory.charges = dict(source.charges)
+    inventory.equipped_weapon = source.equipped_weapon
+    inventory.equipped_armor = source.equipped_armor
+    inventory.weapon_bonus = source.weapon_bonus
+    inventory.armor_bonus = source.armor_bonus
+    inventory.revision = next_revision()
+    return compact
@@ -0,0 +1,170 @@
+"""Module for loading game content from a data file.
+
+Design Decisions:
+- Weapons, armour, consumables, enemies and the level line-up are defined in
+  content.json, so designers can add or rebalance content without code
+- The file is read and checked once; enemy stat formulas are compiled into
+  per-level arrays, so spawning an enemy is two array lookups
+- This module only deals in plain data; the item catalog and the level
+  providers turn it into game objects
+
+Enemy stats follow base + per_level * level, as the hard-coded constructor
+formulas did. An enemy's "class" names the Python class whose behaviour it
+uses, so a new enemy can reuse an existing special attack.
+"""
+
+import json
+import os
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+CONTENT_VERSION = 1
+DEFAULT_CONTENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content.json")
+# Levels whose stats are precomputed; higher levels fall back to the formula
+PRECOMPUTED_LEVELS = 100
+
+
+class ContentError(ValueError):
+    """Raised when a content file is missing fields or malformed."""
+
+
+class EnemyStats:
+    """Compiled stats for one enemy type.
+
+    Design Decisions:
+    - Health and damage are stored per level in compact integer arrays
+    - Levels past the arrays are computed from the same formula, so endless
+      level numbers still work
+    """
+    def __init__(self, enemy_id: str, enemy_class: str, name: str,
+                 health_base: int, health_per_level: int,
+                 damage_base: int, damage_per_level: int):
+        """
+        Args:
+            enemy_id: Key of the enemy in the content file
+            enemy_class: Name of the class providing its behaviour
+            name: Display name
+            health_base: Health before level scaling
+            health_per_level: Health added per level
+            damage_base: Damage before level scaling
+            damage_per_level: Damage added per level
+        """
+        self.enemy_id = enemy_id
+        self.enemy_class = enemy_class
+        self.name = name
+        self.health_base = health_base
+        self.health_per_level = health_per_level
+        self.damage_base = damage_base
+        self.damage_per_level = damage_per_level
+        levels = range(PRECOMPUTED_LEVELS + 1)
+        self.health = array("i", (health_base + health_per_level * level for level in levels))
+        self.damage = array("i", (damage_base + damage_per_level * level for level in levels))
+
+    def health_at(self, level: int) -> int:
+        """Health of this enemy at a level."""
+        if 0 <= level <= PRECOMPUTED_LEVELS:
+            return self.health[level]
+        return self.health_base + self.health_per_level * level
+
+    def damage_at(self, level: int) -> int:
+        """Damage of this enemy at a level."""
+        if 0 <= level <= PRECOMPUTED_LEVELS:
+            return self.damage[level]
+        return self.damage_base + self.damage_per_level * level
+
+
+class Content:
+    """Everything read from one content file."""
+    def __init__(self, weapons: List[dict], armor: List[dict], consumables: List[dict],
+                 enemies: Dict[str, EnemyStats], levels: List[dict]):
+        """
+        Args:
+            weapons: Weapon definitions (name, description, damage_bonus)
+            armor: Armour definitions (name, description, defense_bonus)
+            consumables: Consumable definitions (name, description, effect, value)
+            enemies: Compiled stats by enemy id
+            levels: Level line-up, each with a boss id and a list of villain ids
+        """
+        self.weapons = weapons
+        self.armor = armor
+        self.consumables = consumables
+        self.enemies = enemies
+        self.levels = levels
+
+    def enemy(self, enemy_id: str) -> EnemyStats:
+        """
+        Look up an enemy's compiled stats.
+
+        Raises:
+            KeyError: If the content defines no such enemy
+        """
+        return self.enemies[enemy_id]
+
+
+def _require(entry: dict, fields: tuple, where: str) -> None:
+    missing = [field for field in fields if field not in entry]
+    if missing:
+        raise ContentError(f"{where} is missing {', '.join(missing)}")
+
+
+def _compile_enemy(enemy_id: str, entry: dict) -> EnemyStats:
+    where = f"enemy {enemy_id!r}"
+    _require(entry, ("class", "health", "damage"), where)
+    _require(entry["health"], ("base", "per_level"), f"{where} health")
+    _require(entry["damage"], ("base", "per_level"), f"{where} damage")
+    return EnemyStats(enemy_id, entry["class"], entry.get("name", enemy_id),
+                      int(entry["health"]["base"]), int(entry["health"]["per_level"]),
+                      int(entry["damage"]["base"]), int(entry["damage"]["per_level"]))
+
+
+def parse_content(data: dict) -> Content:
+    """
+    Check and compile content that has already been decoded from JSON.
+
+    Raises:
+        ContentError: If anything required is missing or inconsistent
+    """
+    if data.get("version") != CONTENT_VERSION:
+        raise ContentError(f"Unsupported content version: {data.get('version')}")
+    for section, fields in (("weapons", ("name", "description", "damage_bonus")),
+                            ("armor", ("name", "description", "defense_bonus")),
+                            ("consumables", ("name", "description", "effect", "value"))):
+        for index, entry in enumerate(data.get(section, [])):
+            _require(entry, fields, f"{section}[{index}]")
+
+    enemies = {enemy_id: _compile_enemy(enemy_id, entry)
+               for enemy_id, entry in data.get("enemies", {}).items()}
+    levels = data.get("levels", [])
+    for number, level in enumerate(levels, start=1):
+        _require(level, ("boss", "villains"), f"level {number}")
+        for enemy_id in [level["boss"], *level["villains"]]:
+            if enemy_id not in enemies:
+                raise ContentError(f"level {number} uses unknown enemy {enemy_id!r}")
+    return Content(data.get("weapons", []), data.get("armor", []), data.get("consumables", []),
+                   enemies, levels)
+
+
+@lru_cache(maxsize=None)
+def load_content(path: Optional[str] = None) -> Content:
+    """
+    Load a content file, once per path.
+
+    Args:
+        path: File to read (RPG_CONTENT_FILE, or content.json beside this module, if omitted)
+
+    Returns:
+        The compiled content
+    """
+    path = path or os.environ.get("RPG_CONTENT_FILE") or DEFAULT_CONTENT_PATH
+    try:
+        with open(path) as content_file:
+            data = json.load(content_file)
+    except json.JSONDecodeError as error:
+        raise ContentError(f"{path} is not valid JSON: {error}") from error
+    return parse_content(data)
+
+
+def enemy_stats(enemy_id: str) -> EnemyStats:
+    """Compiled stats of an enemy from the default content."""
+    return load_content().enemy(enemy_id)
@@ -0,0 +1,214 @@
+"""Module containing a NumPy kernel that steps thousands of duels at once.
+
+Design Decisions:
+- Each duel is a column in a set of arrays (health, damage, weapon bonus,
+  defence), so one round for every duel is a handful of array operations
+- The damage rules mirror Character.attack, FireBoss.fire_attack and
+  Character.take_damage exactly, including the health cap that
+  Character.set_health applies on every hit
+- Randomness is one uniform roll per duel per round; SequenceRandom feeds
+  the same rolls to the object classes, and the kernel turns a roll into
+  fire damage the way random.randint does, so both paths agree duel for duel
+
+Requires NumPy.
+"""
+
+import random
+from typing import Iterable, Optional, Sequence, Tuple
+import numpy as np
+from character import Character
+from boss import FIRE_DAMAGE_MIN, FIRE_DAMAGE_MAX
+
+# Character.set_health keeps health between 0 and this on every change
+HEALTH_CAP = 1000
+# Rolls are doubles with 53 random bits, as from random.random() and Generator.random()
+ROLL_SCALE = 2.0 ** 53
+
+
+class SequenceRandom(random.Random):
+    """Stand-in for the random module that replays a fixed list of rolls.
+
+    Design Decisions:
+    - Only random() is overridden; randint and the other integer draws are
+      random.Random's own, which build on random() for subclasses like this
+      one, so the object classes roll exactly as they would in the game
+    - random.randint keeps floor(roll * 2**53) % n unless the roll lands in
+      the top 2**53 % n of the range, where it rolls again; the kernel has
+      no second roll, but the chance of meeting one is below 1e-15
+    """
+    def __init__(self, rolls: Sequence[float]):
+        super().__init__(0)
+        self._rolls = iter(rolls)
+
+    def random(self) -> float:
+        """Return the next roll."""
+        return float(next(self._rolls))
+
+
+def randint_from_rolls(rolls: np.ndarray, low: int, high: int) -> np.ndarray:
+    """
+    Turn uniform rolls into integers in [low, high] as random.randint would.
+
+    Args:
+        rolls: Uniform rolls in [0, 1)
+        low: Smallest value
+        high: Largest value
+
+    Returns:
+        An int64 array the shape of rolls
+    """
+    return low + (np.floor(rolls * ROLL_SCALE).astype(np.int64) % (high - low + 1))
+
+
+class DuelBatch:
+    """A batch of independent player-versus-enemy duels held as arrays.
+
+    Design Decisions:
+    - Stats are stored as int64 columns, one entry per duel
+    - Finished duels are masked out rather than removed, so indices stay stable
+    """
+    def __init__(self, player_health, player_damage, player_bonus, player_defense,
+                 enemy_health, enemy_damage, enemy_bonus, enemy_defense, fire=False):
+        """
+        Initialise a batch from per-duel stats.
+
+        Args:
+            player_health: Starting player health per duel
+            player_damage: Player base damage per duel
+            player_bonus: Player weapon damage bonus per duel
+            player_defense: Player effective defence (base plus armour) per duel
+            enemy_health: Starting enemy health per duel
+            enemy_damage: Enemy base damage per duel
+            enemy_bonus: Enemy weapon damage bonus per duel
+            enemy_defense: Enemy effective defence per duel
+            fire: True (per duel or for all) if the enemy uses FireBoss.fire_attack
+        """
+        # Health above the cap is kept until the first hit, as on a Character
+        self.player_health = np.array(player_health, dtype=np.int64)
+        size = self.player_health.shape
+        self.player_attack = self._column(player_damage, size) + self._column(player_bonus, size)
+        self.player_defense = self._column(player_defense, size)
+        self.enemy_health = self._column(enemy_health, size)
+        self.enemy_attack = self._column(enemy_damage, size) + self._column(enemy_bonus, size)
+        self.enemy_defense = self._column(enemy_defense, size)
+        self.fire = np.broadcast_to(np.asarray(fire, dtype=bool), size).copy()
+        self.rounds = np.zeros(size, dtype=np.int64)
+
+        # Damage per hit only depends on stats, so it is worked out once
+        self.player_hit = np.maximum(0, self.player_attack - self.enemy_defense)
+        self.enemy_hit = np.maximum(0, self.enemy_attack - self.player_defense)
+
+    @staticmethod
+    def _column(values, size: Tuple[int, ...]) -> np.ndarray:
+        """Broadcast a scalar or array to a fresh int64 column."""
+        return np.broadcast_to(np.asarray(values, dtype=np.int64), size).copy()
+
+    @classmethod
+    def from_characters(cls, pairs: Iterable[Tuple[Character, Character]], fire=False) -> "DuelBatch":
+        """
+        Build a batch from existing (player, enemy) character pairs.
+
+        Args:
+            pairs: Player and enemy objects for each duel
+            fire: True if the enemies use FireBoss.fire_attack
+
+        Returns:
+            A new DuelBatch with the characters' current stats
+        """
+        columns = [[] for _ in range(8)]
+        for player, enemy in pairs:
+            for column, value in zip(columns, (
+                    player.get_health(), player.damage, player.inventory.weapon_bonus,
+                    player.get_effective_defense(),
+                    enemy.get_health(), enemy.damage, enemy.inventory.weapon_bonus,
+                    enemy.get_effective_defense())):
+                column.append(value)
+        return cls(*columns, fire=fire)
+
+    def __len__(self) -> int:
+        return self.player_health.shape[0]
+
+    def active(self) -> np.ndarray:
+        """Mask of duels where both sides are still standing."""
+        return (self.player_health > 0) & (self.enemy_health > 0)
+
+    def step(self, rolls: np.ndarray) -> int:
+        """
+        Play one round of every unfinished duel.
+
+        Args:
+            rolls: One uniform roll in [0, 1) per duel
+
+        Returns:
+            Number of duels that were still active this round
+        """
+        active = self.active()
+        self.rounds += active
+
+        # Player strikes first; a defeated enemy never gets its turn
+        enemy_health = np.clip(self.enemy_health - self.player_hit, 0, HEALTH_CAP)
+        self.enemy_health = np.where(active, enemy_health, self.enemy_health)
+        strikes_back = active & (self.enemy_health > 0)
+
+        player_health = np.clip(self.player_health - self.enemy_hit, 0, HEALTH_CAP)
+        fire_damage = randint_from_rolls(rolls, FIRE_DAMAGE_MIN, FIRE_DAMAGE_MAX)
+        burn = np.maximum(0, fire_damage - self.player_defense)
+        player_health = np.where(self.fire, np.clip(player_health - burn, 0, HEALTH_CAP), player_health)
+        self.player_health = np.where(strikes_back, player_health, self.player_health)
+        return int(active.sum())
+
+    def run(self, rng: Optional[np.random.Generator] = None, max_rounds: int = 1000) -> "DuelBatch":
+        """
+        Step every duel until all are decided or max_rounds is reached.
+
+        Args:
+            rng: NumPy generator supplying the rolls (a fresh one if omitted)
+            max_rounds: Safety cap for duels where neither side can hurt the other
+
+        Returns:
+            This batch, for chaining
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        for _ in range(max_rounds):
+            if not self.step(rng.random(len(self))):
+                break
+        return self
+
+    @property
+    def player_won(self) -> np.ndarray:
+        """Mask of duels the player has won."""
+        return self.enemy_health <= 0
+
+    def win_rate(self) -> float:
+        """Fraction of duels the player has won."""
+        return float(self.player_won.mean()) if len(self) else 0.0
+
+
+def run_object_duel(player: Character, enemy: Character, rolls: Sequence[float],
+                    fire: bool = False, max_rounds: int = 1000) -> int:
+    """
+    Play one duel with the character classes using a fixed roll sequence.
+
+    This is the reference path the kernel is checked against: feed it the
+    kernel's rolls for one duel and the outcome matches that column.
+
+    Args:
+        player: The player character
+        enemy: The enemy character (a FireBoss if fire is True)
+        rolls: The duel's roll for each round
+        fire: True to use FireBoss.fire_attack instead of attack
+        max_rounds: Same safety cap as DuelBatch.run
+
+    Returns:
+        Number of rounds played
+    """
+    enemy.rng = SequenceRandom(rolls)
+    enemy_attack = enemy.fire_attack if fire else enemy.attack
+    rounds = 0
+    while player.get_health() > 0 and enemy.get_health() > 0 and rounds < max_rounds:
+        rounds += 1
+        player.attack(enemy)
+        if enemy.get_health() <= 0:
+            break
+        enemy_attack(player)
+    return rounds
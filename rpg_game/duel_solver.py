@@ -0,0 +1,159 @@
+"""Module containing an exact solver for duel outcomes.
+
+Design Decisions:
+- A duel is a Markov chain over (player_hp, enemy_hp); the player's hit is
+  fixed, so enemy health falls by the same amount each round and only the
+  player's health is uncertain
+- Probabilities are pushed forward one enemy turn at a time over every
+  reachable player health, which gives exact results with no sampling
+- Results are memoised per stat tuple, so repeat queries are a cache lookup
+"""
+
+from functools import lru_cache
+from typing import Dict, Tuple
+from character import Character
+from boss import FIRE_DAMAGE_MIN, FIRE_DAMAGE_MAX
+from villain import GOBLIN_DODGE_CHANCE, NECROMANCER_SUMMON_CHANCE, SKELETON_DAMAGE
+from items import ROCK
+
+# Each move maps to the distribution of damage one enemy turn deals
+ATTACK = "attack"            # Character.attack, Villain.attack, IceBoss.ice_attack, Orc.orc_attack
+FIRE_ATTACK = "fire"         # FireBoss.fire_attack
+GOBLIN_ATTACK = "goblin"     # Goblin.goblin_attack
+NECROMANCER_ATTACK = "necromancer"  # Necromancer.necromancer_attack
+
+DamageOutcomes = Tuple[Tuple[int, float], ...]
+
+
+class DuelOdds:
+    """Exact outcome of a duel."""
+    def __init__(self, win_probability: float, expected_health: float, expected_rounds: float):
+        """
+        Store the outcome of a duel.
+
+        Args:
+            win_probability: Chance the player wins
+            expected_health: Expected player health at the end (0 on a loss)
+            expected_rounds: Expected number of rounds played
+        """
+        self.win_probability = win_probability
+        self.expected_health = expected_health
+        self.expected_rounds = expected_rounds
+
+    @property
+    def expected_health_if_won(self) -> float:
+        """Expected player health given that the player wins."""
+        return self.expected_health / self.win_probability if self.win_probability else 0.0
+
+    def __repr__(self) -> str:
+        return (f"DuelOdds(win_probability={self.win_probability:.6f}, "
+                f"expected_health={self.expected_health:.3f}, expected_rounds={self.expected_rounds:.3f})")
+
+
+def enemy_turn_outcomes(enemy_attack: int, player_defense: int, move: str = ATTACK) -> DamageOutcomes:
+    """
+    Distribution of damage dealt to the player by one enemy turn.
+
+    Args:
+        enemy_attack: Enemy damage plus weapon bonus
+        player_defense: Player effective defence
+        move: Which enemy attack method is used
+
+    Returns:
+        Tuple of (damage, probability) pairs
+    """
+    hit = max(0, enemy_attack - player_defense)
+    if move == ATTACK:
+        return ((hit, 1.0),)
+    if move == FIRE_ATTACK:
+        # fire_attack deals the normal hit, then take_damage applies defence to the burn
+        rolls = range(FIRE_DAMAGE_MIN, FIRE_DAMAGE_MAX + 1)
+        return _merge((hit + max(0, fire - player_defense), 1 / len(rolls)) for fire in rolls)
+    if move == GOBLIN_ATTACK:
+        return _merge(((0, GOBLIN_DODGE_CHANCE), (hit, 1 - GOBLIN_DODGE_CHANCE)))
+    if move == NECROMANCER_ATTACK:
+        skeleton_hit = max(0, SKELETON_DAMAGE + ROCK.damage_bonus - player_defense)
+        return _merge(((skeleton_hit, NECROMANCER_SUMMON_CHANCE), (hit, 1 - NECROMANCER_SUMMON_CHANCE)))
+    raise ValueError(f"Unknown enemy move: {move}")
+
+
+def _merge(outcomes) -> DamageOutcomes:
+    """Combine outcomes that deal the same damage."""
+    merged: Dict[int, float] = {}
+    for damage, probability in outcomes:
+        merged[damage] = merged.get(damage, 0.0) + probability
+    return tuple(sorted(merged.items()))
+
+
+@lru_cache(maxsize=65536)
+def solve_duel(player_health: int, player_attack: int, player_defense: int,
+               enemy_health: int, enemy_attack: int, enemy_defense: int,
+               move: str = ATTACK) -> DuelOdds:
+    """
+    Work out the exact outcome of a duel where the player always attacks.
+
+    Args:
+        player_health: Player starting health
+        player_attack: Player damage plus weapon bonus
+        player_defense: Player effective defence
+        enemy_health: Enemy starting health
+        enemy_attack: Enemy damage plus weapon bonus
+        enemy_defense: Enemy effective defence
+        move: Which enemy attack method the enemy uses
+
+    Returns:
+        DuelOdds for the duel
+    """
+    if player_health <= 0:
+        return DuelOdds(0.0, 0.0, 0.0)
+    if enemy_health <= 0:
+        return DuelOdds(1.0, float(player_health), 0.0)
+    player_hit = max(0, player_attack - enemy_defense)
+    if player_hit == 0:
+        # The enemy can never fall, which the combat engine scores as a loss
+        return DuelOdds(0.0, 0.0, float("inf"))
+
+    outcomes = enemy_turn_outcomes(enemy_attack, player_defense, move)
+    enemy_turns = -(-enemy_health // player_hit) - 1
+
+    # health_states[hp] is the chance the player is alive on hp after each enemy turn
+    health_states: Dict[int, float] = {player_health: 1.0}
+    expected_rounds = 0.0
+    for turn in range(1, enemy_turns + 1):
+        next_states: Dict[int, float] = {}
+        for health, probability in health_states.items():
+            for damage, chance in outcomes:
+                remaining = health - damage
+                if remaining > 0:
+                    next_states[remaining] = next_states.get(remaining, 0.0) + probability * chance
+                else:
+                    expected_rounds += turn * probability * chance
+        health_states = next_states
+        if not health_states:
+            break
+
+    win_probability = sum(health_states.values())
+    expected_rounds += (enemy_turns + 1) * win_probability
+    expected_health = sum(health * probability for health, probability in health_states.items())
+    return DuelOdds(win_probability, expected_health, expected_rounds)
+
+
+def solve_characters(player: Character, enemy: Character, move: str = ATTACK) -> DuelOdds:
+    """
+    Solve a duel between two existing characters at their current stats.
+
+    Args:
+        player: The player character
+        enemy: The enemy character
+        move: Which enemy attack method the enemy uses
+
+    Returns:
+        DuelOdds for the duel
+    """
+    return solve_duel(player.get_health(), attack_power(player), player.get_effective_defense(),
+                      enemy.get_health(), attack_power(enemy), enemy.get_effective_defense(), move)
+
+
+def attack_power(character: Character) -> int:
+    """Damage plus equipped weapon bonus, as used by attack."""
+    return character.get_attack_power()
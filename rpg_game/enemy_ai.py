@@ -0,0 +1,262 @@
+"""Module containing a search-based enemy AI.
+
+Design Decisions:
+- The enemy picks between its normal attack, its class's special attack and
+  a healing potion by expectiminimax: enemy turns are decision nodes, random
+  rolls are chance nodes, and the player is assumed to keep attacking
+- Damage distributions come from duel_solver.enemy_turn_outcomes, so the AI
+  plans with exactly the rules the combat code applies
+- Searches deepen one enemy turn at a time until a node budget is spent,
+  and the deepest finished search decides; counting nodes rather than time
+  makes every choice depend only on the position, so seeded replays and
+  simulations play out the same way on any machine
+- A time budget is kept as a safety cap under the 5 ms decision target,
+  counted from the start of the decision with setup included; replays and
+  simulations switch it off so a slow machine cannot change their moves
+- Moves that score the same are split by expected damage, so a special
+  attack that is at least as strong is never passed over for a plain one
+- Node values are cached in a transposition table keyed on a compact state
+  tuple, and the table is kept across turns, where most states recur
+"""
+
+import math
+import time
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+from character import Character
+from boss import FireBoss
+from villain import Goblin, Orc, Necromancer
+from items import HEALING_POTION
+from duel_solver import (
+    ATTACK, FIRE_ATTACK, GOBLIN_ATTACK, NECROMANCER_ATTACK,
+    DamageOutcomes, enemy_turn_outcomes, attack_power
+)
+
+# Each decision should be made within DECISION_TARGET; the node budget fits
+# well inside it, and the time budget only stops searches on a slow machine
+DECISION_TARGET = 0.005
+DEFAULT_NODE_BUDGET = 300
+DEFAULT_TIME_BUDGET = 0.004
+DEFAULT_MAX_DEPTH = 40
+DEFAULT_TABLE_SIZE = 200000
+
+# Values are from the enemy's point of view: 1 is a win, -1 a loss
+WIN_VALUE = 1.0
+LOSS_VALUE = -1.0
+# Future values are shrunk a little so quicker wins (and slower losses) score higher
+DISCOUNT = 0.99
+# Estimates stay clear of real wins and losses
+HEURISTIC_SCALE = 0.9
+TIE_TOLERANCE = 1e-9
+
+# Special attack method and its damage model, by enemy class
+SPECIAL_ATTACKS = (
+    (FireBoss, "fire_attack", FIRE_ATTACK),
+    (Goblin, "goblin_attack", GOBLIN_ATTACK),
+    (Orc, "orc_attack", ATTACK),
+    (Necromancer, "necromancer_attack", NECROMANCER_ATTACK),
+)
+
+
+class EnemyMove(Enum):
+    """Moves the enemy AI can choose from."""
+    ATTACK = "attack"
+    SPECIAL = "special"
+    HEAL = "heal"
+
+
+class _OutOfBudget(Exception):
+    """Raised inside a search when the decision's node or time budget is spent."""
+
+
+class _Matchup:
+    """Fixed facts about one enemy facing one player, shared by every node."""
+    def __init__(self, enemy: Character, player: Character):
+        enemy_attack = attack_power(enemy)
+        player_defense = player.get_effective_defense()
+        self.player_hit = max(0, attack_power(player) - enemy.get_effective_defense())
+        self.outcomes: Dict[EnemyMove, DamageOutcomes] = {
+            EnemyMove.ATTACK: enemy_turn_outcomes(enemy_attack, player_defense, ATTACK),
+        }
+        for enemy_class, _, model in SPECIAL_ATTACKS:
+            if isinstance(enemy, enemy_class):
+                self.outcomes[EnemyMove.SPECIAL] = enemy_turn_outcomes(enemy_attack, player_defense, model)
+                break
+        self.expected_damage: Dict[EnemyMove, float] = {
+            move: sum(damage * chance for damage, chance in outcomes) for move, outcomes in self.outcomes.items()
+        }
+        self.expected_damage[EnemyMove.HEAL] = 0.0
+        self.expected_hit = max(self.expected_damage.values())
+        self.key = (type(enemy).__name__, enemy_attack, player_defense, self.player_hit)
+
+
+def potion_count(character: Character) -> int:
+    """Healing potions the character can still drink."""
+    inventory = character.inventory
+    if HEALING_POTION.name not in inventory.items:
+        return 0
+    return inventory.charges.get(HEALING_POTION.name, 1)
+
+
+class SearchEnemyAI:
+    """Enemy policy that chooses each move by a budgeted expectiminimax search.
+
+    Design Decisions:
+    - Instances are callable as a combat engine enemy policy: they choose a
+      move, perform it on the real characters and return the damage dealt
+    - One instance can serve every enemy in a game; matchups are part of the
+      table key, so entries never leak between different fights
+    - Counters record the work done, for tuning the budget
+    """
+    def __init__(self, node_budget: int = DEFAULT_NODE_BUDGET,
+                 time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+                 max_depth: int = DEFAULT_MAX_DEPTH, table_size: int = DEFAULT_TABLE_SIZE):
+        """
+        Args:
+            node_budget: Most new nodes each decision may search
+            time_budget: Safety cap in seconds on each decision, or None for
+                fully deterministic choices
+            max_depth: Most enemy turns to look ahead
+            table_size: Entries kept in the transposition table before it is cleared
+        """
+        self.node_budget = node_budget
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.table_size = table_size
+        self.table: Dict[tuple, Tuple[float, bool]] = {}
+        self.decisions = 0
+        self.nodes = 0
+        self.table_hits = 0
+        self.last_depth = 0
+        self._deadline = math.inf
+        self._node_limit = 0
+
+    def __call__(self, enemy: Character, player: Character) -> int:
+        """Choose and perform the enemy's move, returning the damage dealt."""
+        return self.perform(enemy, player, self.choose_move(enemy, player))
+
+    def choose_move(self, enemy: Character, player: Character) -> EnemyMove:
+        """
+        Search for the enemy's best move in the current position.
+
+        The node budget covers nodes not already in the table; the time
+        budget starts when this is called, so building the matchup counts
+        against it.
+
+        Args:
+            enemy: The enemy about to act
+            player: The player it faces
+
+        Returns:
+            The chosen move
+        """
+        if self.time_budget is None:
+            self._deadline = math.inf
+        else:
+            self._deadline = time.perf_counter() + self.time_budget
+        self._node_limit = self.nodes + self.node_budget
+        self.decisions += 1
+        matchup = _Matchup(enemy, player)
+        player_health, enemy_health, potions = player.get_health(), enemy.get_health(), potion_count(enemy)
+        moves = self._moves(matchup, potions)
+        if len(moves) == 1:
+            return moves[0]
+        if len(self.table) > self.table_size:
+            self.table.clear()
+
+        best_move = EnemyMove.ATTACK
+        self.last_depth = 0
+        for depth in range(1, self.max_depth + 1):
+            try:
+                scored = [(self._move_value(matchup, move, player_health, enemy_health, potions, depth), move)
+                          for move in moves]
+            except _OutOfBudget:
+                break
+            best_value = max(value for (value, _), _ in scored)
+            # Rounding can split equal lines; ties go to the move expected to hit hardest
+            tied = [move for (value, _), move in scored if value >= best_value - TIE_TOLERANCE]
+            best_move = max(tied, key=matchup.expected_damage.__getitem__)
+            self.last_depth = depth
+            # Nothing left to see once no line reaches the search horizon
+            if not any(horizon for (_, horizon), _ in scored):
+                break
+        return best_move
+
+    def perform(self, enemy: Character, player: Character, move: EnemyMove) -> int:
+        """
+        Carry out a move on the real characters.
+
+        Returns:
+            Damage dealt to the player
+        """
+        if move is EnemyMove.HEAL:
+            message = enemy.use_item(HEALING_POTION.name)
+            enemy.narrate(f"{enemy.name} drinks a {HEALING_POTION.name}. {message}")
+            return 0
+        if move is EnemyMove.SPECIAL:
+            for enemy_class, method, _ in SPECIAL_ATTACKS:
+                if isinstance(enemy, enemy_class):
+                    return getattr(enemy, method)(player)
+        return enemy.attack(player)
+
+    def _moves(self, matchup: _Matchup, potions: int) -> List[EnemyMove]:
+        moves = list(matchup.outcomes)
+        if potions:
+            moves.append(EnemyMove.HEAL)
+        return moves
+
+    def _search(self, matchup: _Matchup, player_health: int, enemy_health: int,
+                potions: int, depth: int) -> Tuple[float, bool]:
+        """Value of an enemy decision node, and whether it reached the horizon."""
+        key = (matchup.key, player_health, enemy_health, potions, depth)
+        cached = self.table.get(key)
+        if cached is not None:
+            self.table_hits += 1
+            return cached
+        self.nodes += 1
+        if self.nodes > self._node_limit or (not self.nodes & 63 and time.perf_counter() > self._deadline):
+            raise _OutOfBudget
+        best_value, reached_horizon = -math.inf, False
+        for move in self._moves(matchup, potions):
+            value, horizon = self._move_value(matchup, move, player_health, enemy_health, potions, depth)
+            best_value = max(best_value, value)
+            reached_horizon = reached_horizon or horizon
+        self.table[key] = best_value, reached_horizon
+        return best_value, reached_horizon
+
+    def _move_value(self, matchup: _Matchup, move: EnemyMove, player_health: int,
+                    enemy_health: int, potions: int, depth: int) -> Tuple[float, bool]:
+        """Expected value of a move, followed by the player's attack."""
+        if move is EnemyMove.HEAL:
+            outcomes: DamageOutcomes = ((0, 1.0),)
+            enemy_health = min(1000, enemy_health + HEALING_POTION.value)
+            potions -= 1
+        else:
+            outcomes = matchup.outcomes[move]
+        enemy_after = enemy_health - matchup.player_hit
+
+        value, reached_horizon = 0.0, False
+        for damage, chance in outcomes:
+            player_after = player_health - damage
+            if player_after <= 0:
+                value += chance * WIN_VALUE
+            elif enemy_after <= 0:
+                value += chance * LOSS_VALUE
+            elif depth == 1:
+                value += chance * self._estimate(matchup, player_after, enemy_after)
+                reached_horizon = True
+            else:
+                future, horizon = self._search(matchup, player_after, enemy_after, potions, depth - 1)
+                value += chance * DISCOUNT * future
+                reached_horizon = reached_horizon or horizon
+        return value, reached_horizon
+
+    def _estimate(self, matchup: _Matchup, player_health: int, enemy_health: int) -> float:
+        """Guess a position's value by racing each side's turns to win."""
+        if matchup.player_hit == 0:
+            return HEURISTIC_SCALE
+        if matchup.expected_hit == 0:
+            return -HEURISTIC_SCALE
+        player_turns = math.ceil(enemy_health / matchup.player_hit)
+        enemy_turns = math.ceil(player_health / matchup.expected_hit)
+        return HEURISTIC_SCALE * (player_turns - enemy_turns) / (player_turns + enemy_turns)
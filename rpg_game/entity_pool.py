@@ -0,0 +1,127 @@
+"""Module containing the pool that recycles enemy objects.
+
+Design Decisions:
+- Released enemies wait on a free list per class and are reset in place
+  when acquired again, so a respawn reuses the enemy, its inventory and the
+  inventory's containers instead of building them all anew
+- Only Villain and Boss subclasses taking (level, stats) are pooled; those
+  are the classes content spawns and Necromancers summon
+- Free lists are capped, so a burst of releases cannot pin memory forever
+- Releasing an enemy that is already free is refused, since the free list
+  would otherwise hand the same object to two callers; the check scans a
+  list of at most max_free entries
+- Counters are kept on the pool, so simulations can report how much reuse
+  they got; counts may drift slightly if several threads share one pool,
+  but the free lists themselves stay consistent
+"""
+
+from typing import Dict, List, Type, TypeVar
+from content import EnemyStats
+
+# Free enemies kept per class before releases are dropped
+DEFAULT_MAX_FREE = 64
+
+Enemy = TypeVar("Enemy")
+
+
+class EntityPool:
+    """Free lists of released enemies, one per class."""
+    def __init__(self, max_free: int = DEFAULT_MAX_FREE):
+        """
+        Args:
+            max_free: Released enemies kept per class
+        """
+        self.max_free = max_free
+        self._free: Dict[type, List[object]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+        self.dropped = 0
+
+    def acquire(self, enemy_class: Type[Enemy], level: int, stats: EnemyStats) -> Enemy:
+        """
+        Get a fresh enemy, reusing a released one when there is one.
+
+        Args:
+            enemy_class: Villain or Boss subclass to spawn
+            level: Level to spawn it at
+            stats: Compiled stats of its enemy type
+
+        Returns:
+            An enemy in the same state enemy_class(level, stats) would build
+        """
+        free = self._free.get(enemy_class)
+        if free:
+            try:
+                enemy = free.pop()
+            except IndexError:
+                # Another thread emptied the list first
+                pass
+            else:
+                self.hits += 1
+                enemy.respawn(level, stats)
+                return enemy
+        self.misses += 1
+        return enemy_class(level, stats)
+
+    def release(self, enemy: object) -> None:
+        """
+        Hand an enemy back for reuse.
+
+        The caller must not use the enemy afterwards.
+
+        Raises:
+            ValueError: If the enemy is already waiting to be reused
+        """
+        free = self._free.setdefault(type(enemy), [])
+        if any(free_enemy is enemy for free_enemy in free):
+            raise ValueError(f"{enemy!r} was released twice")
+        if len(free) >= self.max_free:
+            self.dropped += 1
+            return
+        free.append(enemy)
+        self.released += 1
+
+    def release_all(self, enemies) -> None:
+        """Hand back every enemy in an iterable."""
+        for enemy in enemies:
+            self.release(enemy)
+
+    def clear(self) -> None:
+        """Forget every free enemy; the counters are kept."""
+        self._free.clear()
+
+    def free_count(self) -> int:
+        """Return the number of enemies waiting to be reused."""
+        return sum(len(free) for free in self._free.values())
+
+    @property
+    def allocations_avoided(self) -> int:
+        """Enemies handed out without being constructed."""
+        return self.hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of acquisitions served from the free lists."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, object]:
+        """Return the pool's counters as plain data."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "allocations_avoided": self.allocations_avoided,
+            "released": self.released,
+            "dropped": self.dropped,
+            "free": self.free_count(),
+        }
+
+    def reset_stats(self) -> None:
+        """Zero the counters."""
+        self.hits = self.misses = self.released = self.dropped = 0
+
+
+# Pool shared by the game's own summons and spawns
+ENEMY_POOL = EntityPool()
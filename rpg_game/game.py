@@ -1,36 +1,159 @@
 from character import Character
 from boss import Boss, FireBoss, IceBoss
 from villain import Villain, Goblin, Orc, Necromancer
-from utilities import clear_screen, press_enter, print_border, get_valid_input
-from weapon import WEAPON_FACTORY
+from utilities import clear_screen, press_enter, print_border
+from commands import (COMBAT_COMMANDS, EQUIP_SLOTS, STARTING_WEAPONS, EquipSlot, Steps, command_steps,
+                      read_command, run_steps)
+from weapon import Weapon
+from inventory import Armor
 from constants import (
     PLAYER_START_HEALTH, PLAYER_START_DAMAGE,
-    BOSS_START_HEALTH, BOSS_START_DAMAGE,
     DEFAULT_PLAYER_NAME, MAX_HEALTH, MIN_HEALTH,
     MAX_DAMAGE, MIN_DAMAGE, MAX_DEFENSE, MIN_DEFENSE
 )
-from game_logger import logger
-from typing import Optional
+from game_logger import logger, flush_logging
+from levels import LevelProvider, DefaultLevelProvider, LazyLevelTable
+from combat_engine import CombatEngine, CombatObserver, CombatAction, ObserverGroup, EnemyPolicy, PlayerPolicy
+from combat_events import CombatEventWriter, EventLogObserver
+from metrics import GameMetrics
+from renderer import FrameRenderer
+from typing import Callable, Generator, List, Optional, Tuple
+import random
+
+BORDER = "-" * 80
+
+class CountingRandom(random.Random):
+    """random.Random that counts how often its state changes.
+
+    Design Decisions:
+    - Every draw goes through random() or getrandbits(), so counting those
+      two counts everything; overriding both keeps the methods built on them
+      on the same code path as random.Random, so seeded rolls are unchanged
+    - Reseeding and setstate() count too, so draws identifies the state
+      without building the 625-word state tuple
+    """
+    draws = 0
+
+    def random(self) -> float:
+        self.draws += 1
+        return super().random()
+
+    def getrandbits(self, k: int) -> int:
+        self.draws += 1
+        return super().getrandbits(k)
+
+    def seed(self, *args, **kwargs) -> None:
+        self.draws += 1
+        super().seed(*args, **kwargs)
+
+    def setstate(self, state) -> None:
+        self.draws += 1
+        super().setstate(state)
 
 class Game:
     """Main game class that manages the game flow."""
-    def __init__(self):
-        """Initialize the game with bosses and villains."""
+    def __init__(self, level_provider: Optional[LevelProvider] = None,
+                 event_log: Optional[CombatEventWriter] = None,
+                 seed: Optional[int] = None,
+                 read_input: Callable[[str], str] = input,
+                 enemy_policy: Optional[EnemyPolicy] = None,
+                 player_policy: Optional[PlayerPolicy] = None,
+                 metrics: Optional[GameMetrics] = None,
+                 write: Callable[[str], None] = print):
+        """
+        Initialise the game with bosses and villains.
+        
+        Args:
+            level_provider: Builds each level's enemies (the standard campaign if omitted)
+            event_log: Optional binary log that receives every combat turn; it is
+                flushed by end_game() and closed by close() or on leaving a with block
+            seed: Seed for this game's random rolls (unseeded if omitted)
+            read_input: Reads one line of player input for a prompt
+            enemy_policy: Chooses enemy moves, e.g. enemy_ai.SearchEnemyAI (plain attacks if omitted)
+            player_policy: Chooses the player's combat actions, e.g. from player_policies (asks the player if omitted)
+            metrics: Optional metrics.GameMetrics that records every fight
+            write: Outputs one line of campaign narration
+        
+        Design Decisions:
+        - Levels are built the first time they are entered, not up front
+        - Cleared levels are dropped and the next one is built as the player
+          advances, so memory stays flat however many levels there are
+        - Every random roll and every input goes through this game's own rng
+          and read_input, so a seed plus the inputs replays a session exactly
+        """
         self.current_level = 1
-        self.bosses = {
-            1: FireBoss(1),
-            2: IceBoss(2),
-            3: FireBoss(3),
-            4: IceBoss(4)
-        }
-        self.villains = {
-            1: [Goblin(1), Orc(1)],
-            2: [Goblin(2), Orc(2), Necromancer(2)],
-            3: [Goblin(3), Orc(3), Necromancer(3)],
-            4: [Goblin(4), Orc(4), Necromancer(4)]
-        }
+        self.level_provider = level_provider or DefaultLevelProvider()
+        self.rng = CountingRandom(seed)
+        self.read_input = read_input
+        self.write = write
+        level_count = self.level_provider.level_count()
+        self.bosses = LazyLevelTable(level_count, self._build_boss)
+        self.villains = LazyLevelTable(level_count, self._build_villains)
+        self.event_log = event_log
+        self.metrics = metrics
+        self.renderer = FrameRenderer()
+        self.enemy_policy = enemy_policy
+        self.player_policy = player_policy
         self.player = None
 
+    def _build_boss(self, level: int) -> Boss:
+        """Build a level's boss with this game's rng."""
+        boss = self.level_provider.build_boss(level)
+        boss.rng = self.rng
+        self._route_narration(boss)
+        return boss
+
+    def _build_villains(self, level: int) -> List[Villain]:
+        """Build a level's villains with this game's rng."""
+        villains = self.level_provider.build_villains(level)
+        for villain in villains:
+            villain.rng = self.rng
+            self._route_narration(villain)
+        return villains
+
+    def _route_narration(self, character: Character) -> None:
+        """Send a character's flavour text through this game's write function."""
+        # Console games keep the class default, so characters stay free of per-object hooks
+        if self.write is not print:
+            character.narrate = self.write
+
+    def _drop_level(self, level: int) -> None:
+        """Forget a level's enemies and hand them back to the level provider."""
+        boss = self.bosses.discard(level)
+        villains = self.villains.discard(level)
+        if villains:
+            self.level_provider.release_enemies(villains)
+        if boss is not None:
+            self.level_provider.release_enemies([boss])
+
+    def release_enemies(self) -> None:
+        """Hand every enemy built so far back to the level provider for reuse.
+        
+        The game must not fight again afterwards; levels would be rebuilt
+        from scratch.
+        """
+        for level in set(self.bosses.built_levels()) | set(self.villains.built_levels()):
+            self._drop_level(level)
+
+    def advance_level(self) -> None:
+        """Move on to the next level once the current one is cleared.
+        
+        Design Decisions:
+        - Cleared levels are dropped straight away, so a game never holds
+          more than the level being played and the one after it
+        - The next level is built one ahead, between fights, so entering it
+          never waits on generation
+        """
+        self.current_level += 1
+        for level in set(self.bosses.built_levels()) | set(self.villains.built_levels()):
+            if level < self.current_level:
+                self._drop_level(level)
+        upcoming = self.current_level + 1
+        if upcoming in self.bosses:
+            # Looking a level up is what builds it
+            self.villains[upcoming]
+            self.bosses[upcoming]
+
     def show_intro(self) -> None:
         """Display the game introduction and set up the game.
         
@@ -40,47 +163,82 @@ class Game:
         - Simple player name input
         """
         clear_screen()
-        print("Welcome to RPG Adventure!")
-        print("In a world where darkness looms, you are the chosen hero")
-        print("destined to defeat the evil bosses and restore peace.")
+        run_steps(self.intro_steps(), self.read_line)
+
+    def intro_steps(self) -> Steps[Character]:
+        """
+        The introduction as a dialogue: greet the player and create their character.
+        
+        Returns:
+            The new player character
+        """
+        self.write("Welcome to RPG Adventure!")
+        self.write("In a world where darkness looms, you are the chosen hero")
+        self.write("destined to defeat the evil bosses and restore peace.")
         try:
-            name = input("Enter your character's name: ").capitalize()
+            name = (yield "Enter your character's name: ").capitalize()
             if not name:
                 name = "Hero"
         except EOFError:
-            print("\nUsing default name: Hero")
+            self.write("\nUsing default name: Hero")
             name = "Hero"
+        self.create_player(name)
+        self.write(BORDER)
+        self.write(f"Welcome, {name}! Choose your weapon wisely.")
+        self.write(BORDER)
+        yield from self.press_enter_steps()
+        return self.player
+
+    def read_line(self, prompt: str) -> str:
+        """Read one line of console input; every console dialogue reads through here."""
+        return self.read_input(prompt)
+
+    def press_enter_steps(self) -> Steps[None]:
+        """Wait for the player to press Enter, as a dialogue."""
+        try:
+            yield "\nPress Enter to continue...\n"
+        except EOFError:
+            self.write("\nContinuing automatically...")
+
+    def create_player(self, name: str) -> Character:
+        """Create the player character, rolling with this game's rng."""
         self.player = Character(name, 110, 10)
-        print_border()
-        print(f"Welcome, {name}! Choose your weapon wisely.")
-        print_border()
-        press_enter()
+        self.player.rng = self.rng
+        self._route_narration(self.player)
+        return self.player
 
     def setup_game(self) -> None:
         """Set up the game by initializing the player with a weapon."""
         clear_screen()
-        print("Choose your starting weapon:")
-        print("1. Rock - A simple rock")
-        print("2. Paper - A magical paper")
-        print("3. Scissors - Sharp scissors")
-        
-        choice = get_valid_input("Enter your choice (1-3): ", ["1", "2", "3"])
-        
-        weapons = [
-            WEAPON_FACTORY["Rock"](),
-            WEAPON_FACTORY["Paper"](),
-            WEAPON_FACTORY["Scissors"]()
-        ]
+        run_steps(self.setup_steps(), self.read_line)
+
+    def setup_steps(self) -> Steps[None]:
+        """Let the player choose a starting weapon, as a dialogue."""
+        self.write("Choose your starting weapon:")
+        self.write("1. Rock - A simple rock")
+        self.write("2. Paper - A magical paper")
+        self.write("3. Scissors - Sharp scissors")
         
-        self.player.weapon = weapons[choice]
-        print(f"You have chosen the {self.player.weapon.name}!")
-        press_enter()
+        self.player.weapon = yield from command_steps(STARTING_WEAPONS, "Enter your choice (1-3): ", self.write)
+        self.write(f"You have chosen the {self.player.weapon.name}!")
+        yield from self.press_enter_steps()
 
         # Display initial character stats
-        print("\nYour character:")
-        print(f"Name: {self.player.name}")
-        print(f"Health: {self.player._health}")
-        print(f"Damage: {self.player.damage} (+{self.player.weapon.damage_bonus} from {self.player.weapon.name})")
+        self.write("\nYour character:")
+        self.write(f"Name: {self.player.name}")
+        self.write(f"Health: {self.player.get_health()}")
+        self.write(f"Damage: {self.player.damage} (+{self.player.weapon.damage_bonus} from {self.player.weapon.name})")
+
+    def session_steps(self) -> Steps[bool]:
+        """
+        A whole game as one dialogue: introduction, weapon choice and campaign.
+        
+        Returns:
+            True if every level was cleared, False if the player fell
+        """
+        yield from self.intro_steps()
+        yield from self.setup_steps()
+        return (yield from self.campaign_steps())
 
     def combat(self, player: Character, enemy: Character) -> bool:
         """
@@ -93,126 +251,90 @@ class Game:
         Returns:
             True if player wins, False if enemy wins
         """
-        while player.get_health() > 0 and enemy.get_health() > 0:
-            print("\n=============> COMBAT <=============")
-            print("\nPlayer Stats:")
-            print(f"Name: {player.name}")
-            print(f"Health: {player.get_health()}")
-            print(f"Damage: {player.damage}")
-            print(f"Defense: {player.get_effective_defense()}")
-            print("\nEquipment:")
-            if player.inventory.equipped_weapon:
-                print(f"Weapon: {player.inventory.equipped_weapon.name} (+{player.inventory.equipped_weapon.damage_bonus} Damage)")
-            else:
-                print("Weapon: None")
-            if player.inventory.equipped_armor:
-                print(f"Armor: {player.inventory.equipped_armor.name} (+{player.inventory.equipped_armor.defense_bonus} Defense)")
-            else:
-                print("Armor: None")
-            
-            print("\nEnemy Stats:")
-            print(f"Name: {enemy.name}")
-            print(f"Health: {enemy.get_health()}")
-            print(f"Damage: {enemy.damage}")
-            print(f"Defense: {enemy.get_effective_defense()}")
-            print("\nEquipment:")
-            if enemy.inventory.equipped_weapon:
-                print(f"Weapon: {enemy.inventory.equipped_weapon.name} (+{enemy.inventory.equipped_weapon.damage_bonus} Damage)")
-            else:
-                print("Weapon: None")
-            if enemy.inventory.equipped_armor:
-                print(f"Armor: {enemy.inventory.equipped_armor.name} (+{enemy.inventory.equipped_armor.defense_bonus} Defense)")
-            else:
-                print("Armor: None")
-            print("====================================")
-            
-            # Player's turn
-            action = get_valid_input("Choose action (attack/use item/equip): ", ["attack", "use item", "equip"])
-            
-            if action == "0":  # attack
-                damage = player.attack(enemy)
-                print(f"You dealt {damage} damage to {enemy.name}")
-            elif action == "1":  # use item
-                item_name = input("Enter item name to use: ").strip()
-                result = player.use_item(item_name)
-                print(result)
-            elif action == "2":  # equip
-                item_name = input("Enter item name to equip: ").strip()
-                result = player.equip_item(item_name)
-                print(result)
-            
-            # Check if enemy is defeated
-            if enemy.get_health() <= 0:
-                print(f"\nVictory! You defeated {enemy.name}")
-                return True
-            
-            # Enemy's turn
-            print("\nEnemy's turn!")
-            if isinstance(enemy, Boss):
-                enemy.special_ability()
-            damage = enemy.attack(player)
-            print(f"{enemy.name} dealt {damage} damage to you")
-            
-            # Check if player is defeated
-            if player.get_health() <= 0:
-                print(f"\nDefeat! You were defeated by {enemy.name}")
-                return False
-        
-        return False
+        return run_steps(self.fight_steps(player, enemy, self.renderer), self.read_line)
 
-    def handle_boss_battles(self) -> None:
-        """Handle boss battles until the game ends."""
-        while self.current_level <= len(self.bosses):
-            print(f"\nYou have entered level {self.current_level}")
-            print("First, you must defeat the villains!")
-            
-            # Fight villains first
-            for villain in self.villains[self.current_level]:
-                print(f"\nYou face {villain.name}!")
-                if not self.combat(self.player, villain):
-                    break
+    def fight_steps(self, player: Character, enemy: Character,
+                    renderer: Optional[FrameRenderer] = None) -> Steps[bool]:
+        """
+        One fight as a dialogue, asking for the player's action each round.
+        
+        The player policy, if the game has one, chooses instead of asking.
+        
+        Args:
+            player: The player character
+            enemy: The enemy character
+            renderer: Draws the status screen as a frame (written as plain lines if omitted)
             
-            # If player is still alive, fight the boss
-            if self.player.get_health() > 0:
-                print(f"\nYou have defeated all villains! Now face the boss!")
-                print(f"Prepare to fight {self.bosses[self.current_level].name}!")
-                
-                if self.combat(self.player, self.bosses[self.current_level]):
-                    self.current_level += 1
-                    print(f"\nVictory! You defeated {self.bosses[self.current_level - 1].name}")
-                    print(f"You advance to level {self.current_level}")
+        Returns:
+            True if player wins, False if enemy wins
+        """
+        observer = self.combat_observer(ConsoleCombatObserver(self.write, renderer))
+        steps = CombatEngine(observer=observer, enemy_policy=self.enemy_policy).fight(player, enemy)
+        try:
+            next(steps)
+            while True:
+                if self.player_policy:
+                    choice = self.player_policy(player, enemy)
                 else:
-                    break
-            else:
-                break
+                    choice = yield from self.combat_action_steps()
+                steps.send(choice)
+        except StopIteration as finished:
+            return finished.value.player_won
+
+    def combat_observer(self, console: CombatObserver) -> CombatObserver:
+        """
+        Combine a host's narration with this game's event log and metrics.
+        
+        Args:
+            console: Observer that narrates the fight to the player
             
-        # Check if game is over
-        if self.current_level > len(self.bosses):
-            print("\nCongratulations! You have defeated all the bosses!")
-        else:
-            print("\nGame Over!")
+        Returns:
+            The observer to give the combat engine for a fight on the current level
+        """
+        observer = console
+        if self.event_log:
+            observer = ObserverGroup(observer, EventLogObserver(self.event_log, self.current_level))
+        if self.metrics:
+            observer = ObserverGroup(observer, self.metrics.observer(self.current_level))
+        return observer
 
-    def end_game(self, victory: bool) -> None:
-        """End the game with appropriate message."""
-        print_border()
-        if victory:
-            print("Congratulations! You have defeated all the bosses!")
-            print("The realm is now safe from evil forces!")
-        else:
-            print("Game Over! The evil forces have triumphed...")
-            print("Better luck next time!")
-        print_border()
-        press_enter()
+    def choose_combat_action(self, player: Character, enemy: Character) -> Tuple[CombatAction, Optional[str]]:
+        """
+        Ask the player for their combat action.
+        
+        Args:
+            player: The player character
+            enemy: The enemy character
+            
+        Returns:
+            Tuple of (action, item name for item actions)
+        """
+        return run_steps(self.combat_action_steps(), self.read_line)
+
+    def combat_action_steps(self) -> Steps[Tuple[CombatAction, Optional[str]]]:
+        """
+        Ask for the player's combat action, as a dialogue.
+        
+        Returns:
+            Tuple of (action, item name for item actions; empty if input ran out)
+        """
+        action = yield from command_steps(COMBAT_COMMANDS, "Choose action (attack/use item/equip): ", self.write)
+        if action is CombatAction.ATTACK:
+            return action, None
+        verb = "use" if action is CombatAction.USE_ITEM else "equip"
+        try:
+            return action, (yield f"Enter item name to {verb}: ").strip()
+        except EOFError:
+            return action, ""
 
-    def get_combat_action(self) -> str:
+    def get_combat_action(self) -> CombatAction:
         """Get player's combat action choice."""
-        options = ["attack", "use item", "equip"]
-        return get_valid_input("\nChoose action (attack/use item/equip): ", options)
+        return read_command(COMBAT_COMMANDS, "\nChoose action (attack/use item/equip): ", self.read_input)
 
     def use_item(self, player: Character) -> None:
         """Handle item usage in combat."""
         player.display_inventory()
-        item_name = input("Enter item name to use (or press Enter to cancel): ").capitalize()
+        item_name = self.read_input("Enter item name to use (or press Enter to cancel): ").capitalize()
         if item_name:
             result = player.use_item(item_name)
             print(result)
@@ -220,10 +342,10 @@ class Game:
     def equip_item(self, player: Character) -> None:
         """Handle equipment management in combat."""
         player.display_inventory()
-        item_type = get_valid_input("\nChoose item type to equip (weapon/armor): ", ["weapon", "armor"])
+        slot = read_command(EQUIP_SLOTS, "\nChoose item type to equip (weapon/armor): ", self.read_input)
         
-        if item_type == "weapon":
-            weapon_name = input("Enter weapon name to equip (or press Enter to cancel): ").capitalize()
+        if slot is EquipSlot.WEAPON:
+            weapon_name = self.read_input("Enter weapon name to equip (or press Enter to cancel): ").capitalize()
             if weapon_name:
                 weapon = player.inventory.items.get(weapon_name)
                 if isinstance(weapon, Weapon):
@@ -232,7 +354,7 @@ class Game:
                     else:
                         print("Weapon not found in inventory")
         else:
-            armor_name = input("Enter armor name to equip (or press Enter to cancel): ").capitalize()
+            armor_name = self.read_input("Enter armor name to equip (or press Enter to cancel): ").capitalize()
             if armor_name:
                 armor = player.inventory.items.get(armor_name)
                 if isinstance(armor, Armor):
@@ -249,55 +371,165 @@ class Game:
         print("\nEnemy Stats:")
         enemy.display()
         print("====================================")
-        press_enter()
+        press_enter(self.read_input)
 
     def print_victory_message(self, enemy: Character) -> None:
         """Display victory message."""
         print_border()
         print(f"Victory! You defeated {enemy.name}.")
         print_border()
-        press_enter()
+        press_enter(self.read_input)
 
     def print_defeat_message(self, enemy: Character) -> None:
         """Display defeat message."""
         print_border()
         print(f"Defeat! You were defeated by {enemy.name}.")
         print_border()
-        press_enter()
+        press_enter(self.read_input)
 
-    def handle_boss_battles(self) -> None:
-        """Handle all boss battles in sequence."""
+    def campaign(self) -> Generator[Optional[Character], bool, bool]:
+        """
+        Walk the campaign one fight at a time, from the current level on.
+        
+        Yields each enemy the player must fight next, or None where the host
+        should wait for the player before going on; after each fight the host
+        sends back whether the player won. Narration goes through write.
+        
+        Design Decisions:
+        - The level flow lives here once; hosts only supply how a fight is
+          played and how they wait, so the console game, the session server
+          and the simulator all play the same campaign
+        - Each level's villains are fought in order before its boss
+        - Enemies already at 0 HP are passed over, so a game restored from a
+          snapshot taken mid-level carries on after the last enemy beaten
+        
+        Returns:
+            True if every level was cleared, False if the player fell
+        """
         while self.current_level <= len(self.bosses):
-            current_boss = self.bosses[self.current_level]
-            print_border()
-            print(f"\nYou have entered the lair of the {current_boss.name}.")
-            print("He is known for his strength and brutality. Prepare for battle!")
-            print_border()
-            press_enter()
-            
-            combat_state = CombatState(current_boss)
-            if not combat_state.handle(self):
-                break
-            
-            self.current_level += 1
+            level = self.current_level
+            self.write(f"\nYou have entered level {level}")
+            self.write("First, you must defeat the villains!")
+            for villain in self.villains[level]:
+                if villain.get_health() <= 0:
+                    continue
+                self.write(f"\nYou face {villain.name}!")
+                if not (yield villain):
+                    return False
+            boss = self.bosses[level]
+            if boss.get_health() > 0:
+                self.write(BORDER)
+                self.write(f"\nYou have defeated all villains! Now you enter the lair of the {boss.name}.")
+                self.write("He is known for his strength and brutality. Prepare for battle!")
+                self.write(BORDER)
+                yield None
+                if not (yield boss):
+                    return False
+            self.advance_level()
+            if self.current_level <= len(self.bosses):
+                self.write(f"You advance to level {self.current_level}")
+        return True
+
+    def handle_boss_battles(self) -> None:
+        """Play the campaign on the console until it is won or lost."""
+        run_steps(self.campaign_steps(self.renderer), self.read_line)
+
+    def campaign_steps(self, renderer: Optional[FrameRenderer] = None) -> Steps[bool]:
+        """
+        Play campaign() as a dialogue, asking for each fight's actions and pause.
+        
+        Args:
+            renderer: Draws the combat status screen as a frame (plain lines if omitted)
+        
+        Returns:
+            True if every level was cleared, False if the player fell
+        """
+        flow = self.campaign()
+        try:
+            enemy = next(flow)
+            while True:
+                if enemy is None:
+                    yield from self.press_enter_steps()
+                    enemy = next(flow)
+                else:
+                    enemy = flow.send((yield from self.fight_steps(self.player, enemy, renderer)))
+        except StopIteration as finished:
+            self.end_game(finished.value)
+            return finished.value
 
     def end_game(self, victory: bool) -> None:
         """End the game with appropriate message."""
-        print_border()
+        self.write(BORDER)
         if victory:
-            print("Congratulations! You have defeated all the bosses!")
-            print("The realm is now safe from evil forces!")
+            self.write("Congratulations! You have defeated all the bosses!")
+            self.write("The realm is now safe from evil forces!")
         else:
-            print("Game Over! The evil forces have triumphed...")
-            print("Better luck next time!")
-        print_border()
-        press_enter()
-
-class CombatState:
-    """State for handling combat."""
-    def __init__(self, enemy: Character):
-        self.enemy = enemy
-    
-    def handle(self, game: Game) -> bool:
-        """Handle combat with the enemy."""
-        return game.combat(game.player, self.enemy)
+            self.write("Game Over! The evil forces have triumphed...")
+            self.write("Better luck next time!")
+        self.write(BORDER)
+        if self.event_log:
+            self.event_log.flush()
+        flush_logging()
+
+    def close(self) -> None:
+        """Close the event log, if there is one; the game is finished afterwards."""
+        if self.event_log:
+            self.event_log.close()
+
+    def __enter__(self) -> "Game":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class ConsoleCombatObserver(CombatObserver):
+    """Narrates combat engine events on the console."""
+    def __init__(self, write: Callable[[str], None] = print,
+                 renderer: Optional[FrameRenderer] = None):
+        """
+        Args:
+            write: Outputs one line of narration
+            renderer: Draws the status screen as a frame (written as plain lines if omitted)
+        """
+        self.write = write
+        self.renderer = renderer
+
+    def on_round_start(self, player: Character, enemy: Character, round_number: int) -> None:
+        """Show both combatants before the player acts."""
+        # Same lines as the screen printed before frames were batched,
+        # starting with a blank line
+        frame = ["", "=============> COMBAT <=============",
+                 "", "Player Stats:", *player.status_lines(empty_bonus=False),
+                 "", "Enemy Stats:", *enemy.status_lines(empty_bonus=False),
+                 "===================================="]
+        if not self.renderer:
+            self.write("\n".join(frame))
+            return
+        if round_number == 1:
+            self.renderer.reset()
+        self.renderer.render(frame)
+
+    def on_player_action(self, player: Character, enemy: Character,
+                         action: CombatAction, damage: int, message: str) -> None:
+        """Report the result of the player's action."""
+        if self.renderer:
+            # The player has answered, so last round's messages can go
+            self.renderer.settle()
+        self.write(message)
+
+    def on_enemy_turn(self, player: Character, enemy: Character) -> None:
+        """Announce the enemy's turn and any boss ability."""
+        self.write("\nEnemy's turn!")
+        if isinstance(enemy, Boss):
+            enemy.special_ability()
+
+    def on_enemy_attack(self, player: Character, enemy: Character, damage: int) -> None:
+        """Report the enemy's damage."""
+        self.write(f"{enemy.name} dealt {damage} damage to you")
+
+    def on_combat_end(self, player: Character, enemy: Character, player_won: bool) -> None:
+        """Report victory or defeat."""
+        if player_won:
+            self.write(f"\nVictory! You defeated {enemy.name}")
+        else:
+            self.write(f"\nDefeat! You were defeated by {enemy.name}")
@@ -1,7 +1,19 @@
-"""Module for game logging functionality."""
+"""Module for game logging functionality.
 
+Design Decisions:
+- Logging is synchronous by default, which keeps simple scripts simple
+- Queue mode hands records to a background thread that writes them in
+  batches, so game code never waits on the disk
+- The queue is bounded; when it is full new records are dropped and counted
+  rather than blocking the game
+"""
+
+import atexit
 import logging
-from datetime import datetime
+import queue
+import threading
+from logging.handlers import QueueHandler
+from typing import List, Optional
 
 # Configure logging
 logging.basicConfig(
@@ -13,6 +25,13 @@ logging.basicConfig(
     ]
 )
 
+LOG_LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+}
+
 class GameLogger:
     """Class for handling game logging."""
     def __init__(self):
@@ -27,24 +46,241 @@ class GameLogger:
             message: Message to log
             level: Logging level (info, warning, error, debug)
         """
-        log_func = getattr(self.logger, level.lower())
-        log_func(message)
+        self.logger.log(LOG_LEVELS[level.lower()], message)
 
     def info(self, message: str) -> None:
         """Log an info message."""
-        self.log(message)
+        self.logger.info(message)
 
     def warning(self, message: str) -> None:
         """Log a warning message."""
-        self.log(message, 'warning')
+        self.logger.warning(message)
 
     def error(self, message: str) -> None:
         """Log an error message."""
-        self.log(message, 'error')
+        self.logger.error(message)
 
     def debug(self, message: str) -> None:
         """Log a debug message."""
-        self.log(message, 'debug')
+        self.logger.debug(message)
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Queue handler that never blocks the caller.
+
+    Design Decisions:
+    - Records are queued as they are; formatting happens on the writer thread
+    - A full queue drops the record and counts it instead of waiting
+    """
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BatchLogWriter(threading.Thread):
+    """Background thread that drains the log queue and writes in batches.
+
+    Design Decisions:
+    - Each batch is formatted per handler and written with a single write and
+      a single flush, instead of one of each per record
+    - A flush request is queued like a record, so it completes only after
+      everything logged before it is on disk
+    - Stopping is also requested through the queue, so no records are lost
+    """
+    def __init__(self, log_queue: queue.Queue, handlers: List[logging.Handler], batch_size: int):
+        super().__init__(name="game-log-writer", daemon=True)
+        self.log_queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self._stop_requested = False
+
+    def run(self) -> None:
+        while not self._stop_requested:
+            batch = [self.log_queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._process(batch)
+
+    def _process(self, batch: list) -> None:
+        """Write queued records and answer any flush or stop requests."""
+        records = []
+        for entry in batch:
+            if isinstance(entry, logging.LogRecord):
+                records.append(entry)
+                continue
+            # Anything else is a control message: write what came before it first
+            self._write(records)
+            records = []
+            if entry is None:
+                self._stop_requested = True
+            else:
+                entry.set()
+        self._write(records)
+
+    def _write(self, records: List[logging.LogRecord]) -> None:
+        """Write records to every handler with one write per handler.
+
+        A record that fails to format or a write that fails is reported
+        through the handler's handleError, like Handler.emit does, so one
+        bad record never stops the writer thread.
+        """
+        if not records:
+            return
+        for handler in self.handlers:
+            wanted = [record for record in records if record.levelno >= handler.level and handler.filter(record)]
+            if not wanted:
+                continue
+            if not isinstance(handler, logging.StreamHandler):
+                for record in wanted:
+                    # emit() reports its own errors through handleError
+                    handler.handle(record)
+                continue
+            lines = []
+            for record in wanted:
+                try:
+                    lines.append(handler.format(record))
+                except Exception:
+                    handler.handleError(record)
+            if not lines:
+                continue
+            handler.acquire()
+            try:
+                handler.stream.write(handler.terminator.join(lines) + handler.terminator)
+                handler.flush()
+            except Exception:
+                handler.handleError(wanted[0])
+            finally:
+                handler.release()
+
+    def request_flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every record queued so far has been written.
+
+        Returns:
+            True if the flush finished within the timeout, which also bounds
+            the wait for room in a full queue
+        """
+        done = threading.Event()
+        try:
+            self.log_queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def request_stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write everything queued so far, then end the thread.
+
+        Returns:
+            True if the thread stopped within the timeout; the same timeout
+            bounds the wait for room in a full queue
+        """
+        try:
+            self.log_queue.put(None, timeout=timeout)
+        except queue.Full:
+            return False
+        self.join(timeout)
+        return not self.is_alive()
+
+    def drain(self) -> None:
+        """Write whatever is still queued, on the calling thread; only call once this thread has stopped."""
+        batch = []
+        while True:
+            try:
+                batch.append(self.log_queue.get_nowait())
+            except queue.Empty:
+                break
+        self._process(batch)
+
+
+_queue_handler: Optional[_DroppingQueueHandler] = None
+_writer: Optional[BatchLogWriter] = None
+_direct_handlers: List[logging.Handler] = []
+
+
+def enable_queue_logging(max_queue_size: int = 10000, batch_size: int = 256) -> None:
+    """
+    Route all logging through a bounded queue and a background writer.
+
+    Args:
+        max_queue_size: Records held before new ones are dropped
+        batch_size: Most records written per batch
+    """
+    global _queue_handler, _writer, _direct_handlers
+    if _writer is not None:
+        return
+    root = logging.getLogger()
+    _direct_handlers = list(root.handlers)
+    log_queue: queue.Queue = queue.Queue(max_queue_size)
+    _writer = BatchLogWriter(log_queue, _direct_handlers, batch_size)
+    _queue_handler = _DroppingQueueHandler(log_queue)
+    for handler in _direct_handlers:
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+    _writer.start()
+
+
+def flush_logging(timeout: Optional[float] = 5.0) -> bool:
+    """
+    Wait until everything logged so far has been written.
+
+    Returns:
+        True if the flush finished (always True in synchronous mode)
+    """
+    if _writer is None:
+        return True
+    return _writer.request_flush(timeout)
+
+
+def disable_queue_logging(timeout: Optional[float] = 5.0) -> bool:
+    """
+    Write out pending records and go back to synchronous logging.
+
+    If the writer does not stop within the timeout, queue mode stays in
+    place, since restoring the direct handlers would leave two threads
+    writing to the same files; calling this again retries.
+
+    Returns:
+        True if synchronous logging was restored
+    """
+    global _queue_handler, _writer, _direct_handlers
+    if _writer is None:
+        return True
+    if not _writer.request_stop(timeout):
+        logging.getLogger(__name__).warning(
+            "Log writer did not stop within %s seconds; keeping queued logging", timeout)
+        return False
+    root = logging.getLogger()
+    root.removeHandler(_queue_handler)
+    # The writer has stopped, so anything queued after the stop request is written here
+    _writer.drain()
+    for handler in _direct_handlers:
+        root.addHandler(handler)
+    _queue_handler = None
+    _writer = None
+    _direct_handlers = []
+    return True
+
+
+def dropped_log_records() -> int:
+    """Number of records dropped because the queue was full."""
+    return _queue_handler.dropped if _queue_handler else 0
+
+
+# Pending records are written even if the game exits without cleaning up
+atexit.register(disable_queue_logging)
 
 # Create a singleton instance of GameLogger
 logger = GameLogger()
@@ -0,0 +1,252 @@
+"""Module for hosting many game sessions in one process with asyncio.
+
+Design Decisions:
+- Each connection gets its own Game and a SessionIO channel; waiting for a
+  player's next line is a suspended coroutine rather than a blocked thread,
+  so thousands of mostly idle sessions fit in a single process
+- The session plays the same Game dialogue as the console game, awaiting
+  input at each prompt instead of blocking, so the game's text and its
+  level and fight rules live in one place
+- Each Game is given the session's write function, which it also routes
+  enemy flavour text and combat narration through, so nothing a session
+  says ever reaches the server's own stdout
+
+Usage:
+    python game_server.py --port 7777
+    python game_server.py --unix /tmp/rpg.sock
+    python game_server.py --port 7777 --metrics-port 9100
+"""
+
+import argparse
+import asyncio
+from typing import List, Optional
+from game import Game
+from levels import EndlessLevelProvider
+from commands import run_steps_async
+from metrics import GameMetrics, METRICS, install_item_metrics, start_metrics_server
+from game_logger import logger
+
+DEFAULT_IDLE_TIMEOUT = 600.0
+DEFAULT_MAX_SESSIONS = 10000
+
+
+class SessionIO:
+    """Line-based input and output for one connected player.
+
+    Design Decisions:
+    - write() only buffers, so it can be handed to synchronous hooks such as
+      Character.narrate; output is sent whenever the session waits for input
+    - End of input and idle timeouts raise EOFError, matching input(); the
+      session treats it as the player leaving
+    """
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT):
+        """
+        Args:
+            reader: Stream the player's input arrives on
+            writer: Stream output is sent to
+            idle_timeout: Seconds to wait for a line before giving up (None waits forever)
+        """
+        self.reader = reader
+        self.writer = writer
+        self.idle_timeout = idle_timeout
+        self.closed = False
+
+    def write(self, text: str = "") -> None:
+        """Queue one line of output."""
+        if not self.closed:
+            self.writer.write(f"{text}\n".encode("utf-8"))
+
+    async def read_line(self, prompt: str) -> str:
+        """
+        Send a prompt and wait for the player's reply.
+
+        Args:
+            prompt: Text shown before the reply
+
+        Returns:
+            The line without its line ending
+
+        Raises:
+            EOFError: If the connection ended, timed out or was already closed
+        """
+        if self.closed:
+            raise EOFError
+        self.writer.write(prompt.encode("utf-8"))
+        try:
+            await self.writer.drain()
+            line = await asyncio.wait_for(self.reader.readline(), self.idle_timeout)
+        except (asyncio.TimeoutError, ConnectionError):
+            line = b""
+        if not line:
+            self.closed = True
+            raise EOFError
+        return line.decode("utf-8", errors="replace").rstrip("\r\n")
+
+    async def close(self) -> None:
+        """Flush remaining output and close the connection."""
+        self.closed = True
+        try:
+            await self.writer.drain()
+            self.writer.close()
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class SessionClosed(Exception):
+    """Raised when a player's connection ends or times out, to drop their session."""
+
+
+class AsyncGameSession:
+    """Plays one game over a SessionIO channel.
+
+    Design Decisions:
+    - The session plays Game.session_steps(), the same dialogue the console
+      game reads through run_steps(), so the text and the flow live in Game
+    - The first end of input drops the session instead of answering the
+      remaining prompts with defaults, which would play the rest of the game
+      without ever yielding to the event loop
+    """
+    def __init__(self, game: Game, io: SessionIO):
+        """
+        Args:
+            game: Game holding this session's state
+            io: Channel to the player
+        """
+        self.game = game
+        self.io = io
+
+    async def read_line(self, prompt: str) -> str:
+        """
+        Read the player's reply to a prompt.
+
+        Raises:
+            SessionClosed: If the connection ended or timed out
+        """
+        try:
+            return await self.io.read_line(prompt)
+        except EOFError:
+            raise SessionClosed from None
+
+    async def run(self) -> Game:
+        """
+        Play the whole session and return the finished game.
+
+        Raises:
+            SessionClosed: If the player left before the game ended
+        """
+        await run_steps_async(self.game.session_steps(), self.read_line)
+        return self.game
+
+
+class GameServer:
+    """Accepts connections and runs an AsyncGameSession for each.
+
+    Design Decisions:
+    - Sessions share nothing but the event loop; a failing session is logged
+      and closed without affecting the others
+    - A session cap turns new players away politely rather than letting one
+      process grow without bound
+    """
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS,
+                 idle_timeout: Optional[float] = DEFAULT_IDLE_TIMEOUT,
+                 seed: Optional[int] = None, endless: bool = False,
+                 metrics: Optional[GameMetrics] = None):
+        """
+        Args:
+            max_sessions: Concurrent sessions allowed
+            idle_timeout: Seconds a session may wait for input before it is dropped
+            seed: Base seed; session n uses seed + n (unseeded if omitted)
+            endless: Play generated levels without end instead of the standard campaign
+            metrics: Optional metrics every session's fights are recorded into
+        """
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.seed = seed
+        self.endless = endless
+        self.metrics = metrics
+        self.active_sessions = 0
+        self.sessions_started = 0
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    def _next_seed(self) -> Optional[int]:
+        return None if self.seed is None else self.seed + self.sessions_started
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Run one session for a new connection."""
+        io = SessionIO(reader, writer, self.idle_timeout)
+        if self.active_sessions >= self.max_sessions:
+            io.write("The server is full, please try again later.")
+            await io.close()
+            return
+        self.active_sessions += 1
+        seed = self._next_seed()
+        provider = EndlessLevelProvider(seed=seed or 0) if self.endless else None
+        game = Game(level_provider=provider, seed=seed, metrics=self.metrics, write=io.write)
+        self.sessions_started += 1
+        try:
+            await AsyncGameSession(game, io).run()
+        except SessionClosed:
+            logger.info("Session closed before the game ended")
+        except Exception as error:
+            logger.error(f"Session ended with an error: {error}")
+        finally:
+            self.active_sessions -= 1
+            game.release_enemies()
+            await io.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 7777,
+                    unix_path: Optional[str] = None) -> asyncio.AbstractServer:
+        """
+        Start listening on a TCP port, or on a Unix socket if a path is given.
+
+        Returns:
+            The listening asyncio server
+        """
+        if unix_path:
+            self.server = await asyncio.start_unix_server(self.handle_connection, unix_path)
+        else:
+            self.server = await asyncio.start_server(self.handle_connection, host, port)
+        return self.server
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 7777,
+                            unix_path: Optional[str] = None) -> None:
+        """Start the server and run until cancelled."""
+        server = await self.start(host, port, unix_path)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point for the session server."""
+    parser = argparse.ArgumentParser(description="Serve many game sessions from one process.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=7777, help="TCP port to listen on")
+    parser.add_argument("--unix", default=None, help="listen on this Unix socket instead of TCP")
+    parser.add_argument("--max-sessions", type=int, default=DEFAULT_MAX_SESSIONS, help="concurrent session limit")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="seconds to wait for input before dropping a session")
+    parser.add_argument("--seed", type=int, default=None, help="base seed for session rngs")
+    parser.add_argument("--endless", action="store_true", help="play generated levels without end")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="serve Prometheus metrics on this local port")
+    args = parser.parse_args(argv)
+
+    metrics = None
+    if args.metrics_port is not None:
+        metrics = METRICS
+        install_item_metrics(metrics)
+        start_metrics_server(args.metrics_port, metrics=metrics)
+        print(f"Serving metrics on 127.0.0.1:{args.metrics_port}/metrics")
+    server = GameServer(args.max_sessions, args.idle_timeout, args.seed, args.endless, metrics)
+    address = args.unix or f"{args.host}:{args.port}"
+    print(f"Serving game sessions on {address}")
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""Module for opt-in timing of the game's main phases.
+
+Design Decisions:
+- Instrumentation is installed by wrapping methods in place when it is
+  enabled and restoring the originals when it is disabled, so a game that
+  never enables it runs exactly the same code as before
+- Each phase keeps a call count, total and maximum time and a histogram
+  with power-of-two nanosecond buckets, which is enough for percentile
+  estimates at a fixed, small cost per call
+- A phase entered again while it is already running (for example
+  use_consumable removing an item) is counted once, at the outer call
+- Classes that copied method functions before instrumentation was enabled,
+  such as the compact entities, keep the untimed versions
+- Disabling only restores attributes that still hold this module's wrapper;
+  one wrapped again since (for example by metrics.install_item_metrics) is
+  left alone, and the wrapper inside it passes calls straight through
+
+Usage:
+    RPG_INSTRUMENT_FILE=phases.jsonl python main.py
+"""
+
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from game import Game, ConsoleCombatObserver
+from character import Character
+from villain import Villain
+from inventory import Inventory
+from renderer import FrameRenderer
+from game_logger import GameLogger
+
+HISTOGRAM_BUCKETS = 48
+
+# (owner, attribute, phase) for everything enable_instrumentation() wraps
+TARGETS: List[Tuple[object, str, str]] = [
+    (Game, "combat", "combat"),
+    (Game, "read_line", "input"),
+    (ConsoleCombatObserver, "on_round_start", "render"),
+    (FrameRenderer, "render", "render"),
+    (Character, "attack", "damage"),
+    (Villain, "attack", "damage"),
+    (Character, "take_damage", "damage"),
+    (Inventory, "add_item", "inventory"),
+    (Inventory, "remove_item", "inventory"),
+    (Inventory, "equip_weapon", "inventory"),
+    (Inventory, "equip_armor", "inventory"),
+    (Inventory, "use_consumable", "inventory"),
+    (GameLogger, "log", "logging"),
+    (GameLogger, "info", "logging"),
+    (GameLogger, "warning", "logging"),
+    (GameLogger, "error", "logging"),
+    (GameLogger, "debug", "logging"),
+    (Game, "__init__", "construction"),
+    (Character, "__init__", "construction"),
+]
+
+
+class PhaseStats:
+    """Counters and a latency histogram for one phase."""
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def record(self, elapsed_ns: int) -> None:
+        """Add one timed call."""
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.histogram[min(elapsed_ns.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+    def percentile(self, fraction: float) -> int:
+        """Upper bound in nanoseconds of the bucket holding a percentile."""
+        target = fraction * self.count
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= target:
+                return (1 << bucket) - 1
+        return self.max_ns
+
+    def to_dict(self) -> Dict[str, object]:
+        """Return the statistics as plain data."""
+        return {
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / self.count / 1e3 if self.count else 0.0,
+            "max_us": self.max_ns / 1e3,
+            "p50_us": self.percentile(0.5) / 1e3 if self.count else 0.0,
+            "p99_us": self.percentile(0.99) / 1e3 if self.count else 0.0,
+            "histogram_ns": {(1 << bucket) - 1: count
+                             for bucket, count in enumerate(self.histogram) if count},
+        }
+
+
+_phases: Dict[str, PhaseStats] = {}
+_lock = threading.Lock()
+_state = threading.local()
+_originals: List[Tuple[object, str, Callable, Callable]] = []
+_enabled = False
+_dump_thread: Optional[threading.Thread] = None
+_dump_stop = threading.Event()
+
+
+def _active_phases() -> set:
+    active = getattr(_state, "active", None)
+    if active is None:
+        active = _state.active = set()
+    return active
+
+
+def _record(phase: str, elapsed_ns: int) -> None:
+    with _lock:
+        stats = _phases.get(phase)
+        if stats is None:
+            stats = _phases[phase] = PhaseStats()
+        stats.record(elapsed_ns)
+
+
+def _timed(phase: str, function: Callable) -> Callable:
+    """Wrap a function so its calls are timed under a phase."""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        active = _active_phases()
+        if phase in active:
+            return function(*args, **kwargs)
+        active.add(phase)
+        start = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _record(phase, time.perf_counter_ns() - start)
+            active.discard(phase)
+    return wrapper
+
+
+@contextmanager
+def _timed_block(phase: str) -> Iterator[None]:
+    active = _active_phases()
+    if phase in active:
+        yield
+        return
+    active.add(phase)
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        _record(phase, time.perf_counter_ns() - start)
+        active.discard(phase)
+
+
+@contextmanager
+def _untimed_block() -> Iterator[None]:
+    yield
+
+
+def measure(phase: str):
+    """
+    Context manager timing a block under a phase while instrumentation is enabled.
+
+    Args:
+        phase: Name the time is recorded under
+    """
+    return _timed_block(phase) if _enabled else _untimed_block()
+
+
+def instrumented(phase: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator timing a function under a phase while instrumentation is enabled.
+
+    When disabled, each call costs one flag check.
+    """
+    def decorate(function: Callable) -> Callable:
+        timed = _timed(phase, function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _enabled:
+                return timed(*args, **kwargs)
+            return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def enable_instrumentation() -> None:
+    """Wrap every target in TARGETS so its calls are timed."""
+    global _enabled
+    if _enabled:
+        return
+    for owner, attribute, phase in TARGETS:
+        # Only wrap what the owner defines itself; inherited methods are wrapped on their base class
+        original = vars(owner)[attribute]
+        wrapper = instrumented(phase)(original)
+        _originals.append((owner, attribute, original, wrapper))
+        setattr(owner, attribute, wrapper)
+    _enabled = True
+
+
+def disable_instrumentation() -> None:
+    """Put back every original method still wrapped by this module; collected statistics are kept."""
+    global _enabled
+    while _originals:
+        owner, attribute, original, wrapper = _originals.pop()
+        # Putting the original back over someone else's wrapper would remove theirs too
+        if vars(owner).get(attribute) is wrapper:
+            setattr(owner, attribute, original)
+    _enabled = False
+
+
+def instrumentation_enabled() -> bool:
+    """Return True while instrumentation is installed."""
+    return _enabled
+
+
+def snapshot() -> Dict[str, Dict[str, object]]:
+    """Return the statistics of every phase seen so far."""
+    with _lock:
+        return {phase: stats.to_dict() for phase, stats in sorted(_phases.items())}
+
+
+def reset() -> None:
+    """Forget all collected statistics."""
+    with _lock:
+        _phases.clear()
+
+
+def dump(path: str) -> None:
+    """Append the current snapshot to a file as one JSON line."""
+    with open(path, "a") as dump_file:
+        dump_file.write(json.dumps({"time": time.time(), "phases": snapshot()}) + "\n")
+
+
+def start_periodic_dump(path: str, interval: float = 10.0) -> None:
+    """
+    Append a snapshot to a file every interval seconds on a background thread.
+
+    Args:
+        path: JSON lines file to append to
+        interval: Seconds between dumps
+    """
+    global _dump_thread
+    if _dump_thread is not None:
+        return
+    _dump_stop.clear()
+
+    def run() -> None:
+        while not _dump_stop.wait(interval):
+            dump(path)
+
+    _dump_thread = threading.Thread(target=run, name="instrumentation-dump", daemon=True)
+    _dump_thread.start()
+
+
+def stop_periodic_dump(path: Optional[str] = None) -> None:
+    """Stop the dump thread, writing one final snapshot if a path is given."""
+    global _dump_thread
+    if _dump_thread is not None:
+        _dump_stop.set()
+        _dump_thread.join()
+        _dump_thread = None
+    if path:
+        dump(path)
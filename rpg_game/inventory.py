@@ -1,18 +1,23 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TYPE_CHECKING
 import random
+from itertools import count
+
+if TYPE_CHECKING:
+    from weapon import Weapon
+
+# Source of inventory revisions, shared so a revision identifies one inventory state
+next_revision = count(1).__next__
 
 class Item:
-    """Base class for all game items."""
+    """Base class for all game items.
+    
+    Items are shared templates (see items.py), so their attributes must not be
+    changed after creation; per-owner state lives in the owning Inventory.
+    """
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
 
-class Weapon(Item):
-    """Weapon items that provide damage bonus."""
-    def __init__(self, name: str, description: str, damage_bonus: int):
-        super().__init__(name, description)
-        self.damage_bonus = damage_bonus
-
 class Armor(Item):
     """Armor items that provide defense bonus."""
     def __init__(self, name: str, description: str, defense_bonus: int):
@@ -36,23 +41,48 @@ class Consumable(Item):
         return "Consumable used"
 
 class Inventory:
-    """Manages a character's items and equipment."""
+    """Manages a character's items and equipment.
+    
+    Items are shared catalog templates; the remaining charges of each
+    consumable are this inventory's own state and are kept in charges.
+    Only stacks of more than one are recorded, so most inventories keep
+    charges empty. revision changes on every change, so callers can tell
+    whether anything changed without comparing contents. Revisions come
+    from one shared counter, so no two inventories ever hold the same one.
+    weapon_bonus and armor_bonus are kept in step with the equipped items,
+    so combat reads them without checking what is equipped.
+    """
     def __init__(self, max_size: int = 10):
         self.max_size = max_size
         self.items: Dict[str, Item] = {}
-        self.equipped_weapon: Optional[Weapon] = None
+        self.charges: Dict[str, int] = {}
+        self.equipped_weapon: Optional["Weapon"] = None
         self.equipped_armor: Optional[Armor] = None
+        self.weapon_bonus = 0
+        self.armor_bonus = 0
+        self.revision = next_revision()
 
     def add_item(self, item: Item) -> bool:
         """
         Add an item to the inventory.
         
+        A full inventory takes nothing, not even another charge of an item
+        it holds. Otherwise adding a consumable that is already held stacks
+        another charge, and adding any other item already held leaves the
+        inventory as it is.
+        
         Returns:
             True if item was added, False if inventory is full
         """
         if len(self.items) >= self.max_size:
             return False
+        if item.name in self.items:
+            if isinstance(item, Consumable):
+                self.charges[item.name] = self.charges.get(item.name, 1) + 1
+                self.revision = next_revision()
+            return True
         self.items[item.name] = item
+        self.revision = next_revision()
         return True
 
     def remove_item(self, item_name: str) -> Optional[Item]:
@@ -62,9 +92,13 @@ class Inventory:
         Returns:
             The removed item if found, None otherwise
         """
-        return self.items.pop(item_name, None)
+        item = self.items.pop(item_name, None)
+        if item is not None:
+            self.charges.pop(item_name, None)
+            self.revision = next_revision()
+        return item
 
-    def equip_weapon(self, weapon: Weapon) -> bool:
+    def equip_weapon(self, weapon: "Weapon") -> bool:
         """
         Equip a weapon.
         
@@ -73,6 +107,8 @@ class Inventory:
         """
         if weapon.name in self.items:
             self.equipped_weapon = weapon
+            self.weapon_bonus = weapon.damage_bonus
+            self.revision = next_revision()
             return True
         return False
 
@@ -85,9 +121,21 @@ class Inventory:
         """
         if armor.name in self.items:
             self.equipped_armor = armor
+            self.armor_bonus = armor.defense_bonus
+            self.revision = next_revision()
             return True
         return False
 
+    def clear(self) -> None:
+        """Remove every item and unequip everything, keeping the containers."""
+        self.items.clear()
+        self.charges.clear()
+        self.equipped_weapon = None
+        self.equipped_armor = None
+        self.weapon_bonus = 0
+        self.armor_bonus = 0
+        self.revision = next_revision()
+
     def use_consumable(self, consumable_name: str, character) -> str:
         """
         Use a consumable item.
@@ -98,53 +146,31 @@ class Inventory:
         consumable = self.items.get(consumable_name)
         if isinstance(consumable, Consumable):
             message = consumable.use(character)
-            self.remove_item(consumable_name)
+            self._spend_charge(consumable_name)
             return message
         return "Item not found or not consumable"
 
+    def _spend_charge(self, item_name: str) -> None:
+        """Use up one charge, removing the item when none are left."""
+        remaining = self.charges.get(item_name, 1) - 1
+        if remaining <= 0:
+            self.remove_item(item_name)
+            return
+        # A single charge is not recorded, like any unstacked item
+        if remaining > 1:
+            self.charges[item_name] = remaining
+        else:
+            del self.charges[item_name]
+        self.revision = next_revision()
+
     def display_inventory(self) -> None:
         """Display all items in the inventory."""
-        print("\nInventory:")
-        print("-" * 20)
+        lines = ["\nInventory:", "-" * 20]
         for item in self.items.values():
-            print(f"{item.name}: {item.description}")
-        print("\nEquipped:")
-        print("-" * 20)
-        print(f"Weapon: {self.equipped_weapon.name if self.equipped_weapon else 'None'}")
-        print(f"Armor: {self.equipped_armor.name if self.equipped_armor else 'None'}")
-
-# Predefined items
-HEALING_POTION = Consumable(
-    "Healing Potion",
-    "A potion that restores 20 HP",
-    "heal",
-    20
-)
-
-FIREBALL_SCROLL = Consumable(
-    "Fireball Scroll",
-    "A scroll that deals 15 damage",
-    "damage",
-    15
-)
-
-LEATHER_ARMOR = Armor(
-    "Leather Armor",
-    "Light armor that provides moderate defense",
-    3
-)
-
-IRON_HELMET = Armor(
-    "Iron Helmet",
-    "Heavy helmet that provides strong defense",
-    5
-)
-
-# Weapon factory with additional weapons
-WEAPON_FACTORY = {
-    "Rock": Weapon("Rock", "A simple rock", 2),
-    "Paper": Weapon("Paper", "A magical paper", 3),
-    "Scissors": Weapon("Scissors", "Sharp scissors", 4),
-    "Iron Sword": Weapon("Iron Sword", "A sturdy sword", 6),
-    "Magic Staff": Weapon("Magic Staff", "A powerful magical staff", 8)
-}
+            charges = self.charges.get(item.name, 1)
+            suffix = f" (x{charges})" if charges > 1 else ""
+            lines.append(f"{item.name}{suffix}: {item.description}")
+        lines += ["\nEquipped:", "-" * 20,
+                  f"Weapon: {self.equipped_weapon.name if self.equipped_weapon else 'None'}",
+                  f"Armor: {self.equipped_armor.name if self.equipped_armor else 'None'}"]
+        print("\n".join(lines))
@@ -1,42 +1,64 @@
-"""Module containing item definitions and constants."""
+"""Module containing the item catalog.
+
+Design Decisions:
+- Every item template is built exactly once, at import, and shared by every
+  character that holds it (flyweight pattern)
+- Templates are read-only; per-owner state such as consumable charges lives
+  in the owning Inventory, so sharing a template never leaks state
+- One catalog replaces the separate item and weapon factories, so each item
+  name maps to exactly one definition
+- Definitions are read from the content file rather than written out here
+"""
 
 from typing import Dict
+from inventory import Item, Armor, Consumable
+from weapon import Weapon
+from content import load_content
+
+ITEM_CATALOG: Dict[str, Item] = {}
+
+
+def _register(item: Item) -> Item:
+    """Add a template to the catalog, refusing duplicate names."""
+    if item.name in ITEM_CATALOG:
+        raise ValueError(f"Duplicate item template: {item.name}")
+    ITEM_CATALOG[item.name] = item
+    return item
+
+
+def get_item(name: str) -> Item:
+    """
+    Look up a shared item template by name.
+
+    Raises:
+        KeyError: If no item has that name
+    """
+    return ITEM_CATALOG[name]
+
+
+# Every template comes from the content file
+_content = load_content()
+for _entry in _content.consumables:
+    _register(Consumable(_entry["name"], _entry["description"], _entry["effect"], _entry["value"]))
+for _entry in _content.armor:
+    _register(Armor(_entry["name"], _entry["description"], _entry["defense_bonus"]))
+for _entry in _content.weapons:
+    _register(Weapon(_entry["name"], _entry["description"], _entry["damage_bonus"]))
+
+# Templates the game code refers to directly
+HEALING_POTION = get_item("Healing Potion")
+FIREBALL_SCROLL = get_item("Fireball Scroll")
+LEATHER_ARMOR = get_item("Leather Armor")
+IRON_HELMET = get_item("Iron Helmet")
+ROCK = get_item("Rock")
+PAPER = get_item("Paper")
+SCISSORS = get_item("Scissors")
+DAGGER = get_item("Dagger")
+STAFF = get_item("Staff")
+IRON_SWORD = get_item("Iron Sword")
+MAGIC_STAFF = get_item("Magic Staff")
+BOSS_WEAPON = get_item("Boss Weapon")
 
-class Item:
-    """Base class for all items in the game."""
-    def __init__(self, name: str, description: str, effect: Dict[str, int]):
-        self.name = name
-        self.description = description
-        self.effect = effect
-
-class HealingPotion(Item):
-    """A potion that restores health."""
-    def __init__(self):
-        super().__init__(
-            "Healing Potion",
-            "A potion that restores 20 health points.",
-            {"health": 20}
-        )
-
-class FireballScroll(Item):
-    """A scroll that casts a powerful fireball spell."""
-    def __init__(self):
-        super().__init__(
-            "Fireball Scroll",
-            "A scroll that casts a powerful fireball spell, dealing 15 damage.",
-            {"damage": 15}
-        )
-
-class LeatherArmor(Item):
-    """Light armor that provides basic protection."""
-    def __init__(self):
-        super().__init__(
-            "Leather Armor",
-            "Light armor that provides basic protection, increasing defense by 5.",
-            {"defense": 5}
-        )
-
-# Predefined items
-HEALING_POTION = HealingPotion()
-FIREBALL_SCROLL = FireballScroll()
-LEATHER_ARMOR = LeatherArmor()
+WEAPONS: Dict[str, Weapon] = {
+    name: item for name, item in ITEM_CATALOG.items() if isinstance(item, Weapon)
+}
@@ -0,0 +1,219 @@
+"""Module containing level providers and lazily built level tables.
+
+Design Decisions:
+- A level provider decides which enemies make up each level, so other
+  campaigns can be plugged into Game without changing it
+- The default provider reads the line-up from the content file and spawns
+  enemies from its precompiled stats
+- Enemies are spawned through an EntityPool, and providers take back
+  enemies a game is finished with, so long simulations reuse them
+- Levels are only built the first time they are looked up, so sessions that
+  never get past level 1 never pay for levels 2 to 4
+- The lazy table behaves like the dicts Game used before, so len() and
+  indexing keep working unchanged
+- Endless campaigns report ENDLESS_LEVELS levels and generate each one from
+  the level number alone, so any level can be built, dropped and built
+  again without keeping anything from earlier levels
+"""
+
+import sys
+import random
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator, List, Optional, Type
+from boss import Boss, FireBoss, IceBoss
+from villain import Villain, Goblin, Orc, Necromancer, Skeleton
+from content import Content, ContentError, EnemyStats, load_content
+from entity_pool import EntityPool, ENEMY_POOL
+
+
+class LevelProvider:
+    """Interface for objects that build the enemies of each level."""
+    def level_count(self) -> int:
+        """Return the number of levels in the campaign."""
+        raise NotImplementedError
+
+    def build_boss(self, level: int) -> Boss:
+        """Build the boss for a level."""
+        raise NotImplementedError
+
+    def build_villains(self, level: int) -> List[Villain]:
+        """Build the villains fought before a level's boss."""
+        raise NotImplementedError
+
+    def release_enemies(self, enemies: List[Villain]) -> None:
+        """Take back enemies that will not be used again (ignored by default)."""
+
+
+# Classes an enemy's "class" field in the content file may name
+ENEMY_CLASSES: Dict[str, Type[Villain]] = {
+    "Goblin": Goblin,
+    "Orc": Orc,
+    "Necromancer": Necromancer,
+    "Skeleton": Skeleton,
+    "FireBoss": FireBoss,
+    "IceBoss": IceBoss,
+}
+
+
+def spawn_enemy(stats: EnemyStats, level: int, pool: Optional[EntityPool] = None) -> Villain:
+    """
+    Create an enemy from compiled content stats.
+
+    Args:
+        stats: Compiled stats of the enemy type
+        level: Level to spawn it at
+        pool: Pool to reuse a released enemy from (always build a new one if omitted)
+
+    Raises:
+        ContentError: If the stats name a class the game does not have
+    """
+    enemy_class = ENEMY_CLASSES.get(stats.enemy_class)
+    if enemy_class is None:
+        raise ContentError(f"Unknown enemy class {stats.enemy_class!r} for {stats.enemy_id!r}")
+    if pool is None:
+        return enemy_class(level, stats)
+    return pool.acquire(enemy_class, level, stats)
+
+
+class DefaultLevelProvider(LevelProvider):
+    """The campaign described by the content file (four levels as shipped)."""
+    def __init__(self, content: Optional[Content] = None, pool: Optional[EntityPool] = None):
+        """
+        Args:
+            content: Loaded content (the default content file if omitted)
+            pool: Pool enemies are spawned from and released to (the shared ENEMY_POOL if omitted)
+        """
+        self.content = content or load_content()
+        self.pool = pool if pool is not None else ENEMY_POOL
+
+    def level_count(self) -> int:
+        return len(self.content.levels)
+
+    def build_boss(self, level: int) -> Boss:
+        return spawn_enemy(self.content.enemy(self.content.levels[level - 1]["boss"]), level, self.pool)
+
+    def build_villains(self, level: int) -> List[Villain]:
+        return [spawn_enemy(self.content.enemy(enemy_id), level, self.pool)
+                for enemy_id in self.content.levels[level - 1]["villains"]]
+
+    def release_enemies(self, enemies: List[Villain]) -> None:
+        self.pool.release_all(enemies)
+
+
+# Level count of endless campaigns; the largest value len() can report
+ENDLESS_LEVELS = sys.maxsize
+# Villains before an endless level's boss, growing every few levels
+ENDLESS_MIN_VILLAINS = 2
+ENDLESS_MAX_VILLAINS = 6
+ENDLESS_LEVELS_PER_VILLAIN = 5
+
+
+class EndlessLevelProvider(DefaultLevelProvider):
+    """A campaign without an end, generated level by level from the content.
+
+    Design Decisions:
+    - The content's bosses and villains make up the roster; stats scale
+      with the level through the usual content formulas
+    - Each level's line-up comes from a generator seeded with the campaign
+      seed and the level number, so it is the same whenever it is rebuilt
+      and costs a few microseconds to produce
+    - The villain count grows slowly with depth and is capped, so one
+      level never holds more than a handful of enemies
+    """
+    def __init__(self, content: Optional[Content] = None, pool: Optional[EntityPool] = None,
+                 seed: int = 0):
+        """
+        Args:
+            content: Loaded content (the default content file if omitted)
+            pool: Pool enemies are spawned from and released to (the shared ENEMY_POOL if omitted)
+            seed: Seed of the level generator; the same seed gives the same levels
+
+        Raises:
+            ContentError: If the content has no levels to take bosses and villains from
+        """
+        super().__init__(content, pool)
+        levels = self.content.levels
+        self.boss_ids = sorted({level["boss"] for level in levels})
+        self.villain_ids = sorted({enemy_id for level in levels for enemy_id in level["villains"]})
+        if not self.boss_ids:
+            raise ContentError("Endless levels need at least one level in the content")
+        self.seed = seed
+
+    def level_count(self) -> int:
+        return ENDLESS_LEVELS
+
+    def line_up(self, level: int) -> tuple:
+        """
+        Generate a level's enemies.
+
+        Returns:
+            (boss id, list of villain ids)
+        """
+        # String seeds are hashed deterministically, unlike tuples
+        generator = random.Random(f"{self.seed}:{level}")
+        villain_count = min(ENDLESS_MAX_VILLAINS, ENDLESS_MIN_VILLAINS + (level - 1) // ENDLESS_LEVELS_PER_VILLAIN)
+        villains = [generator.choice(self.villain_ids) for _ in range(villain_count)] if self.villain_ids else []
+        return generator.choice(self.boss_ids), villains
+
+    def build_boss(self, level: int) -> Boss:
+        return spawn_enemy(self.content.enemy(self.line_up(level)[0]), level, self.pool)
+
+    def build_villains(self, level: int) -> List[Villain]:
+        return [spawn_enemy(self.content.enemy(enemy_id), level, self.pool)
+                for enemy_id in self.line_up(level)[1]]
+
+
+class LazyLevelTable(Mapping):
+    """Read-only mapping of level number to content, built on first access.
+
+    Design Decisions:
+    - Membership and length come from the level count, so checking them
+      never builds a level
+    - Built entries are cached so each level is constructed at most once
+    """
+    def __init__(self, level_count: int, build: Callable[[int], object]):
+        """
+        Initialise the table.
+
+        Args:
+            level_count: Number of levels, numbered from 1
+            build: Called with a level number to build its content
+        """
+        self._level_count = level_count
+        self._build = build
+        self._built: Dict[int, object] = {}
+
+    def __getitem__(self, level: int):
+        if level in self._built:
+            return self._built[level]
+        if level not in self:
+            raise KeyError(level)
+        content = self._build(level)
+        self._built[level] = content
+        return content
+
+    def __contains__(self, level: object) -> bool:
+        return isinstance(level, int) and 1 <= level <= self._level_count
+
+    def __len__(self) -> int:
+        return self._level_count
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(1, self._level_count + 1))
+
+    def is_built(self, level: int) -> bool:
+        """Return True if the level has already been constructed."""
+        return level in self._built
+
+    def built_levels(self) -> List[int]:
+        """Return the levels currently built, in order."""
+        return sorted(self._built)
+
+    def discard(self, level: int) -> Optional[object]:
+        """
+        Forget a built level, so it is built again if looked up later.
+
+        Returns:
+            The level's content, or None if it was not built
+        """
+        return self._built.pop(level, None)
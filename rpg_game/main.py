@@ -1,11 +1,40 @@
+import os
 from game import Game
+from levels import EndlessLevelProvider
+from metrics import METRICS, install_item_metrics, start_metrics_server, stop_metrics_server
+from game_logger import enable_queue_logging, disable_queue_logging
 
 def main() -> None:
     """Main entry point for the game."""
-    game = Game()
-    game.show_intro()
-    game.setup_game()
-    game.handle_boss_battles()
+    # Log writes happen on a background thread so turns never wait on disk
+    enable_queue_logging()
+    # Phase timing is only loaded when asked for, so normal runs pay nothing
+    instrument_file = os.environ.get("RPG_INSTRUMENT_FILE")
+    if instrument_file:
+        import instrumentation
+        instrumentation.enable_instrumentation()
+        instrumentation.start_periodic_dump(instrument_file)
+    # RPG_METRICS_PORT=<port> serves Prometheus metrics while the game runs
+    metrics_port = os.environ.get("RPG_METRICS_PORT")
+    metrics = metrics_server = None
+    if metrics_port:
+        metrics = METRICS
+        install_item_metrics(metrics)
+        metrics_server = start_metrics_server(int(metrics_port), metrics=metrics)
+    try:
+        # RPG_ENDLESS=<seed> plays generated levels without end
+        endless_seed = os.environ.get("RPG_ENDLESS")
+        game = Game(level_provider=EndlessLevelProvider(seed=int(endless_seed)) if endless_seed else None,
+                    metrics=metrics)
+        game.show_intro()
+        game.setup_game()
+        game.handle_boss_battles()
+    finally:
+        if instrument_file:
+            instrumentation.stop_periodic_dump(instrument_file)
+        if metrics_server:
+            stop_metrics_server(metrics_server)
+        disable_queue_logging()
 
 if __name__ == "__main__":
     main()
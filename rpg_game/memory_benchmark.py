@@ -0,0 +1,113 @@
+"""Module for comparing the memory used by standard and compact entities.
+
+Design Decisions:
+- tracemalloc counts every allocation made while building, including
+  inventories, item dicts and weapons, not just the top-level objects
+- Shared module-level items are created before measuring, so neither side
+  is charged for them
+- Both sides keep the same objects: the player and every level's boss and
+  villains, each with its own inventory. The Game shell around them (rng,
+  renderer, level tables) would be the same on either side and is left out
+- Compact enemies keep their class's special attacks and the inventory
+  they were converted from; what they cannot hold is a per-object narrate
+  or rng override, so they always use the class defaults
+
+Usage:
+    python memory_benchmark.py --sessions 1000 --villains 100000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, List, Optional
+from character import Character
+from villain import Goblin
+from levels import DefaultLevelProvider
+from compact_entities import CompactCharacter, to_compact
+from constants import DEFAULT_PLAYER_NAME, PLAYER_START_HEALTH, PLAYER_START_DAMAGE
+
+
+def measure_bytes(build: Callable[[], object]) -> int:
+    """
+    Measure the memory still held by the object that build returns.
+
+    Args:
+        build: Creates the objects to measure
+
+    Returns:
+        Bytes allocated and kept alive by the build
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def build_standard_session() -> List[object]:
+    """Build a session's player and every level's enemies with the standard classes."""
+    provider = DefaultLevelProvider()
+    entities = [Character(DEFAULT_PLAYER_NAME, PLAYER_START_HEALTH, PLAYER_START_DAMAGE)]
+    for level in range(1, provider.level_count() + 1):
+        entities.append(provider.build_boss(level))
+        entities.extend(provider.build_villains(level))
+    return entities
+
+
+def build_compact_session() -> List[object]:
+    """Build the same player and enemies with the compact classes."""
+    provider = DefaultLevelProvider()
+    entities = [CompactCharacter(DEFAULT_PLAYER_NAME, PLAYER_START_HEALTH, PLAYER_START_DAMAGE)]
+    for level in range(1, provider.level_count() + 1):
+        entities.append(to_compact(provider.build_boss(level)))
+        entities.extend(to_compact(villain) for villain in provider.build_villains(level))
+    return entities
+
+
+def run_benchmark(sessions: int, villains: int) -> dict:
+    """
+    Compare memory use of both representations.
+
+    Args:
+        sessions: Number of sessions to build on each side
+        villains: Number of villains to spawn on each side
+
+    Returns:
+        Dict of bytes per session and bytes per villains batch
+    """
+    # Build once first so imports and shared items are not measured
+    build_standard_session()
+    build_compact_session()
+    return {
+        "standard_bytes_per_session": measure_bytes(lambda: [build_standard_session() for _ in range(sessions)]) / sessions,
+        "compact_bytes_per_session": measure_bytes(lambda: [build_compact_session() for _ in range(sessions)]) / sessions,
+        "standard_bytes_for_villains": measure_bytes(lambda: [Goblin(1) for _ in range(villains)]),
+        "compact_bytes_for_villains": measure_bytes(lambda: [to_compact(Goblin(1)) for _ in range(villains)]),
+        "villains": villains,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point for the memory benchmark."""
+    parser = argparse.ArgumentParser(description="Compare memory of standard and compact entities.")
+    parser.add_argument("--sessions", type=int, default=1000, help="sessions to build")
+    parser.add_argument("--villains", type=int, default=100000, help="villains to spawn")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.sessions, args.villains)
+    standard = results["standard_bytes_per_session"]
+    compact = results["compact_bytes_per_session"]
+    print(f"Bytes per session:   standard {standard:,.0f}  compact {compact:,.0f}  ({compact / standard:.0%})")
+    standard = results["standard_bytes_for_villains"]
+    compact = results["compact_bytes_for_villains"]
+    print(f"Bytes per {args.villains:,} villains: standard {standard:,}  compact {compact:,}  ({compact / standard:.0%})")
+
+
+if __name__ == "__main__":
+    main()
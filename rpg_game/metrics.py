@@ -0,0 +1,430 @@
+"""Module for exporting live game metrics in the Prometheus text format.
+
+Design Decisions:
+- Every thread writes to its own shard, a plain dict it alone updates, so
+  recording a value never takes a lock; the registry only locks the first
+  time a thread records anything, to add that thread's shard
+- A scrape copies each shard and merges the copies, so the combat loop
+  never waits for a reader and shards of finished threads keep counting
+- Combat counts, damage and timings come from a MetricsObserver added next
+  to the game's other combat observers; consumable use is counted by
+  wrapping Inventory.use_consumable only while item metrics are installed
+- The endpoint is http.server on a daemon thread, so serving metrics needs
+  nothing outside the standard library
+
+Usage:
+    RPG_METRICS_PORT=9100 python main.py
+    python game_server.py --port 7777 --metrics-port 9100
+    curl localhost:9100/metrics
+"""
+
+import functools
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from character import Character
+from combat_engine import CombatAction, CombatObserver
+from inventory import Inventory
+from items import Consumable
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Round latency includes the player's thinking time, so the buckets reach a minute
+ROUND_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+COMBAT_ROUND_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55)
+COMBAT_DURATION_BUCKETS = (0.01, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+# Levels deeper than this share one label, so endless games cannot grow the series without bound
+LEVEL_LABEL_LIMIT = 20
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_number(value: Union[int, float]) -> str:
+    if isinstance(value, float) and value == float("inf"):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """Holds metric definitions and the per-thread shards their values live in.
+
+    Design Decisions:
+    - A shard maps (metric name, label values) to a number for counters or
+      to a list of bucket counts plus the sum for histograms
+    - Shards are never removed, so counters never go backwards when a
+      thread that recorded values exits
+    """
+    def __init__(self):
+        self.metrics: Dict[str, Union["Counter", "Histogram"]] = {}
+        self._shards: List[Dict[Tuple[str, LabelValues], object]] = []
+        self._shards_lock = threading.Lock()
+        self._local = threading.local()
+
+    def shard(self) -> Dict[Tuple[str, LabelValues], object]:
+        """Return the calling thread's shard, adding it on first use."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _register(self, metric: Union["Counter", "Histogram"]) -> None:
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric {metric.name!r} is already registered")
+        self.metrics[metric.name] = metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> "Counter":
+        """Create and register a counter."""
+        return Counter(self, name, help_text, labelnames)
+
+    def histogram(self, name: str, help_text: str, buckets: Sequence[float],
+                  labelnames: Sequence[str] = ()) -> "Histogram":
+        """Create and register a histogram."""
+        return Histogram(self, name, help_text, buckets, labelnames)
+
+    def collect(self) -> Dict[Tuple[str, LabelValues], object]:
+        """
+        Merge every shard into one set of values.
+
+        Returns:
+            Mapping of (metric name, label values) to a counter total or
+            to a histogram's bucket counts followed by its sum
+        """
+        with self._shards_lock:
+            shards = list(self._shards)
+        merged: Dict[Tuple[str, LabelValues], object] = {}
+        for shard in shards:
+            # dict() copies the shard in one step, and each histogram series is
+            # copied in one step straight after, so a series later updated in
+            # place is not read twice. observe() adds to a bucket and to the sum
+            # in two steps, though, so a scrape can count an observation in its
+            # bucket before its value reaches _sum; the next scrape catches up.
+            snapshot = [(key, list(value) if isinstance(value, list) else value)
+                        for key, value in dict(shard).items()]
+            for key, value in snapshot:
+                if isinstance(value, list):
+                    total = merged.get(key)
+                    merged[key] = value if total is None else [a + b for a, b in zip(total, value)]
+                else:
+                    merged[key] = merged.get(key, 0) + value
+        return merged
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        values = self.collect()
+        by_metric: Dict[str, List[Tuple[LabelValues, object]]] = {}
+        for (name, labels), value in values.items():
+            by_metric.setdefault(name, []).append((labels, value))
+        lines: List[str] = []
+        for name, metric in self.metrics.items():
+            lines.append(f"# HELP {name} {metric.help_text}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for labels, value in sorted(by_metric.get(name, ())):
+                lines.extend(metric.sample_lines(labels, value))
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """
+        Clear every recorded value; metric definitions are kept.
+
+        For tests only: shards are cleared while their threads may still be
+        writing to them, so a scrape taken meanwhile can see counters go
+        backwards, which Prometheus reads as a restart.
+        """
+        with self._shards_lock:
+            for shard in self._shards:
+                shard.clear()
+
+
+class Counter:
+    """A monotonically increasing count, optionally split by labels."""
+    kind = "counter"
+
+    def __init__(self, registry: MetricsRegistry, name: str, help_text: str,
+                 labelnames: Sequence[str] = ()):
+        """
+        Args:
+            registry: Registry the counter belongs to
+            name: Metric name, ending in _total by convention
+            help_text: One-line description shown in the exposition
+            labelnames: Names of the labels each increment is given values for
+        """
+        self.registry = registry
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        registry._register(self)
+
+    def inc(self, *labels: str, amount: Union[int, float] = 1) -> None:
+        """
+        Add to the count for one set of label values.
+
+        Args:
+            labels: One value per label name, in order
+            amount: Non-negative amount to add
+        """
+        shard = self.registry.shard()
+        key = (self.name, labels)
+        shard[key] = shard.get(key, 0) + amount
+
+    def sample_lines(self, labels: LabelValues, value: Union[int, float]) -> List[str]:
+        """Exposition lines for one labelled series."""
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_number(value)}"]
+
+
+class Histogram:
+    """Counts observations into fixed buckets and keeps their sum.
+
+    Design Decisions:
+    - Each series stores plain per-bucket counts, with one extra bucket for
+      values above the last bound; the cumulative counts and _count are
+      derived at scrape time, so they always agree with each other
+    """
+    kind = "histogram"
+
+    def __init__(self, registry: MetricsRegistry, name: str, help_text: str,
+                 buckets: Sequence[float], labelnames: Sequence[str] = ()):
+        """
+        Args:
+            registry: Registry the histogram belongs to
+            name: Metric name
+            help_text: One-line description shown in the exposition
+            buckets: Increasing upper bounds; +Inf is added automatically
+            labelnames: Names of the labels each observation is given values for
+
+        Raises:
+            ValueError: If the bounds are empty or not increasing
+        """
+        if not buckets or any(a >= b for a, b in zip(buckets, buckets[1:])):
+            raise ValueError("Histogram buckets must be a non-empty increasing sequence")
+        self.registry = registry
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self.labelnames = tuple(labelnames)
+        registry._register(self)
+
+    def observe(self, value: Union[int, float], *labels: str) -> None:
+        """
+        Record one observation.
+
+        Args:
+            value: The observed value
+            labels: One value per label name, in order
+        """
+        shard = self.registry.shard()
+        key = (self.name, labels)
+        series = shard.get(key)
+        if series is None:
+            # Bucket counts, the +Inf bucket, then the running sum
+            series = shard[key] = [0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def sample_lines(self, labels: LabelValues, series: List[Union[int, float]]) -> List[str]:
+        """Exposition lines for one labelled series."""
+        names = self.labelnames + ("le",)
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), series):
+            cumulative += count
+            le = _format_number(float(bound))
+            lines.append(f"{self.name}_bucket{_format_labels(names, labels + (le,))} {cumulative}")
+        label_text = _format_labels(self.labelnames, labels)
+        lines.append(f"{self.name}_sum{label_text} {_format_number(series[-1])}")
+        lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+def level_label(level: int) -> str:
+    """Label value for a level, folding deep endless levels into one series."""
+    return str(level) if level <= LEVEL_LABEL_LIMIT else f"{LEVEL_LABEL_LIMIT}+"
+
+
+class GameMetrics:
+    """The metrics a game session reports.
+
+    Design Decisions:
+    - Combat counts are labelled by level and enemy class name (Goblin,
+      Orc, Necromancer, FireBoss, IceBoss and any class added later)
+    - Consumables are labelled by item name only when the item exists, so
+      mistyped names cannot create new series
+    """
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        """
+        Args:
+            registry: Registry to create the metrics in (a new one if omitted)
+        """
+        self.registry = registry or MetricsRegistry()
+        counter, histogram = self.registry.counter, self.registry.histogram
+        self.combats_started = counter("rpg_combats_started_total", "Combats started.",
+                                       ("level", "enemy_class"))
+        self.combats_won = counter("rpg_combats_won_total", "Combats the player won.",
+                                   ("level", "enemy_class"))
+        self.combats_lost = counter("rpg_combats_lost_total", "Combats the player lost.",
+                                    ("level", "enemy_class"))
+        self.damage_dealt = counter("rpg_damage_dealt_total", "Damage dealt, by who dealt it.",
+                                    ("source", "enemy_class"))
+        self.items_used = counter("rpg_items_used_total", "Consumables used through Inventory.use_consumable.",
+                                  ("item",))
+        self.round_latency = histogram("rpg_round_latency_seconds",
+                                       "Wall time of one combat round, including the player's choice.",
+                                       ROUND_LATENCY_BUCKETS)
+        self.combat_rounds = histogram("rpg_combat_rounds", "Rounds each decided combat lasted.",
+                                       COMBAT_ROUND_BUCKETS, ("enemy_class",))
+        self.combat_duration = histogram("rpg_combat_duration_seconds", "Wall time of each decided combat.",
+                                         COMBAT_DURATION_BUCKETS)
+
+    def observer(self, level: int) -> "MetricsObserver":
+        """Return an observer that records one fight on the given level."""
+        return MetricsObserver(self, level)
+
+    def render(self) -> str:
+        """Return the current values in the Prometheus text format."""
+        return self.registry.render()
+
+
+class MetricsObserver(CombatObserver):
+    """Records one fight's events into GameMetrics.
+
+    Design Decisions:
+    - A round lasts from one round start to the next, or to the end of the
+      fight, so the player's choice and the enemy's turn are both included
+    - A fight cut short by a round cap is counted as started but neither
+      won nor lost, as the engine reports no end for it
+    """
+    def __init__(self, metrics: GameMetrics, level: int):
+        """
+        Args:
+            metrics: Metrics to record into
+            level: Level the fight takes place on
+        """
+        self.metrics = metrics
+        self.level = level_label(level)
+        self.rounds = 0
+        self.started = 0.0
+        self.round_started = 0.0
+
+    def on_round_start(self, player: Character, enemy: Character, round_number: int) -> None:
+        """Count the fight on its first round and time the previous round."""
+        now = time.perf_counter()
+        if round_number == 1:
+            self.metrics.combats_started.inc(self.level, type(enemy).__name__)
+            self.started = now
+        else:
+            self.metrics.round_latency.observe(now - self.round_started)
+        self.round_started = now
+        self.rounds = round_number
+
+    def on_player_action(self, player: Character, enemy: Character,
+                         action: CombatAction, damage: int, message: str) -> None:
+        """Count the damage the player dealt."""
+        if damage:
+            self.metrics.damage_dealt.inc("player", type(enemy).__name__, amount=damage)
+
+    def on_enemy_attack(self, player: Character, enemy: Character, damage: int) -> None:
+        """Count the damage the enemy dealt."""
+        if damage:
+            self.metrics.damage_dealt.inc("enemy", type(enemy).__name__, amount=damage)
+
+    def on_combat_end(self, player: Character, enemy: Character, player_won: bool) -> None:
+        """Count the outcome and record the fight's length."""
+        now = time.perf_counter()
+        metrics = self.metrics
+        enemy_class = type(enemy).__name__
+        (metrics.combats_won if player_won else metrics.combats_lost).inc(self.level, enemy_class)
+        if self.rounds:
+            metrics.round_latency.observe(now - self.round_started)
+            metrics.combat_duration.observe(now - self.started)
+        metrics.combat_rounds.observe(self.rounds, enemy_class)
+
+
+METRICS = GameMetrics()
+
+_original_use_consumable: Optional[Callable] = None
+
+
+def install_item_metrics(metrics: GameMetrics = METRICS) -> None:
+    """Count every consumable used through Inventory.use_consumable."""
+    global _original_use_consumable
+    if _original_use_consumable is not None:
+        return
+    original = _original_use_consumable = Inventory.use_consumable
+    items_used = metrics.items_used
+
+    @functools.wraps(original)
+    def use_consumable(self: Inventory, consumable_name: str, character) -> str:
+        if isinstance(self.items.get(consumable_name), Consumable):
+            items_used.inc(consumable_name)
+        return original(self, consumable_name, character)
+    Inventory.use_consumable = use_consumable
+
+
+def uninstall_item_metrics() -> None:
+    """Restore the original Inventory.use_consumable."""
+    global _original_use_consumable
+    if _original_use_consumable is not None:
+        Inventory.use_consumable = _original_use_consumable
+        _original_use_consumable = None
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves the registry at /metrics."""
+    registry: MetricsRegistry = METRICS.registry
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        # Scrapes every few seconds would otherwise flood stderr
+        pass
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1",
+                         metrics: GameMetrics = METRICS) -> ThreadingHTTPServer:
+    """
+    Serve metrics over HTTP from a daemon thread.
+
+    Args:
+        port: Port to listen on (0 picks a free one)
+        host: Address to listen on; local only by default
+        metrics: Metrics to serve
+
+    Returns:
+        The running server; call shutdown() and server_close() to stop it
+    """
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": metrics.registry})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True)
+    thread.start()
+    return server
+
+
+def stop_metrics_server(server: ThreadingHTTPServer) -> None:
+    """Stop a server started by start_metrics_server()."""
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,169 @@
+"""Module containing automatic player policies for headless play.
+
+Design Decisions:
+- Every policy has the combat engine's PlayerPolicy signature, so the same
+  object drives Game.combat, simulation batches and the session server
+- Policies with settings are small classes rather than closures, so they can
+  be pickled into worker processes
+- Random choices use the player's own rng by default, which keeps seeded
+  games reproducible
+- headless_campaign plays the real game flow, intro to final boss, with no
+  input and all output discarded
+
+Usage:
+    python player_policies.py --policy heal --campaigns 1000
+"""
+
+import argparse
+import contextlib
+import time
+from typing import Dict, List, Optional, Tuple
+from character import Character
+from combat_engine import CombatAction, EnemyPolicy, PlayerPolicy, always_attack
+from inventory import Armor, Consumable
+from items import HEALING_POTION
+from weapon import Weapon
+from game import Game
+from replay import play_session
+
+DEFAULT_HEAL_THRESHOLD = 40
+
+PolicyChoice = Tuple[CombatAction, Optional[str]]
+
+
+def _best_unequipped(player: Character) -> Optional[str]:
+    """Name of an owned weapon or armour that beats what is equipped, if any."""
+    inventory = player.inventory
+    weapon, armor = inventory.equipped_weapon, inventory.equipped_armor
+    best_name, best_gain = None, 0
+    for item in inventory.items.values():
+        if isinstance(item, Weapon):
+            gain = item.damage_bonus - (weapon.damage_bonus if weapon else 0)
+        elif isinstance(item, Armor):
+            gain = item.defense_bonus - (armor.defense_bonus if armor else 0)
+        else:
+            continue
+        if gain > best_gain:
+            best_name, best_gain = item.name, gain
+    return best_name
+
+
+def greedy_policy(player: Character, enemy: Character) -> PolicyChoice:
+    """Equip any better weapon or armour first, then attack every round."""
+    upgrade = _best_unequipped(player)
+    if upgrade:
+        return CombatAction.EQUIP, upgrade
+    return CombatAction.ATTACK, None
+
+
+class ThresholdHealPolicy:
+    """Drinks a Healing Potion when health drops below a cutoff.
+
+    Design Decisions:
+    - Any other round is handed to a fallback policy (greedy by default)
+    """
+    def __init__(self, threshold: int = DEFAULT_HEAL_THRESHOLD, fallback: PlayerPolicy = greedy_policy):
+        """
+        Args:
+            threshold: Heal when health is below this value
+            fallback: Policy used when not healing
+        """
+        self.threshold = threshold
+        self.fallback = fallback
+
+    def __call__(self, player: Character, enemy: Character) -> PolicyChoice:
+        if player.get_health() < self.threshold and HEALING_POTION.name in player.inventory.items:
+            return CombatAction.USE_ITEM, HEALING_POTION.name
+        return self.fallback(player, enemy)
+
+
+class RandomPolicy:
+    """Picks a random action each round, with a random item where one is needed.
+
+    Design Decisions:
+    - Only items the action can actually use are offered, so every choice
+      does something
+    """
+    def __init__(self, rng=None):
+        """
+        Args:
+            rng: Random source (the player's rng if omitted)
+        """
+        self.rng = rng
+
+    def __call__(self, player: Character, enemy: Character) -> PolicyChoice:
+        rng = self.rng or player.rng
+        items = player.inventory.items.values()
+        choices: List[PolicyChoice] = [(CombatAction.ATTACK, None)]
+        choices += [(CombatAction.USE_ITEM, item.name) for item in items if isinstance(item, Consumable)]
+        choices += [(CombatAction.EQUIP, item.name) for item in items if isinstance(item, (Weapon, Armor))]
+        return rng.choice(choices)
+
+
+POLICIES: Dict[str, PlayerPolicy] = {
+    "attack": always_attack,
+    "greedy": greedy_policy,
+    "heal": ThresholdHealPolicy(),
+    "random": RandomPolicy(),
+}
+
+
+def no_input(prompt: str) -> str:
+    """Input function for unattended games: input always ends at once."""
+    raise EOFError
+
+
+class _DiscardOutput:
+    """Write-only stream that throws everything away."""
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+
+def headless_campaign(policy: PlayerPolicy, seed: Optional[int] = None,
+                      enemy_policy: Optional[EnemyPolicy] = None) -> Game:
+    """
+    Play a whole game with a policy in place of the player.
+
+    Args:
+        policy: Chooses the player's combat actions
+        seed: Seed for the game's rng
+        enemy_policy: Optional enemy policy for the game
+
+    Returns:
+        The game in its final state
+    """
+    game = Game(seed=seed, read_input=no_input, player_policy=policy, enemy_policy=enemy_policy)
+    with contextlib.redirect_stdout(_DiscardOutput()):
+        return play_session(game)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Play many headless campaigns and report how far each policy gets."""
+    parser = argparse.ArgumentParser(description="Play headless campaigns with a player policy.")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy", help="player policy")
+    parser.add_argument("--campaigns", type=int, default=1000, help="campaigns to play")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first campaign")
+    args = parser.parse_args(argv)
+
+    policy = POLICIES[args.policy]
+    levels: Dict[int, int] = {}
+    start = time.perf_counter()
+    for seed in range(args.seed, args.seed + args.campaigns):
+        level = headless_campaign(policy, seed).current_level
+        levels[level] = levels.get(level, 0) + 1
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.campaigns} campaigns with the {args.policy} policy in {elapsed:.2f}s "
+          f"({args.campaigns / elapsed:.0f} per second)")
+    for level, count in sorted(levels.items()):
+        print(f"  ended on level {level}: {count}")
+
+
+if __name__ == "__main__":
+    main()
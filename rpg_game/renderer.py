@@ -0,0 +1,147 @@
+"""Module for drawing full-screen frames to the terminal.
+
+Design Decisions:
+- A frame is a list of lines built in memory and sent with a single write
+  and flush, instead of one print call per line
+- Between frames only the lines that changed are redrawn, using ANSI cursor
+  movement, which keeps each round to a few bytes over slow links
+- Round messages under the frame stay on screen until the player has
+  answered the next prompt
+- Output that is not a terminal gets the plain lines with no escape codes,
+  so redirected and headless output reads the same as before
+- Windows consoles have escape-code processing switched on first; a console
+  too old to support it also gets the plain lines
+"""
+
+import os
+import shutil
+import sys
+from functools import lru_cache
+from typing import List, Optional, TextIO
+
+CLEAR_SCREEN = "\033[2J\033[H"
+CLEAR_LINE = "\033[K"
+CLEAR_BELOW = "\033[J"
+SAVE_CURSOR = "\0337"
+RESTORE_CURSOR = "\0338"
+
+# Lines kept free under a frame for round messages and the next prompt
+PROMPT_ROWS = 8
+
+
+def move_cursor(row: int) -> str:
+    """Escape code moving the cursor to the start of a 1-based screen row."""
+    return f"\033[{row};1H"
+
+
+def is_terminal(stream: TextIO) -> bool:
+    """Return True if a stream is an interactive terminal."""
+    return hasattr(stream, "isatty") and stream.isatty()
+
+
+@lru_cache(maxsize=None)
+def enable_ansi() -> bool:
+    """
+    Make sure the console understands ANSI escape codes.
+
+    Windows consoles only act on escape codes once virtual terminal
+    processing is switched on for the output handle (Windows 10 and later);
+    other platforms always understand them.
+
+    Returns:
+        bool: True if escape codes can be written to the console
+    """
+    if os.name != "nt":
+        return True
+    try:
+        import ctypes
+        from ctypes import wintypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = wintypes.DWORD()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, ImportError, OSError):
+        return False
+
+
+class FrameRenderer:
+    """Draws frames at the top of the screen, redrawing only changed lines.
+
+    Design Decisions:
+    - The stream is looked up on every frame when none is given, so output
+      redirection (as in headless replays) is respected
+    - Nothing the player has not had a chance to read is erased: a new frame
+      redraws its changed lines and returns the cursor to where it was, and
+      the text under the frame is only cleared by settle(), once the player
+      has answered the next prompt
+    - The first frame of a fight is printed in place, so the text before it
+      stays on screen; settle() then moves it to the top of the screen
+    - Diffing assumes the frame has stayed at the top of the screen; a frame
+      too tall to leave room for the round's messages is always printed in
+      place, because scrolling would move it
+    """
+    def __init__(self, stream: Optional[TextIO] = None):
+        """
+        Args:
+            stream: Where frames are written (sys.stdout at render time if omitted)
+        """
+        self.stream = stream
+        self._previous: List[str] = []
+        self._pending: List[str] = []
+
+    def reset(self) -> None:
+        """Forget the previous frame so the next one is drawn in full."""
+        self._previous = []
+        self._pending = []
+
+    def render(self, lines: List[str]) -> None:
+        """
+        Draw a frame.
+
+        Args:
+            lines: Lines of the frame, without line endings
+        """
+        stream = self.stream or sys.stdout
+        if not is_terminal(stream) or not enable_ansi():
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+            return
+
+        rows = shutil.get_terminal_size().lines
+        if not self._previous or len(lines) + PROMPT_ROWS > rows:
+            self._previous = []
+            # Moved to the top by settle(), once the text above has been read
+            self._pending = list(lines)
+            stream.write("\n".join(lines) + "\n")
+        else:
+            parts = [SAVE_CURSOR]
+            for row, line in enumerate(lines, start=1):
+                if row > len(self._previous) or self._previous[row - 1] != line:
+                    parts.append(move_cursor(row) + line + CLEAR_LINE)
+            parts.append(RESTORE_CURSOR)
+            stream.write("".join(parts))
+            self._previous = list(lines)
+        stream.flush()
+
+    def settle(self) -> None:
+        """
+        Clear what was printed under the frame, once the player has answered.
+
+        Call this after reading the round's input and before printing the
+        round's results, so last round's messages stay up while the player
+        decides.
+        """
+        stream = self.stream or sys.stdout
+        if not is_terminal(stream) or not enable_ansi():
+            return
+        if self._pending:
+            if len(self._pending) + PROMPT_ROWS <= shutil.get_terminal_size().lines:
+                stream.write(CLEAR_SCREEN + "\n".join(self._pending) + "\n")
+                self._previous = self._pending
+            self._pending = []
+        elif self._previous:
+            stream.write(move_cursor(len(self._previous) + 1) + CLEAR_BELOW)
+        stream.flush()
@@ -0,0 +1,185 @@
+"""Module for recording game sessions and replaying them exactly.
+
+Design Decisions:
+- A session is fully described by its seed and the lines the player typed,
+  because Game routes every roll through its own rng and every prompt
+  through its read_input function
+- End of input is recorded too, so sessions that relied on the automatic
+  defaults replay the same way
+- Sessions can be played against the search AI; it runs with its time cap
+  off, so its moves depend only on the game state and replay exactly
+- Replays run headless with output discarded, so they go as fast as the
+  game logic allows
+
+Usage:
+    python replay.py record session.json [--seed 42] [--enemy-ai]
+    python replay.py replay session.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+from typing import Callable, Dict, List, Optional
+from game import Game
+from enemy_ai import SearchEnemyAI
+
+RECORDING_VERSION = 1
+
+
+class InputRecorder:
+    """Wraps an input function and remembers every line it returns."""
+    def __init__(self, read: Callable[[str], str] = input):
+        self.read = read
+        self.inputs: List[Optional[str]] = []
+
+    def __call__(self, prompt: str) -> str:
+        try:
+            line = self.read(prompt)
+        except EOFError:
+            self.inputs.append(None)
+            raise
+        self.inputs.append(line)
+        return line
+
+
+class ScriptedInput:
+    """Input function that plays back recorded lines in order.
+
+    Design Decisions:
+    - A recorded end of input, or running out of lines, raises EOFError just
+      as input() would
+    """
+    def __init__(self, inputs: List[Optional[str]]):
+        self._inputs = iter(inputs)
+
+    def __call__(self, prompt: str) -> str:
+        line = next(self._inputs, None)
+        if line is None:
+            raise EOFError
+        return line
+
+
+class SessionRecording:
+    """Seed, inputs and final outcome of one played session."""
+    def __init__(self, seed: int, inputs: List[Optional[str]], outcome: Optional[Dict[str, int]] = None,
+                 enemy_ai: bool = False):
+        """
+        Args:
+            seed: Seed the game's rng was created with
+            inputs: Every line read, with None where input ended
+            outcome: Final state used to check a replay
+            enemy_ai: True if the search AI chose the enemies' moves
+        """
+        self.seed = seed
+        self.inputs = inputs
+        self.outcome = outcome or {}
+        self.enemy_ai = enemy_ai
+
+    def save(self, path: str) -> None:
+        """Write the recording as JSON."""
+        with open(path, "w") as recording_file:
+            json.dump({"version": RECORDING_VERSION, "seed": self.seed, "inputs": self.inputs,
+                       "outcome": self.outcome, "enemy_ai": self.enemy_ai}, recording_file)
+
+    @classmethod
+    def load(cls, path: str) -> "SessionRecording":
+        """Read a recording written by save()."""
+        with open(path) as recording_file:
+            data = json.load(recording_file)
+        if data.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version: {data.get('version')}")
+        return cls(data["seed"], data["inputs"], data.get("outcome"), data.get("enemy_ai", False))
+
+
+def game_outcome(game: Game) -> Dict[str, int]:
+    """Summarise the state a replay must reproduce."""
+    return {
+        "current_level": game.current_level,
+        "player_health": game.player.get_health() if game.player else 0,
+    }
+
+
+def enemy_policy(enemy_ai: bool) -> Optional[SearchEnemyAI]:
+    """The enemy policy for a session: a search AI with no time cap, or plain attacks."""
+    return SearchEnemyAI(time_budget=None) if enemy_ai else None
+
+
+def play_session(game: Game) -> Game:
+    """Run a game from the introduction to the end of the campaign."""
+    game.show_intro()
+    game.setup_game()
+    game.handle_boss_battles()
+    return game
+
+
+def record_session(seed: Optional[int] = None, read: Callable[[str], str] = input,
+                   enemy_ai: bool = False) -> SessionRecording:
+    """
+    Play an interactive session while recording its inputs.
+
+    Args:
+        seed: Seed for the game (a random one if omitted)
+        read: Underlying input function
+        enemy_ai: Let the search AI choose the enemies' moves
+
+    Returns:
+        The recording, including the final outcome
+    """
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+    recorder = InputRecorder(read)
+    game = play_session(Game(seed=seed, read_input=recorder, enemy_policy=enemy_policy(enemy_ai)))
+    return SessionRecording(seed, recorder.inputs, game_outcome(game), enemy_ai)
+
+
+def replay_session(recording: SessionRecording, headless: bool = True) -> Game:
+    """
+    Replay a recorded session.
+
+    Args:
+        recording: Session to replay
+        headless: Discard all game output
+
+    Returns:
+        The game in its final state
+    """
+    game = Game(seed=recording.seed, read_input=ScriptedInput(recording.inputs),
+                enemy_policy=enemy_policy(recording.enemy_ai))
+    if not headless:
+        return play_session(game)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return play_session(game)
+
+
+def verify_replay(recording: SessionRecording) -> bool:
+    """Return True if replaying the session reproduces its recorded outcome."""
+    return game_outcome(replay_session(recording)) == recording.outcome
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point for recording and replaying sessions."""
+    parser = argparse.ArgumentParser(description="Record or replay a game session.")
+    parser.add_argument("mode", choices=["record", "replay"])
+    parser.add_argument("path", help="recording file")
+    parser.add_argument("--seed", type=int, default=None, help="seed when recording")
+    parser.add_argument("--show", action="store_true", help="show game output when replaying")
+    parser.add_argument("--enemy-ai", action="store_true", help="let the search AI choose enemy moves when recording")
+    args = parser.parse_args(argv)
+
+    if args.mode == "record":
+        recording = record_session(args.seed, enemy_ai=args.enemy_ai)
+        recording.save(args.path)
+        print(f"Recorded {len(recording.inputs)} inputs with seed {recording.seed} to {args.path}")
+        return
+
+    recording = SessionRecording.load(args.path)
+    game = replay_session(recording, headless=not args.show)
+    outcome = game_outcome(game)
+    print(f"Replayed outcome: {outcome}")
+    print("Matches recording" if outcome == recording.outcome else f"MISMATCH, recorded: {recording.outcome}")
+
+
+if __name__ == "__main__":
+    main()
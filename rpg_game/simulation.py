@@ -0,0 +1,268 @@
+"""Module for Monte Carlo simulation of whole campaigns.
+
+Design Decisions:
+- Each campaign is seeded, so any run in a batch can be reproduced alone
+- Workers aggregate their own chunk of runs and return a small summary,
+  which keeps inter-process traffic tiny and lets batches scale with cores
+- Campaigns follow the level order of the game: villains first, then the boss
+- Each campaign hands its enemies back to the enemy pool when it ends, so a
+  worker reuses the same few enemy objects across its whole chunk
+- With the search AI on, each campaign gets its own AI with the time cap
+  off, so its moves depend only on the seed and not on machine speed or
+  which worker ran the campaign
+
+Usage:
+    python simulation.py --runs 100000 --workers 32 --seed 0 --policy heal [--enemy-ai]
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from character import Character
+from combat_engine import CombatEngine, PlayerPolicy, always_attack
+from game import Game
+from levels import DefaultLevelProvider
+from content import Content
+from enemy_ai import SearchEnemyAI
+from player_policies import POLICIES
+from constants import DEFAULT_PLAYER_NAME, PLAYER_START_HEALTH, PLAYER_START_DAMAGE
+
+
+def _silent(message: str) -> None:
+    """Discard flavour text during simulations."""
+
+
+class CampaignResult:
+    """Outcome of one simulated campaign."""
+    def __init__(self, seed: int, won: bool, level_reached: int, hp_after_level: Dict[int, int],
+                 level_progress: float = 0.0):
+        """
+        Store the outcome of a campaign.
+
+        Args:
+            seed: Seed the campaign was run with
+            won: True if every level was cleared
+            level_reached: Last level entered (one past the final level on a win)
+            hp_after_level: Player health after clearing each level
+            level_progress: On a loss, how much of the last level was done: fights won
+                plus the share of the final enemy's health taken, over the level's fights
+        """
+        self.seed = seed
+        self.won = won
+        self.level_reached = level_reached
+        self.hp_after_level = hp_after_level
+        self.level_progress = level_progress
+
+
+class CampaignSummary:
+    """Aggregated statistics over many campaigns.
+
+    Design Decisions:
+    - Only counts and sums are stored so summaries merge cheaply
+    - Averages are derived on demand when reporting
+    """
+    def __init__(self):
+        """Initialise an empty summary."""
+        self.runs = 0
+        self.wins = 0
+        self.level_reached_counts: Dict[int, int] = {}
+        self.hp_totals: Dict[int, int] = {}
+        self.hp_counts: Dict[int, int] = {}
+        self.progress_totals: Dict[int, float] = {}
+
+    def add(self, result: CampaignResult) -> None:
+        """Add a single campaign result."""
+        self.runs += 1
+        self.wins += result.won
+        level = result.level_reached
+        self.level_reached_counts[level] = self.level_reached_counts.get(level, 0) + 1
+        if not result.won:
+            self.progress_totals[level] = self.progress_totals.get(level, 0.0) + result.level_progress
+        for level, health in result.hp_after_level.items():
+            self.hp_totals[level] = self.hp_totals.get(level, 0) + health
+            self.hp_counts[level] = self.hp_counts.get(level, 0) + 1
+
+    def merge(self, other: "CampaignSummary") -> None:
+        """Fold another summary into this one."""
+        self.runs += other.runs
+        self.wins += other.wins
+        for level, count in other.level_reached_counts.items():
+            self.level_reached_counts[level] = self.level_reached_counts.get(level, 0) + count
+        for level, total in other.hp_totals.items():
+            self.hp_totals[level] = self.hp_totals.get(level, 0) + total
+            self.hp_counts[level] = self.hp_counts.get(level, 0) + other.hp_counts[level]
+        for level, total in other.progress_totals.items():
+            self.progress_totals[level] = self.progress_totals.get(level, 0.0) + total
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of campaigns that cleared every level."""
+        return self.wins / self.runs if self.runs else 0.0
+
+    def mean_hp_after_level(self) -> Dict[int, float]:
+        """Average player health after clearing each level."""
+        return {level: self.hp_totals[level] / self.hp_counts[level]
+                for level in sorted(self.hp_totals)}
+
+    def level_win_rates(self, level_count: int) -> Dict[int, float]:
+        """
+        Fraction of the campaigns entering each level that went on to clear it.
+
+        Args:
+            level_count: Number of levels in the campaign
+
+        Returns:
+            Dict mapping level to its clear rate (0.0 for levels nobody entered)
+        """
+        rates = {}
+        for level in range(1, level_count + 1):
+            entered = sum(count for reached, count in self.level_reached_counts.items() if reached >= level)
+            cleared = sum(count for reached, count in self.level_reached_counts.items() if reached > level)
+            rates[level] = cleared / entered if entered else 0.0
+        return rates
+
+    def level_progress_rates(self, level_count: int) -> Dict[int, float]:
+        """
+        Like level_win_rates, but failed runs count the share of the level they got through.
+
+        Unlike the clear rate, this moves smoothly with enemy stats even when
+        nobody clears a level, which gives tuning something to follow.
+        """
+        rates = {}
+        for level in range(1, level_count + 1):
+            entered = sum(count for reached, count in self.level_reached_counts.items() if reached >= level)
+            cleared = sum(count for reached, count in self.level_reached_counts.items() if reached > level)
+            progress = cleared + self.progress_totals.get(level, 0.0)
+            rates[level] = progress / entered if entered else 0.0
+        return rates
+
+    def to_dict(self) -> Dict[str, object]:
+        """Return the summary as plain data for reports."""
+        return {
+            "runs": self.runs,
+            "wins": self.wins,
+            "win_rate": self.win_rate,
+            "level_reached": dict(sorted(self.level_reached_counts.items())),
+            "mean_hp_after_level": self.mean_hp_after_level(),
+        }
+
+
+def run_campaign(seed: int, policy: PlayerPolicy = always_attack,
+                 content: Optional[Content] = None, enemy_ai: bool = False) -> CampaignResult:
+    """
+    Play one full campaign without any terminal I/O.
+
+    Args:
+        seed: Seed for the random number generator
+        policy: Chooses the player's action each round
+        content: Content to play (the default content file if omitted)
+        enemy_ai: Let a deterministic SearchEnemyAI choose enemy moves
+
+    Returns:
+        CampaignResult for the run
+    """
+    game = Game(seed=seed, level_provider=DefaultLevelProvider(content) if content else None, write=_silent)
+    player = Character(DEFAULT_PLAYER_NAME, PLAYER_START_HEALTH, PLAYER_START_DAMAGE)
+    player.rng = game.rng
+    game.player = player
+    engine = CombatEngine(policy, enemy_policy=SearchEnemyAI(time_budget=None) if enemy_ai else None)
+    hp_after_level: Dict[int, int] = {}
+    flow = game.campaign()
+    level, fights_won = 1, 0
+
+    try:
+        enemy = next(flow)
+        while True:
+            if enemy is None:
+                enemy = next(flow)
+                continue
+            if game.current_level != level:
+                level, fights_won = game.current_level, 0
+            enemy.narrate = _silent
+            enemy_health = enemy.get_health()
+            if not engine.run(player, enemy).player_won:
+                health_taken = 1 - enemy.get_health() / enemy_health if enemy_health else 1.0
+                progress = (fights_won + health_taken) / (len(game.villains[level]) + 1)
+                return CampaignResult(seed, False, level, hp_after_level, progress)
+            fights_won += 1
+            # Looking the boss up would build it, so a level whose boss is unbuilt is still on villains
+            if game.bosses.is_built(level) and enemy is game.bosses[level]:
+                hp_after_level[level] = player.get_health()
+            enemy = flow.send(True)
+    except StopIteration:
+        pass
+    finally:
+        game.release_enemies()
+
+    return CampaignResult(seed, True, len(game.bosses) + 1, hp_after_level)
+
+
+def _run_chunk(seeds: List[int], policy: PlayerPolicy, content: Optional[Content] = None,
+               enemy_ai: bool = False) -> CampaignSummary:
+    """Run a chunk of campaigns inside a worker and summarise them."""
+    summary = CampaignSummary()
+    for seed in seeds:
+        summary.add(run_campaign(seed, policy, content, enemy_ai))
+    return summary
+
+
+def run_batch(runs: int, workers: Optional[int] = None, base_seed: int = 0,
+              policy: PlayerPolicy = always_attack, content: Optional[Content] = None,
+              enemy_ai: bool = False) -> CampaignSummary:
+    """
+    Run many seeded campaigns across a process pool.
+
+    Args:
+        runs: Number of campaigns to simulate
+        workers: Worker processes to use (defaults to the CPU count)
+        base_seed: Seed of the first campaign; run i uses base_seed + i
+        policy: Picklable player policy shared by every run
+        content: Content to play (the default content file if omitted)
+        enemy_ai: Let a deterministic SearchEnemyAI choose enemy moves
+
+    Returns:
+        CampaignSummary over all runs
+    """
+    workers = workers or os.cpu_count() or 1
+    seeds = list(range(base_seed, base_seed + runs))
+    if workers == 1:
+        return _run_chunk(seeds, policy, content, enemy_ai)
+
+    # A few chunks per worker balances load without flooding the pool with tasks
+    chunk_count = min(runs, workers * 4) or 1
+    chunks = [seeds[index::chunk_count] for index in range(chunk_count)]
+    summary = CampaignSummary()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk_summary in pool.map(_run_chunk, chunks, [policy] * len(chunks), [content] * len(chunks),
+                                         [enemy_ai] * len(chunks)):
+            summary.merge(chunk_summary)
+    return summary
+
+
+def print_report(summary: CampaignSummary) -> None:
+    """Print a batch summary."""
+    print(f"Campaigns: {summary.runs}")
+    print(f"Win rate: {summary.win_rate:.2%}")
+    print("\nLevel reached:")
+    for level, count in sorted(summary.level_reached_counts.items()):
+        print(f"  {level}: {count} ({count / summary.runs:.2%})")
+    print("\nMean HP after level:")
+    for level, health in summary.mean_hp_after_level().items():
+        print(f"  {level}: {health:.1f}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point for batch simulations."""
+    parser = argparse.ArgumentParser(description="Simulate seeded campaigns in parallel.")
+    parser.add_argument("--runs", type=int, default=10000, help="number of campaigns")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first campaign")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="attack", help="player policy")
+    parser.add_argument("--enemy-ai", action="store_true", help="let the search AI choose enemy moves")
+    args = parser.parse_args(argv)
+    print_report(run_batch(args.runs, args.workers, args.seed, POLICIES[args.policy], enemy_ai=args.enemy_ai))
+
+
+if __name__ == "__main__":
+    main()
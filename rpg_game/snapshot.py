@@ -0,0 +1,356 @@
+"""Module for saving and restoring game state in a compact binary format.
+
+Design Decisions:
+- A snapshot is a short header followed by tagged, length-prefixed sections
+  (game, rng, player, inventory, enemies), so readers can skip sections they
+  do not know and the format can grow without breaking old files
+- Items are stored by catalog name; the shared templates in items.py supply
+  everything else on restore
+- GameSnapshotter keeps the encoded bytes of each section and only
+  re-encodes the sections whose state changed since the previous snapshot
+
+Format (little-endian):
+    header:  magic b"RPGS", version (uint16)
+    section: tag (uint8), length (uint32), payload
+
+Version 2 widened levels and enemy health to uint32 for endless campaigns;
+version 1 snapshots can still be restored.
+"""
+
+import os
+import struct
+from typing import Callable, Dict, List, Optional, Tuple
+from character import Character
+from inventory import Inventory, next_revision
+from items import get_item
+from levels import LevelProvider
+from game import Game
+
+MAGIC = b"RPGS"
+FORMAT_VERSION = 2
+READABLE_VERSIONS = (1, 2)
+HEADER = struct.Struct("<4sH")
+SECTION = struct.Struct("<BI")
+
+GAME_SECTION = 1
+RNG_SECTION = 2
+PLAYER_SECTION = 3
+INVENTORY_SECTION = 4
+ENEMY_SECTION = 5
+
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+# Boss health recorded for levels whose boss was never built
+_NO_BOSS = 0xFFFFFFFF
+_CHARACTER = struct.Struct("<HHH")
+
+
+class SnapshotError(ValueError):
+    """Raised when snapshot data cannot be read."""
+
+
+class _Reader:
+    """Sequential reader over a snapshot payload."""
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def unpack(self, layout: struct.Struct) -> tuple:
+        try:
+            values = layout.unpack_from(self.data, self.offset)
+        except struct.error as error:
+            raise SnapshotError("Snapshot is truncated") from error
+        self.offset += layout.size
+        return values
+
+    def u8(self) -> int:
+        return self.unpack(_U8)[0]
+
+    def u16(self) -> int:
+        return self.unpack(_U16)[0]
+
+    def u32(self) -> int:
+        return self.unpack(_U32)[0]
+
+    def text(self) -> str:
+        length = self.u8()
+        value = bytes(self.data[self.offset:self.offset + length]).decode("utf-8")
+        self.offset += length
+        return value
+
+
+def _text(value: str) -> bytes:
+    """Encode a short string with a one-byte length prefix, cut to 255 bytes on a character boundary."""
+    encoded = value.encode("utf-8")
+    if len(encoded) > 255:
+        # Dropping the bytes of a split character keeps the text decodable
+        encoded = encoded[:255].decode("utf-8", errors="ignore").encode("utf-8")
+    return _U8.pack(len(encoded)) + encoded
+
+
+def _optional_name(item) -> str:
+    return item.name if item else ""
+
+
+# Inventory
+
+def snapshot_inventory(inventory: Inventory) -> bytes:
+    """Encode an inventory's items, charges and equipment."""
+    parts = [_U8.pack(inventory.max_size), _U8.pack(len(inventory.items))]
+    for name in inventory.items:
+        parts.append(_text(name))
+        parts.append(_U16.pack(inventory.charges.get(name, 1)))
+    parts.append(_text(_optional_name(inventory.equipped_weapon)))
+    parts.append(_text(_optional_name(inventory.equipped_armor)))
+    return b"".join(parts)
+
+
+def restore_inventory(data: bytes, inventory: Optional[Inventory] = None) -> Inventory:
+    """
+    Rebuild an inventory from snapshot_inventory() data.
+
+    Args:
+        data: Encoded inventory
+        inventory: Inventory to overwrite (a new one if omitted)
+
+    Returns:
+        The restored inventory
+    """
+    return _read_inventory(_Reader(data), inventory)
+
+
+def _read_inventory(reader: _Reader, inventory: Optional[Inventory]) -> Inventory:
+    inventory = inventory if inventory is not None else Inventory()
+    inventory.max_size = reader.u8()
+    inventory.items = {}
+    inventory.charges = {}
+    for _ in range(reader.u8()):
+        name = reader.text()
+        charges = reader.u16()
+        try:
+            inventory.items[name] = get_item(name)
+        except KeyError as error:
+            raise SnapshotError(f"Unknown item in snapshot: {name}") from error
+        if charges > 1:
+            inventory.charges[name] = charges
+    weapon_name, armor_name = reader.text(), reader.text()
+    inventory.equipped_weapon = inventory.items.get(weapon_name)
+    inventory.equipped_armor = inventory.items.get(armor_name)
+    inventory.weapon_bonus = inventory.equipped_weapon.damage_bonus if inventory.equipped_weapon else 0
+    inventory.armor_bonus = inventory.equipped_armor.defense_bonus if inventory.equipped_armor else 0
+    inventory.revision = next_revision()
+    return inventory
+
+
+# Character
+
+def snapshot_character(character: Character) -> bytes:
+    """Encode a character's name and stats (not its inventory)."""
+    return _text(character.name) + _CHARACTER.pack(character.get_health(), character.damage, character.defense)
+
+
+def restore_character(data: bytes, inventory_data: Optional[bytes] = None) -> Character:
+    """
+    Rebuild a player character from snapshot data.
+
+    Args:
+        data: Output of snapshot_character()
+        inventory_data: Output of snapshot_inventory(), if the inventory was saved
+
+    Returns:
+        The restored character
+    """
+    reader = _Reader(data)
+    name = reader.text()
+    health, damage, defense = reader.unpack(_CHARACTER)
+    character = Character(name, health, damage)
+    character.defense = defense
+    if inventory_data is not None:
+        restore_inventory(inventory_data, character.inventory)
+    return character
+
+
+# Game
+
+def _enemy_healths(game: Game) -> Tuple[Tuple[int, int, Tuple[int, ...]], ...]:
+    """Health of every enemy on each level that has been built."""
+    return tuple(
+        (level, game.bosses[level].get_health() if game.bosses.is_built(level) else _NO_BOSS,
+         tuple(villain.get_health() for villain in game.villains[level]) if game.villains.is_built(level) else ())
+        for level in sorted(set(game.bosses.built_levels()) | set(game.villains.built_levels()))
+    )
+
+
+def _encode_enemies(healths) -> bytes:
+    parts = [_U8.pack(len(healths))]
+    for level, boss_health, villain_healths in healths:
+        parts.append(struct.pack(f"<IIB{len(villain_healths)}I", level, boss_health,
+                                 len(villain_healths), *villain_healths))
+    return b"".join(parts)
+
+
+def _encode_rng(state) -> bytes:
+    version, internal, gauss = state
+    return struct.pack(f"<BH{len(internal)}I", version, len(internal), *internal) + struct.pack(
+        "<?d", gauss is not None, gauss or 0.0)
+
+
+def _decode_rng(data: bytes):
+    reader = _Reader(data)
+    version = reader.u8()
+    count = reader.u16()
+    internal = reader.unpack(struct.Struct(f"<{count}I"))
+    has_gauss, gauss = reader.unpack(struct.Struct("<?d"))
+    return version, internal, gauss if has_gauss else None
+
+
+def _rng_key(rng) -> object:
+    """Cheap change key for an rng: its draw count if it keeps one, else its full state."""
+    draws = getattr(rng, "draws", None)
+    return rng.getstate() if draws is None else (rng, draws)
+
+
+class GameSnapshotter:
+    """Produces snapshots of one game, re-encoding only what changed.
+
+    Design Decisions:
+    - Each section has a cheap change key (plain values, the inventory's
+      revision counter, or the rng's draw count); unchanged sections reuse
+      their cached bytes
+    - save() skips the disk entirely when nothing changed, and otherwise
+      writes to a temporary file and renames it, so a crash mid-write never
+      leaves a damaged checkpoint
+    """
+    def __init__(self, game: Game, include_rng: bool = True):
+        """
+        Args:
+            game: Game to snapshot
+            include_rng: Store the rng state so restored games roll the same numbers
+        """
+        self.game = game
+        self.include_rng = include_rng
+        self._keys: Dict[int, object] = {}
+        self._sections: Dict[int, bytes] = {}
+        self._snapshot: Optional[bytes] = None
+        self.sections_encoded = 0
+
+    def _section_sources(self) -> List[Tuple[int, Callable[[], object], Callable[[object], bytes]]]:
+        game = self.game
+        player = game.player
+        sources = [(GAME_SECTION, lambda: game.current_level, lambda level: _U32.pack(level))]
+        if self.include_rng:
+            sources.append((RNG_SECTION, lambda: _rng_key(game.rng), lambda key: _encode_rng(game.rng.getstate())))
+        if player is not None:
+            sources.append((PLAYER_SECTION,
+                            lambda: (player.name, player.get_health(), player.damage, player.defense),
+                            lambda key: snapshot_character(player)))
+            sources.append((INVENTORY_SECTION,
+                            lambda: player.inventory.revision,
+                            lambda key: snapshot_inventory(player.inventory)))
+        sources.append((ENEMY_SECTION, lambda: _enemy_healths(game), _encode_enemies))
+        return sources
+
+    def snapshot(self) -> bytes:
+        """Return the current snapshot bytes."""
+        changed = self._snapshot is None
+        present = []
+        for tag, read_key, encode in self._section_sources():
+            present.append(tag)
+            key = read_key()
+            if tag in self._sections and self._keys[tag] == key:
+                continue
+            payload = encode(key)
+            self._keys[tag] = key
+            self._sections[tag] = SECTION.pack(tag, len(payload)) + payload
+            self.sections_encoded += 1
+            changed = True
+        if len(present) != len(self._sections):
+            for tag in [tag for tag in self._sections if tag not in present]:
+                del self._sections[tag], self._keys[tag]
+            changed = True
+        if changed:
+            self._snapshot = HEADER.pack(MAGIC, FORMAT_VERSION) + b"".join(
+                self._sections[tag] for tag in sorted(self._sections))
+        return self._snapshot
+
+    def save(self, path: str) -> bool:
+        """
+        Write the snapshot to a file if it changed since the last save.
+
+        Returns:
+            True if the file was written
+        """
+        previous = self._snapshot
+        data = self.snapshot()
+        if data is previous and os.path.exists(path):
+            return False
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as snapshot_file:
+            snapshot_file.write(data)
+        os.replace(temporary_path, path)
+        return True
+
+
+def snapshot_game(game: Game) -> bytes:
+    """Encode a full snapshot of a game."""
+    return GameSnapshotter(game).snapshot()
+
+
+def _read_sections(data: bytes) -> Tuple[int, Dict[int, bytes]]:
+    reader = _Reader(data)
+    magic, version = reader.unpack(HEADER)
+    if magic != MAGIC:
+        raise SnapshotError("Not a game snapshot")
+    if version not in READABLE_VERSIONS:
+        raise SnapshotError(f"Unsupported snapshot version: {version}")
+    sections = {}
+    while reader.offset < len(data):
+        tag, length = reader.unpack(SECTION)
+        sections[tag] = bytes(reader.data[reader.offset:reader.offset + length])
+        reader.offset += length
+    return version, sections
+
+
+def restore_game(data: bytes, level_provider: Optional[LevelProvider] = None,
+                 read_input: Callable[[str], str] = input) -> Game:
+    """
+    Rebuild a game from snapshot bytes.
+
+    Args:
+        data: Output of snapshot_game() or GameSnapshotter.snapshot()
+        level_provider: Provider the original game used (the standard campaign if omitted)
+        read_input: Input function for the restored game
+
+    Returns:
+        The restored game
+    """
+    version, sections = _read_sections(data)
+    # Version 1 stored levels and enemy health as uint16
+    wide = version >= 2
+    game = Game(level_provider=level_provider, read_input=read_input)
+    reader = _Reader(sections[GAME_SECTION])
+    game.current_level = reader.u32() if wide else reader.u16()
+    if RNG_SECTION in sections:
+        game.rng.setstate(_decode_rng(sections[RNG_SECTION]))
+    if PLAYER_SECTION in sections:
+        game.player = restore_character(sections[PLAYER_SECTION], sections.get(INVENTORY_SECTION))
+        game.player.rng = game.rng
+    if ENEMY_SECTION in sections:
+        reader = _Reader(sections[ENEMY_SECTION])
+        for _ in range(reader.u8()):
+            level, boss_health = reader.unpack(struct.Struct("<II" if wide else "<HH"))
+            villain_healths = reader.unpack(struct.Struct(f"<{reader.u8()}{'I' if wide else 'H'}"))
+            if boss_health != (_NO_BOSS if wide else 0xFFFF):
+                game.bosses[level].set_health(boss_health)
+            if villain_healths:
+                for villain, health in zip(game.villains[level], villain_healths):
+                    villain.set_health(health)
+    return game
+
+
+def load_game(path: str, level_provider: Optional[LevelProvider] = None,
+              read_input: Callable[[str], str] = input) -> Game:
+    """Restore a game from a snapshot file."""
+    with open(path, "rb") as snapshot_file:
+        return restore_game(snapshot_file.read(), level_provider, read_input)
@@ -0,0 +1,27 @@
+"""Shared setup for the rpg_game tests.
+
+Design Decisions:
+- The game modules import each other by bare name, so the package directory
+  goes on sys.path, as it is when the game is run from rpg_game/
+- game_logger opens game.log in the working directory when it is imported,
+  so the tests run from a temporary directory and never touch a tracked log
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_original_cwd = None
+
+
+def pytest_configure(config):
+    global _original_cwd
+    _original_cwd = os.getcwd()
+    os.chdir(tempfile.mkdtemp(prefix="rpg_game_tests_"))
+
+
+def pytest_unconfigure(config):
+    if _original_cwd is not None:
+        os.chdir(_original_cwd)
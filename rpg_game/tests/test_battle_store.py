@@ -0,0 +1,77 @@
+"""Array-backed battles and the Character-like views over their rows."""
+
+import numpy as np
+
+from battle_store import (ENEMY_TEAM, HEALTH_CAP, PLAYER_TEAM, SPECIAL_FIRE, SPECIAL_NONE, SPECIAL_SUMMON,
+                          BattleStore, apply_damage, run_battle)
+from character import Character
+from combat_engine import CombatEngine
+from items import LEATHER_ARMOR, WEAPONS
+from villain import Necromancer, Skeleton
+
+
+def _player(health: int = 120) -> Character:
+    player = Character("Hero", health, 14)
+    player.inventory.add_item(WEAPONS["Dagger"])
+    player.inventory.equip_weapon(WEAPONS["Dagger"])
+    player.inventory.equip_armor(LEATHER_ARMOR)
+    return player
+
+
+def test_rows_copy_character_stats():
+    store = BattleStore(capacity=1)
+    player = _player()
+    player.inventory.weapon_bonus += 3
+    hero = store.add_character(player, PLAYER_TEAM)
+    necromancer = store.add_character(Necromancer(2), ENEMY_TEAM)
+    assert len(store) == 2
+    assert (hero.name, hero.get_health(), hero.team) == ("Hero", 120, PLAYER_TEAM)
+    # Bonuses come from the inventory, as Character.attack reads them
+    assert hero.get_attack_power() == player.get_attack_power()
+    assert hero.get_effective_defense() == player.get_effective_defense()
+    assert store.special[necromancer.row] == SPECIAL_SUMMON and necromancer.level == 2
+
+
+def test_views_fight_like_characters():
+    player, skeleton = _player(), Skeleton(3)
+    store = BattleStore()
+    hero, enemy = store.add_character(_player(), PLAYER_TEAM), store.add_character(Skeleton(3), ENEMY_TEAM)
+    expected = CombatEngine().run(player, skeleton)
+    result = CombatEngine().run(hero, enemy)
+    assert (result.player_won, result.rounds, result.player_health, result.enemy_health) == \
+           (expected.player_won, expected.rounds, expected.player_health, expected.enemy_health)
+    assert enemy.take_damage(5) == skeleton.take_damage(5)
+
+
+def test_plain_duels_match_the_combat_engine():
+    store = BattleStore()
+    store.add_character(_player(), PLAYER_TEAM)
+    store.add_character(Skeleton(3), ENEMY_TEAM)
+    player, skeleton = _player(), Skeleton(3)
+    result = CombatEngine().run(player, skeleton)
+    assert run_battle(store, np.random.default_rng(0)) == (PLAYER_TEAM if result.player_won else ENEMY_TEAM)
+    assert list(store.health[:2]) == [player.get_health(), skeleton.get_health()]
+
+
+def test_big_battles_end_with_one_team_and_write_back():
+    store = BattleStore(capacity=4)
+    players = [_player(200) for _ in range(5)]
+    for player in players:
+        store.add_character(player, PLAYER_TEAM)
+    for _ in range(20):
+        store.add_character(Necromancer(3), ENEMY_TEAM)
+    store.add("Fire Boss", ENEMY_TEAM, 150, 12, special=SPECIAL_FIRE, level=3)
+    winner = run_battle(store, np.random.default_rng(4))
+    assert len(store.teams_standing()) == 1 and store.teams_standing()[0] == winner
+    # Necromancers summon skeletons that join the battle as new rows
+    assert len(store) > 26
+    store.write_back()
+    assert [player.get_health() for player in players] == list(store.health[:5])
+
+
+def test_hits_keep_health_under_the_cap():
+    store = BattleStore()
+    store.add("Giant", ENEMY_TEAM, 4000, 1)
+    store.add("Bystander", ENEMY_TEAM, 3000, 1, special=SPECIAL_NONE)
+    apply_damage(store, np.array([0]), np.array([10]))
+    assert list(store.health[:2]) == [HEALTH_CAP, 3000]
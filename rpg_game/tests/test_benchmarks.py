@@ -0,0 +1,53 @@
+"""The benchmark suite's runners, result files and baseline comparison."""
+
+import json
+
+import pytest
+
+import benchmarks
+from benchmarks import BENCHMARKS, compare_results, load_results, run_benchmarks, save_results
+
+
+def _results(**ns_per_op) -> dict:
+    return {"version": benchmarks.RESULTS_VERSION,
+            "results": {name: {"ns_per_op": value, "ops_per_second": 1e9 / value, "ops": 1}
+                        for name, value in ns_per_op.items()}}
+
+
+def test_every_benchmark_runs(capsys):
+    results = run_benchmarks(scale=1e-6, repeats=1)
+    assert set(results["results"]) == set(BENCHMARKS)
+    for result in results["results"].values():
+        assert result["ops"] >= 2 and result["ns_per_op"] > 0
+    assert capsys.readouterr().out == ""
+
+
+def test_results_round_trip(tmp_path):
+    path = str(tmp_path / "results.json")
+    results = _results(character_attack=50.0)
+    save_results(results, path)
+    assert load_results(path) == results
+
+    with open(path, "w") as results_file:
+        json.dump({"version": 0, "results": {}}, results_file)
+    with pytest.raises(ValueError):
+        load_results(path)
+
+
+def test_slowdowns_past_the_tolerance_are_regressions():
+    baseline = _results(character_attack=100.0, game_init=100.0, retired=5.0)
+    current = _results(character_attack=109.0, game_init=125.0, added=7.0)
+    comparison = compare_results(current, baseline, tolerance=0.10)
+    assert set(comparison) == {"character_attack", "game_init"}
+    assert not comparison["character_attack"]["regressed"]
+    assert comparison["game_init"]["regressed"] and comparison["game_init"]["ratio"] == 1.25
+
+
+def test_main_fails_on_a_regression(tmp_path, monkeypatch, capsys):
+    baseline = str(tmp_path / "baseline.json")
+    save_results(_results(character_attack=100.0), baseline)
+    monkeypatch.setattr(benchmarks, "run_benchmarks", lambda names, scale, repeats: _results(character_attack=150.0))
+    assert benchmarks.main(["character_attack", "--compare", baseline]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+    monkeypatch.setattr(benchmarks, "run_benchmarks", lambda names, scale, repeats: _results(character_attack=90.0))
+    assert benchmarks.main(["character_attack", "--compare", baseline]) == 0
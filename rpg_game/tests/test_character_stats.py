@@ -0,0 +1,54 @@
+"""Attack and defence bonuses that the inventory keeps in step with the equipment."""
+
+from character import Character
+from items import IRON_HELMET, LEATHER_ARMOR, ROCK, WEAPONS
+from snapshot import restore_inventory, snapshot_inventory
+from villain import Orc
+
+
+def test_bonuses_follow_every_equipment_change():
+    hero = Character("Hero", 100, 10)
+    assert hero.get_attack_power() == 10 + ROCK.damage_bonus
+    assert hero.get_effective_defense() == 0
+
+    hero.inventory.add_item(WEAPONS["Iron Sword"])
+    assert hero.equip_item("Iron Sword") == "Equipped Iron Sword"
+    assert hero.equip_item(LEATHER_ARMOR.name) == f"Equipped {LEATHER_ARMOR.name}"
+    assert hero.get_attack_power() == 10 + WEAPONS["Iron Sword"].damage_bonus
+    assert hero.get_effective_defense() == LEATHER_ARMOR.defense_bonus
+
+    hero.inventory.add_item(IRON_HELMET)
+    hero.equip_item(IRON_HELMET.name)
+    assert hero.get_effective_defense() == IRON_HELMET.defense_bonus
+
+
+def test_base_stat_changes_count_at_once():
+    hero = Character("Hero", 100, 10)
+    hero.equip_item(LEATHER_ARMOR.name)
+    hero.damage, hero.defense = 25, 3
+    assert hero.get_attack_power() == 25 + ROCK.damage_bonus
+    assert hero.get_effective_defense() == 3 + LEATHER_ARMOR.defense_bonus
+
+
+def test_attacks_deal_what_damage_against_predicts():
+    hero, orc = Character("Hero", 100, 10), Orc(2)
+    orc.equip_item(LEATHER_ARMOR.name)
+    expected = hero.damage_against(orc)
+    assert expected == max(0, hero.get_attack_power() - orc.get_effective_defense())
+    health = orc.get_health()
+    assert hero.attack(orc) == expected and orc.get_health() == health - expected
+    assert orc.damage_against(hero) == orc.attack(hero)
+
+
+def test_reset_and_restore_rebuild_the_bonuses():
+    hero = Character("Hero", 100, 10)
+    hero.inventory.add_item(WEAPONS["Dagger"])
+    hero.equip_item("Dagger")
+    hero.equip_item(LEATHER_ARMOR.name)
+
+    restored = restore_inventory(snapshot_inventory(hero.inventory))
+    assert (restored.weapon_bonus, restored.armor_bonus) == (hero.inventory.weapon_bonus,
+                                                             hero.inventory.armor_bonus)
+
+    hero.reset("Hero", 100, 10)
+    assert hero.get_attack_power() == 10 + ROCK.damage_bonus and hero.get_effective_defense() == 0
@@ -0,0 +1,97 @@
+"""The headless combat engine, its policies and observers."""
+
+import math
+
+from character import Character
+from combat_engine import CombatAction, CombatEngine, CombatObserver, ObserverGroup, always_attack
+from items import HEALING_POTION
+
+
+class RecordingObserver(CombatObserver):
+    def __init__(self):
+        self.events = []
+
+    def on_round_start(self, player, enemy, round_number):
+        self.events.append(("round", round_number))
+
+    def on_player_action(self, player, enemy, action, damage, message):
+        self.events.append(("player", action, damage))
+
+    def on_enemy_attack(self, player, enemy, damage):
+        self.events.append(("enemy", damage))
+
+    def on_combat_end(self, player, enemy, player_won):
+        self.events.append(("end", player_won))
+
+
+def _fighters(player_health=100, enemy_health=50):
+    return Character("Hero", player_health, 20), Character("Dummy", enemy_health, 5)
+
+
+def test_run_plays_until_the_enemy_falls():
+    player, enemy = _fighters()
+    hit = player.get_attack_power() - enemy.get_effective_defense()
+    taken = enemy.get_attack_power() - player.get_effective_defense()
+    result = CombatEngine().run(player, enemy)
+    rounds = math.ceil(50 / hit)
+    assert result.player_won and result.rounds == rounds
+    assert result.damage_dealt == rounds * hit
+    # A defeated enemy never gets its last turn
+    assert result.damage_taken == (rounds - 1) * taken
+    assert result.player_health == 100 - result.damage_taken and result.enemy_health == 0
+
+
+def test_losing_and_the_round_cap():
+    player, enemy = _fighters(player_health=5, enemy_health=1000)
+    assert not CombatEngine().run(player, enemy).player_won
+    player, enemy = _fighters(enemy_health=1000)
+    result = CombatEngine().run(player, enemy, max_rounds=3)
+    assert (result.player_won, result.rounds) == (False, 3)
+
+
+def test_policies_choose_each_action():
+    player, enemy = _fighters(player_health=40)
+    player.set_health(10)
+    choices = iter([(CombatAction.USE_ITEM, HEALING_POTION.name)])
+
+    def heal_first(player, enemy):
+        return next(choices, (CombatAction.ATTACK, None))
+
+    result = CombatEngine(heal_first).run(player, enemy)
+    assert result.player_won
+    assert HEALING_POTION.name not in player.inventory.items
+
+
+def test_observers_see_every_event_in_order():
+    player, enemy = _fighters(enemy_health=30)
+    first, second = RecordingObserver(), RecordingObserver()
+    CombatEngine(always_attack, observer=ObserverGroup(first, second)).run(player, enemy)
+    assert first.events == second.events
+    kinds = [event[0] for event in first.events]
+    assert kinds == ["round", "player", "enemy", "round", "player", "end"]
+
+
+def test_enemy_policy_replaces_the_plain_attack():
+    player, enemy = _fighters()
+    calls = []
+
+    def passive(enemy, player):
+        calls.append(enemy)
+        return 0
+
+    result = CombatEngine(enemy_policy=passive).run(player, enemy)
+    assert result.damage_taken == 0 and player.get_health() == 100
+    assert len(calls) == result.rounds - 1
+
+
+def test_fight_steps_pause_for_each_action():
+    player, enemy = _fighters(enemy_health=30)
+    steps = CombatEngine().fight(player, enemy)
+    next(steps)
+    steps.send((CombatAction.EQUIP, "Missing Item"))
+    assert enemy.get_health() == 30
+    try:
+        while True:
+            steps.send((CombatAction.ATTACK, None))
+    except StopIteration as finished:
+        assert finished.value.player_won
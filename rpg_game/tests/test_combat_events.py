@@ -0,0 +1,111 @@
+"""Round trips through the binary combat event log."""
+
+import pytest
+
+from character import Character
+from combat_engine import CombatAction, CombatEngine
+from combat_events import (ACTION_CODES, ENEMY_ATTACK, ENTITY_CODES, HEADER, MAGIC, RECORD, RECORDS,
+                           CombatEventWriter, EventLogObserver, count_events, entity_code, iter_events, summarise)
+from villain import Orc, Skeleton
+
+EVENTS = [
+    (1, 1, 1, 4, 1, 2, 12, 38),
+    (1, 1, 4, 1, ENEMY_ATTACK, 2, 7, 93),
+    (1, 2, 1, 4, 2, 2, 0, 38),
+    (2, 1, 1, 9, 1, 3, 65535, 0),
+]
+
+
+def test_events_read_back_as_written(tmp_path):
+    path = str(tmp_path / "combat.bin")
+    with CombatEventWriter(path, buffer_records=3) as writer:
+        for event in EVENTS:
+            writer.write_event(*event)
+    # A small chunk size makes the reader cross chunk boundaries
+    assert list(iter_events(path, chunk_records=3)) == EVENTS
+    assert count_events(path) == len(EVENTS)
+
+
+def test_values_are_clamped_to_their_fields(tmp_path):
+    path = str(tmp_path / "combat.bin")
+    with CombatEventWriter(path) as writer:
+        writer.write_event(1, 70000, 1, 2, 1, 300, -5, 100000)
+    # Levels are not clamped, so deep endless-mode levels are recorded as they are
+    assert list(iter_events(path)) == [(1, 0xFFFF, 1, 2, 1, 300, 0, 0xFFFF)]
+
+
+def test_reopening_continues_combat_ids(tmp_path):
+    path = str(tmp_path / "combat.bin")
+    with CombatEventWriter(path) as writer:
+        first = writer.start_combat()
+        writer.write_event(first, 1, 1, 3, 1, 1, 5, 10)
+    with CombatEventWriter(path) as writer:
+        second = writer.start_combat()
+        writer.write_event(second, 1, 1, 3, 1, 1, 5, 10)
+    assert (first, second) == (1, 2)
+    assert [event[0] for event in iter_events(path)] == [1, 2]
+
+
+def test_partial_trailing_record_is_ignored(tmp_path):
+    path = str(tmp_path / "combat.bin")
+    with CombatEventWriter(path) as writer:
+        for event in EVENTS:
+            writer.write_event(*event)
+    with open(path, "ab") as log_file:
+        log_file.write(b"\x00" * (RECORD.size - 1))
+    assert list(iter_events(path)) == EVENTS
+
+
+def test_reopening_after_a_partial_record_keeps_records_aligned(tmp_path):
+    path = str(tmp_path / "combat.bin")
+    with CombatEventWriter(path) as writer:
+        writer.write_event(*EVENTS[0])
+    with open(path, "ab") as log_file:
+        log_file.write(b"\xff" * (RECORD.size // 2))
+    with CombatEventWriter(path) as writer:
+        combat_id = writer.start_combat()
+        writer.write_event(combat_id, 1, 1, 3, 1, 4, 9, 21)
+    assert list(iter_events(path)) == [EVENTS[0], (2, 1, 1, 3, 1, 4, 9, 21)]
+
+
+def test_version_1_logs_are_read_but_not_appended_to(tmp_path):
+    path = tmp_path / "combat.bin"
+    old_record = RECORDS[1]
+    path.write_bytes(HEADER.pack(MAGIC, 1, old_record.size) + old_record.pack(*EVENTS[0]))
+    assert list(iter_events(str(path))) == [EVENTS[0]]
+    with pytest.raises(ValueError):
+        CombatEventWriter(str(path))
+
+
+@pytest.mark.parametrize("contents", [b"", b"RPG", b"XXXX\x01\x00\x14\x00"])
+def test_bad_logs_raise_value_error(tmp_path, contents):
+    path = tmp_path / "combat.bin"
+    path.write_bytes(contents)
+    with pytest.raises(ValueError):
+        list(iter_events(str(path)))
+    if contents:
+        with pytest.raises(ValueError):
+            CombatEventWriter(str(path))
+
+
+def test_entity_codes_are_unique_and_cover_skeletons():
+    assert entity_code(Skeleton(1)) == ENTITY_CODES["Skeleton"]
+    assert len(set(ENTITY_CODES.values())) == len(ENTITY_CODES)
+
+
+def test_observer_records_a_fight(tmp_path):
+    path = str(tmp_path / "combat.bin")
+    player = Character("Hero", 100, 10)
+    enemy = Orc(1)
+    with CombatEventWriter(path) as writer:
+        result = CombatEngine(observer=EventLogObserver(writer, level=1)).run(player, enemy)
+    events = list(iter_events(path))
+
+    player_turns = [event for event in events if event[4] == ACTION_CODES[CombatAction.ATTACK]]
+    enemy_turns = [event for event in events if event[4] == ENEMY_ATTACK]
+    assert len(player_turns) == result.rounds
+    assert sum(event[6] for event in player_turns) == result.damage_dealt
+    assert sum(event[6] for event in enemy_turns) == result.damage_taken
+    assert events[-1][7] == max(result.enemy_health, 0)
+    assert {event[0] for event in events} == {1}
+    assert summarise(path)["attack"] == {"events": result.rounds, "damage": result.damage_dealt}
@@ -0,0 +1,95 @@
+"""Command table lookups, prefixes and the read loop."""
+
+import asyncio
+
+import pytest
+
+from combat_engine import CombatAction
+from commands import (COMBAT_COMMANDS, EQUIP_SLOTS, CommandTable, EquipSlot, command_steps, read_command,
+                      read_command_async, run_steps)
+
+TABLE = CommandTable([
+    ("attack", ("attack", "1")),
+    ("armor", ("armor", "2")),
+    ("equip", ("equip", "3", "e")),
+])
+
+
+def test_full_names_and_aliases():
+    assert TABLE.parse("attack") == "attack"
+    assert TABLE.parse("  ARMOR \n") == "armor"
+    assert TABLE.parse("3") == "equip"
+
+
+def test_unambiguous_prefixes_match():
+    assert TABLE.parse("at") == "attack"
+    assert TABLE.parse("arm") == "armor"
+    assert TABLE.parse("eq") == "equip"
+
+
+def test_shared_prefixes_do_not_match():
+    # "a" starts both attack and armor
+    assert TABLE.parse("a") is None
+    assert TABLE.parse("") is None
+    assert TABLE.parse("attacks") is None
+
+
+def test_alias_beats_a_prefix_of_another_command():
+    table = CommandTable([("use", ("use", "u")), ("unequip", ("unequip",))])
+    assert table.parse("u") == "use"
+    assert table.parse("un") == "unequip"
+
+
+def test_prefixes_can_be_switched_off():
+    table = CommandTable([("attack", ("attack",))], prefixes=False)
+    assert table.parse("att") is None
+
+
+def test_duplicate_names_are_rejected():
+    with pytest.raises(ValueError):
+        CommandTable([("a", ("go",)), ("b", ("go",))])
+    with pytest.raises(ValueError):
+        CommandTable([])
+
+
+def test_game_tables():
+    assert COMBAT_COMMANDS.parse("2") is CombatAction.USE_ITEM
+    assert COMBAT_COMMANDS.parse("wield") is CombatAction.EQUIP
+    assert EQUIP_SLOTS.parse("armour") is EquipSlot.ARMOR
+    assert COMBAT_COMMANDS.names() == ["attack", "use item", "equip"]
+
+
+def test_read_command_retries_then_defaults_on_eof():
+    lines = iter(["x", "arm"])
+    messages = []
+    assert read_command(TABLE, "> ", read=lambda prompt: next(lines), write=messages.append) == "armor"
+    assert messages == ["Invalid input, please try again."]
+
+    def end_of_input(prompt):
+        raise EOFError
+
+    assert read_command(TABLE, "> ", read=end_of_input, write=messages.append) == "attack"
+    assert messages[-1] == "\nUsing default option: attack"
+
+
+def test_read_command_async():
+    lines = iter(["?", "eq"])
+
+    async def read_line(prompt):
+        return next(lines)
+
+    assert asyncio.run(read_command_async(TABLE, "> ", read_line, lambda text: None)) == "equip"
+
+
+def test_dialogues_yield_prompts_and_receive_replies():
+    steps = command_steps(TABLE, "> ", write=lambda text: None)
+    assert next(steps) == "> "
+    assert steps.send("nope") == "> "
+    with pytest.raises(StopIteration) as finished:
+        steps.send("arm")
+    assert finished.value.value == "armor"
+
+    def end_of_input(prompt):
+        raise EOFError
+
+    assert run_steps(command_steps(TABLE, "> ", write=lambda text: None), end_of_input) == "attack"
@@ -0,0 +1,63 @@
+"""Slotted entities must hold the same state and fight like the classes they mirror."""
+
+import random
+
+import pytest
+
+from boss import FireBoss, IceBoss
+from character import Character
+from combat_engine import CombatEngine
+from compact_entities import CompactCharacter, to_compact
+from items import HEALING_POTION, LEATHER_ARMOR, WEAPONS
+from villain import Goblin, Necromancer, Orc, Skeleton
+
+SPECIAL_ATTACKS = {
+    Goblin: "goblin_attack",
+    Orc: "orc_attack",
+    Skeleton: "attack",
+    Necromancer: "necromancer_attack",
+    FireBoss: "fire_attack",
+    IceBoss: "ice_attack",
+}
+
+
+def _player() -> Character:
+    player = Character("Hero", 300, 12)
+    player.inventory.add_item(WEAPONS["Dagger"])
+    player.inventory.equip_weapon(WEAPONS["Dagger"])
+    player.inventory.equip_armor(LEATHER_ARMOR)
+    player.inventory.add_item(HEALING_POTION)
+    return player
+
+
+def _fight(player, enemy, method: str, seed: int):
+    random.seed(seed)
+    engine = CombatEngine(enemy_policy=lambda enemy, player: getattr(enemy, method)(player))
+    result = engine.run(player, enemy, max_rounds=100)
+    return result.player_won, result.rounds, result.player_health, result.enemy_health
+
+
+def test_compact_copies_hold_the_same_state():
+    player = _player()
+    compact = to_compact(player)
+    assert not hasattr(compact, "__dict__")
+    assert isinstance(compact, CompactCharacter)
+    assert (compact.name, compact.get_health(), compact.damage, compact.defense) == ("Hero", 300, 12, 0)
+    assert compact.inventory.items == player.inventory.items
+    assert compact.inventory.charges == player.inventory.charges
+    assert compact.get_attack_power() == player.get_attack_power()
+    assert compact.get_effective_defense() == player.get_effective_defense()
+    # The copy's inventory is its own
+    compact.use_item(HEALING_POTION.name)
+    assert player.inventory.charges == {HEALING_POTION.name: 2}
+
+
+@pytest.mark.parametrize("enemy_class", list(SPECIAL_ATTACKS))
+def test_compact_enemies_fight_like_the_originals(enemy_class):
+    method = SPECIAL_ATTACKS[enemy_class]
+    for seed in range(5):
+        enemy = enemy_class(3)
+        compact_enemy = to_compact(enemy)
+        assert type(compact_enemy).__name__ == f"Compact{enemy_class.__name__}"
+        compact_result = _fight(to_compact(_player()), compact_enemy, method, seed)
+        assert _fight(_player(), enemy, method, seed) == compact_result
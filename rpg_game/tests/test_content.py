@@ -0,0 +1,63 @@
+"""Loading, checking and compiling the content file."""
+
+import copy
+import json
+
+import pytest
+
+from content import (DEFAULT_CONTENT_PATH, PRECOMPUTED_LEVELS, ContentError, EnemyStats, load_content,
+                     parse_content)
+from levels import spawn_enemy
+from villain import Goblin
+
+
+def _data() -> dict:
+    with open(DEFAULT_CONTENT_PATH) as content_file:
+        return json.load(content_file)
+
+
+def test_shipped_content_loads_once():
+    content = load_content()
+    assert load_content() is content
+    assert content.levels and content.weapons and content.enemies
+    for level in content.levels:
+        for enemy_id in [level["boss"], *level["villains"]]:
+            assert isinstance(content.enemy(enemy_id), EnemyStats)
+
+
+def test_stats_follow_the_formula_on_and_past_the_tables():
+    stats = EnemyStats("Brute", "Orc", "Brute", 40, 7, 6, 2)
+    for level in (0, 1, 17, PRECOMPUTED_LEVELS, PRECOMPUTED_LEVELS + 1, 10 ** 6):
+        assert stats.health_at(level) == 40 + 7 * level
+        assert stats.damage_at(level) == 6 + 2 * level
+
+
+def test_new_enemies_reuse_existing_classes():
+    data = _data()
+    data["enemies"]["Hobgoblin"] = {"class": "Goblin", "health": {"base": 50, "per_level": 10},
+                                    "damage": {"base": 9, "per_level": 1}}
+    content = parse_content(data)
+    hobgoblin = spawn_enemy(content.enemy("Hobgoblin"), 2)
+    assert isinstance(hobgoblin, Goblin)
+    assert (hobgoblin.name, hobgoblin.get_health(), hobgoblin.damage) == ("Hobgoblin", 70, 11)
+
+
+@pytest.mark.parametrize("breakage", [
+    lambda data: data.update(version=99),
+    lambda data: data["weapons"][0].pop("damage_bonus"),
+    lambda data: data["enemies"]["Goblin"]["health"].pop("per_level"),
+    lambda data: data["levels"][0].pop("boss"),
+    lambda data: data["levels"][0]["villains"].append("Dragon"),
+])
+def test_malformed_content_is_refused(breakage):
+    data = copy.deepcopy(_data())
+    breakage(data)
+    with pytest.raises(ContentError):
+        parse_content(data)
+
+
+def test_unreadable_files_raise_content_errors(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text("{")
+    with pytest.raises(ContentError):
+        load_content(str(path))
@@ -0,0 +1,91 @@
+"""The vectorised duel kernel must play every duel exactly as the character classes do."""
+
+import random
+
+import numpy as np
+import pytest
+
+from boss import FIRE_DAMAGE_MAX, FIRE_DAMAGE_MIN, FireBoss
+from character import Character
+from duel_kernel import DuelBatch, SequenceRandom, randint_from_rolls, run_object_duel
+from items import LEATHER_ARMOR, WEAPONS
+from villain import Orc
+
+MAX_ROUNDS = 200
+
+
+def _player(health: int, damage: int, weapon: str, armored: bool) -> Character:
+    player = Character("Hero", health, damage)
+    player.inventory.add_item(WEAPONS[weapon])
+    player.inventory.equip_weapon(WEAPONS[weapon])
+    if armored:
+        player.inventory.add_item(LEATHER_ARMOR)
+        player.inventory.equip_armor(LEATHER_ARMOR)
+    return player
+
+
+def _pairs(enemy_class):
+    pairs = []
+    for health in (40, 100):
+        for weapon in ("Rock", "Dagger", "Iron Sword"):
+            for armored in (False, True):
+                for level in (1, 3):
+                    enemy = enemy_class(level)
+                    enemy.narrate = lambda text: None
+                    pairs.append((_player(health, 10, weapon, armored), enemy))
+    return pairs
+
+
+def _assert_matches_object_path(pairs, fire):
+    batch = DuelBatch.from_characters(pairs, fire=fire)
+    rolls = np.random.default_rng(7).random((MAX_ROUNDS, len(batch)))
+    for row in rolls:
+        if not batch.step(row):
+            break
+
+    for index, (player, enemy) in enumerate(pairs):
+        rounds = run_object_duel(player, enemy, rolls[:, index], fire=fire, max_rounds=MAX_ROUNDS)
+        assert batch.player_health[index] == max(player.get_health(), 0)
+        assert batch.enemy_health[index] == max(enemy.get_health(), 0)
+        assert batch.rounds[index] == rounds
+
+
+@pytest.mark.parametrize("enemy_class, fire", [(Orc, False), (FireBoss, False), (FireBoss, True)])
+def test_kernel_matches_object_path(enemy_class, fire):
+    _assert_matches_object_path(_pairs(enemy_class), fire)
+
+
+def test_health_over_the_cap_is_cut_on_the_first_hit():
+    # Character() stores any starting health; set_health caps it at 1000 on the first hit
+    pairs = []
+    for health in (990, 1500, 4000):
+        enemy = FireBoss(2)
+        enemy.narrate = lambda text: None
+        enemy._health = health
+        pairs.append((_player(health, 200, "Rock", False), enemy))
+    _assert_matches_object_path(pairs, fire=True)
+
+
+def test_weapon_bonus_comes_from_the_inventory():
+    pairs = _pairs(Orc)
+    for player, _ in pairs:
+        # Combat reads the inventory's bonus, not the equipped weapon's
+        player.inventory.weapon_bonus += 3
+    _assert_matches_object_path(pairs, fire=False)
+
+
+def test_rolls_become_integers_as_random_randint_makes_them():
+    rolls = np.random.default_rng(3).random(20000)
+    expected = [SequenceRandom([roll]).randint(FIRE_DAMAGE_MIN, FIRE_DAMAGE_MAX) for roll in rolls]
+    assert list(randint_from_rolls(rolls, FIRE_DAMAGE_MIN, FIRE_DAMAGE_MAX)) == expected
+    # SequenceRandom rolls through random.Random's own integer code
+    assert SequenceRandom.randint is random.Random.randint
+    with pytest.raises(ValueError):
+        SequenceRandom([0.5]).randint(3, 2)
+
+
+def test_win_rate_counts_finished_duels():
+    batch = DuelBatch([30, 30], 10, 0, 0, [5, 100], 1, 0, 0)
+    batch.run(np.random.default_rng(1), max_rounds=3)
+    assert list(batch.player_won) == [True, False]
+    assert batch.win_rate() == 0.5
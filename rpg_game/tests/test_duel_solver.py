@@ -0,0 +1,79 @@
+"""The exact duel solver must agree with duels played out by the character classes."""
+
+import math
+import random
+
+import pytest
+
+from boss import FireBoss
+from character import Character
+from duel_solver import ATTACK, FIRE_ATTACK, GOBLIN_ATTACK, NECROMANCER_ATTACK, solve_characters, solve_duel
+from villain import Goblin, Necromancer, Orc
+
+RUNS = 4000
+
+
+def _duel(player_health: int, enemy_class, level: int, move: str, rng: random.Random):
+    """Fresh player and enemy for one duel, sharing one rng."""
+    player = Character("Hero", player_health, 10)
+    enemy = enemy_class(level)
+    enemy.rng = rng
+    enemy.narrate = lambda text: None
+    enemy_attack = {
+        ATTACK: enemy.attack,
+        FIRE_ATTACK: getattr(enemy, "fire_attack", None),
+        GOBLIN_ATTACK: getattr(enemy, "goblin_attack", None),
+        NECROMANCER_ATTACK: getattr(enemy, "necromancer_attack", None),
+    }[move]
+    return player, enemy, enemy_attack
+
+
+def _play(player: Character, enemy: Character, enemy_attack) -> int:
+    """Play a duel where the player always attacks; return the rounds played."""
+    rounds = 0
+    while True:
+        rounds += 1
+        player.attack(enemy)
+        if enemy.get_health() <= 0:
+            return rounds
+        enemy_attack(player)
+        if player.get_health() <= 0:
+            return rounds
+
+
+@pytest.mark.parametrize("player_health, enemy_class, level, move", [
+    (55, Orc, 2, ATTACK),
+    (30, Goblin, 3, GOBLIN_ATTACK),
+    (40, Necromancer, 2, NECROMANCER_ATTACK),
+    (180, FireBoss, 1, FIRE_ATTACK),
+])
+def test_solver_matches_monte_carlo(player_health, enemy_class, level, move):
+    rng = random.Random(11)
+    player, enemy, _ = _duel(player_health, enemy_class, level, move, rng)
+    odds = solve_characters(player, enemy, move)
+
+    wins = 0
+    health_if_won = 0
+    rounds = 0
+    for _ in range(RUNS):
+        player, enemy, enemy_attack = _duel(player_health, enemy_class, level, move, rng)
+        rounds += _play(player, enemy, enemy_attack)
+        if enemy.get_health() <= 0:
+            wins += 1
+            health_if_won += player.get_health()
+
+    # Five standard errors keeps the test stable while still catching a wrong distribution
+    tolerance = 5 * math.sqrt(max(odds.win_probability * (1 - odds.win_probability), 0.01) / RUNS)
+    assert abs(wins / RUNS - odds.win_probability) < tolerance
+    assert rounds / RUNS == pytest.approx(odds.expected_rounds, rel=0.05)
+    if wins:
+        assert health_if_won / wins == pytest.approx(odds.expected_health_if_won, rel=0.05)
+
+
+def test_certain_outcomes():
+    assert solve_duel(0, 10, 0, 50, 5, 0).win_probability == 0.0
+    assert solve_duel(50, 10, 0, 0, 5, 0).expected_health == 50.0
+    # An enemy the player cannot hurt is scored as a loss
+    assert solve_duel(50, 3, 0, 50, 5, 3).win_probability == 0.0
+    odds = solve_duel(50, 10, 0, 20, 5, 0)
+    assert (odds.win_probability, odds.expected_health, odds.expected_rounds) == (1.0, 45.0, 2.0)
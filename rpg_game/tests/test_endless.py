@@ -0,0 +1,45 @@
+"""Endless, generated campaigns with bounded memory."""
+
+from character import Character
+from combat_engine import CombatEngine
+from entity_pool import EntityPool
+from game import Game
+from levels import ENDLESS_LEVELS, ENDLESS_MAX_VILLAINS, ENDLESS_MIN_VILLAINS, EndlessLevelProvider
+
+
+def test_line_ups_depend_only_on_seed_and_level():
+    provider = EndlessLevelProvider(seed=3)
+    assert provider.level_count() == ENDLESS_LEVELS
+    assert provider.line_up(7) == EndlessLevelProvider(seed=3).line_up(7)
+    assert [provider.line_up(level) for level in range(1, 30)] != \
+           [EndlessLevelProvider(seed=4).line_up(level) for level in range(1, 30)]
+
+
+def test_villain_counts_grow_and_stop_at_the_cap():
+    provider = EndlessLevelProvider(seed=0)
+    counts = [len(provider.line_up(level)[1]) for level in (1, 50, 10 ** 9)]
+    assert counts == [ENDLESS_MIN_VILLAINS, ENDLESS_MAX_VILLAINS, ENDLESS_MAX_VILLAINS]
+
+
+def test_deep_levels_build_with_scaled_stats():
+    provider = EndlessLevelProvider(seed=0)
+    shallow, deep = provider.build_boss(1), provider.build_boss(10 ** 6)
+    assert deep.level == 10 ** 6 and deep.damage > shallow.damage
+
+
+def test_long_runs_hold_at_most_two_levels():
+    pool = EntityPool()
+    game = Game(level_provider=EndlessLevelProvider(pool=pool, seed=1), seed=1, write=lambda text: None)
+    player = game.player = Character("Hero", 1000, 10 ** 6)
+    engine = CombatEngine()
+    flow = game.campaign()
+    enemy = next(flow)
+    while game.current_level <= 40:
+        if enemy is None:
+            enemy = next(flow)
+            continue
+        player.set_health(1000)
+        enemy = flow.send(engine.run(player, enemy).player_won)
+        assert len(set(game.bosses.built_levels()) | set(game.villains.built_levels())) <= 2
+    # Cleared levels went back to the pool and were reused
+    assert pool.hits > 0 and pool.free_count() <= 2 * (ENDLESS_MAX_VILLAINS + 1)
@@ -0,0 +1,68 @@
+"""The search enemy AI, its node budget and its use in replays and simulations."""
+
+import itertools
+
+import enemy_ai
+from character import Character
+from enemy_ai import EnemyMove, SearchEnemyAI
+from items import HEALING_POTION
+from replay import ScriptedInput, SessionRecording, record_session, verify_replay
+from simulation import run_campaign
+from villain import Orc
+
+
+def _positions():
+    """A run of positions with every move on offer."""
+    for enemy_health, player_health in itertools.product((15, 40, 90), (20, 60, 120)):
+        enemy = Orc(3)
+        enemy.set_health(enemy_health)
+        enemy.inventory.add_item(HEALING_POTION)
+        player = Character("Hero", player_health, 14)
+        yield enemy, player
+
+
+def _choices(ai: SearchEnemyAI):
+    return [ai.choose_move(enemy, player) for enemy, player in _positions()]
+
+
+def test_node_budget_bounds_each_decision():
+    ai = SearchEnemyAI(node_budget=10, time_budget=None)
+    for enemy, player in _positions():
+        nodes = ai.nodes
+        assert ai.choose_move(enemy, player) in EnemyMove
+        # The node over the budget is counted before the search stops
+        assert ai.nodes - nodes <= 11
+
+
+def test_choices_do_not_depend_on_the_clock(monkeypatch):
+    expected = _choices(SearchEnemyAI(time_budget=None))
+    # A clock that leaps a second per reading, as on a badly overloaded machine
+    ticks = itertools.count()
+    monkeypatch.setattr(enemy_ai.time, "perf_counter", lambda: float(next(ticks)))
+    assert _choices(SearchEnemyAI(time_budget=None)) == expected
+
+
+def test_time_budget_still_caps_a_slow_search(monkeypatch):
+    ticks = itertools.count()
+    monkeypatch.setattr(enemy_ai.time, "perf_counter", lambda: float(next(ticks)))
+    ai = SearchEnemyAI(node_budget=10 ** 6, time_budget=0.5)
+    for enemy, player in _positions():
+        ai.choose_move(enemy, player)
+    # The clock ran out long before the node budget could
+    assert ai.nodes < 10 ** 6
+
+
+def test_simulated_campaigns_against_the_ai_repeat():
+    first = run_campaign(7, enemy_ai=True)
+    second = run_campaign(7, enemy_ai=True)
+    assert (first.won, first.level_reached, first.hp_after_level) == \
+           (second.won, second.level_reached, second.hp_after_level)
+
+
+def test_sessions_against_the_ai_replay(tmp_path, capsys):
+    recording = record_session(seed=3, read=ScriptedInput(["Ann", "", "1", "", "2", "", "1"]), enemy_ai=True)
+    path = str(tmp_path / "session.json")
+    recording.save(path)
+    loaded = SessionRecording.load(path)
+    assert loaded.enemy_ai
+    assert verify_replay(loaded)
@@ -0,0 +1,47 @@
+"""Recycling enemies through the entity pool."""
+
+import pytest
+
+from content import enemy_stats
+from entity_pool import EntityPool
+from villain import SKELETON_STATS, Orc, Skeleton
+
+
+def test_released_enemies_come_back_fresh():
+    pool = EntityPool()
+    stats = enemy_stats("Orc")
+    orc = pool.acquire(Orc, 2, stats)
+    orc.set_health(1)
+    orc.inventory.clear()
+    orc.narrate = lambda text: None
+    pool.release(orc)
+
+    again = pool.acquire(Orc, 3, stats)
+    fresh = Orc(3, stats)
+    assert again is orc
+    assert (again.name, again.get_health(), again.damage, again.level) == \
+           (fresh.name, fresh.get_health(), fresh.damage, fresh.level)
+    assert list(again.inventory.items) == list(fresh.inventory.items)
+    assert "narrate" not in vars(again)
+    assert pool.stats()["hits"] == 1 and pool.stats()["misses"] == 1
+
+
+def test_double_release_is_refused():
+    pool = EntityPool()
+    skeleton = pool.acquire(Skeleton, 1, SKELETON_STATS)
+    pool.release(skeleton)
+    with pytest.raises(ValueError):
+        pool.release(skeleton)
+    assert pool.free_count() == 1
+    # So no two callers can be handed the same enemy
+    assert pool.acquire(Skeleton, 1, SKELETON_STATS) is not pool.acquire(Skeleton, 1, SKELETON_STATS)
+
+
+def test_free_lists_are_capped_per_class():
+    pool = EntityPool(max_free=2)
+    pool.release_all([Skeleton(1) for _ in range(3)])
+    pool.release(Orc(1))
+    assert pool.free_count() == 3
+    assert (pool.released, pool.dropped) == (3, 1)
+    pool.clear()
+    assert pool.free_count() == 0 and pool.released == 3
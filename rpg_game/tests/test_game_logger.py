@@ -0,0 +1,69 @@
+"""Queued, batched logging."""
+
+import io
+import logging
+import queue
+import time
+
+from game_logger import BatchLogWriter, disable_queue_logging, enable_queue_logging, flush_logging
+
+
+def _record(message: str, *args) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, args, None)
+
+
+def _writer(stream: io.StringIO, max_queue_size: int = 0) -> BatchLogWriter:
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return BatchLogWriter(queue.Queue(max_queue_size), [handler], batch_size=16)
+
+
+def test_records_are_written_in_order_and_flushed():
+    stream = io.StringIO()
+    writer = _writer(stream)
+    writer.start()
+    for number in range(40):
+        writer.log_queue.put(_record("line %d", number))
+    assert writer.request_flush(5)
+    assert stream.getvalue().splitlines() == [f"line {number}" for number in range(40)]
+    assert writer.request_stop(5)
+
+
+def test_a_record_that_fails_to_format_does_not_stop_the_writer(monkeypatch):
+    errors = []
+    monkeypatch.setattr(logging.StreamHandler, "handleError", lambda handler, record: errors.append(record))
+    stream = io.StringIO()
+    writer = _writer(stream)
+    writer.start()
+    bad = _record("%d apples", "no")
+    writer.log_queue.put(_record("before"))
+    writer.log_queue.put(bad)
+    writer.log_queue.put(_record("after"))
+    assert writer.request_flush(5)
+    assert writer.is_alive()
+    assert errors == [bad]
+    assert stream.getvalue().splitlines() == ["before", "after"]
+    assert writer.request_stop(5)
+
+
+def test_requests_give_up_on_a_full_queue():
+    writer = _writer(io.StringIO(), max_queue_size=1)
+    # The thread is never started, so the queue stays full
+    writer.log_queue.put(_record("stuck"))
+    started = time.monotonic()
+    assert not writer.request_flush(0.05)
+    assert not writer.request_stop(0.05)
+    assert time.monotonic() - started < 2
+
+
+def test_queue_mode_restores_the_direct_handlers():
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    enable_queue_logging()
+    try:
+        assert root.handlers != handlers
+        logging.getLogger("test").info("queued")
+        assert flush_logging()
+    finally:
+        assert disable_queue_logging()
+    assert root.handlers == handlers
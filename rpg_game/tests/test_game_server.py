@@ -0,0 +1,76 @@
+"""Sessions on the asyncio game server."""
+
+import asyncio
+
+from game_server import GameServer
+from metrics import GameMetrics
+
+
+async def _session(server: GameServer, lines, read_until: bytes) -> bytes:
+    """Connect, send lines, read until a marker, then hang up."""
+    listener = await server.start(port=0)
+    port = listener.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for line in lines:
+        writer.write(f"{line}\n".encode())
+    output = await asyncio.wait_for(reader.readuntil(read_until), 5)
+    await _hang_up(writer)
+    for _ in range(200):
+        if server.active_sessions == 0:
+            break
+        await asyncio.sleep(0.01)
+    listener.close()
+    await listener.wait_closed()
+    return output
+
+
+async def _hang_up(writer: asyncio.StreamWriter) -> None:
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except ConnectionError:
+        # The server may already have reset the connection
+        pass
+
+
+def _combats_started(metrics: GameMetrics) -> int:
+    return sum(value for (name, _), value in metrics.registry.collect().items()
+               if name == "rpg_combats_started_total")
+
+
+def test_session_plays_the_game_text():
+    server = GameServer(seed=1)
+    output = asyncio.run(_session(server, ["ann", "", "2", ""], b"Choose action"))
+    text = output.decode()
+    assert "Welcome, Ann! Choose your weapon wisely." in text
+    assert "You have chosen the Paper!" in text
+    assert "You face " in text
+    assert server.active_sessions == 0
+
+
+def test_disconnect_drops_the_session_instead_of_playing_on():
+    metrics = GameMetrics()
+    server = GameServer(seed=1, metrics=metrics)
+    asyncio.run(_session(server, ["ann", "", "1", "", "attack"], b"Choose action"))
+    assert server.active_sessions == 0
+    # Only the fight the player was in had started; no unattended fights followed
+    assert _combats_started(metrics) == 1
+
+
+def test_idle_timeout_drops_the_session():
+    metrics = GameMetrics()
+    server = GameServer(seed=1, idle_timeout=0.05, metrics=metrics)
+
+    async def idle_client():
+        listener = await server.start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        # The server hangs up on its own once the player goes quiet
+        await asyncio.wait_for(reader.read(), 5)
+        await _hang_up(writer)
+        listener.close()
+        await listener.wait_closed()
+
+    asyncio.run(idle_client())
+    assert server.active_sessions == 0
+    assert _combats_started(metrics) == 0
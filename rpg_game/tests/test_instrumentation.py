@@ -0,0 +1,83 @@
+"""Opt-in phase timing and how it shares wrapped methods with the metrics module."""
+
+import pytest
+
+import instrumentation
+from character import Character
+from instrumentation import PhaseStats, disable_instrumentation, enable_instrumentation, measure, snapshot
+from inventory import Inventory
+from items import HEALING_POTION
+from metrics import GameMetrics, install_item_metrics, uninstall_item_metrics
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    instrumentation.reset()
+    yield
+    disable_instrumentation()
+    uninstall_item_metrics()
+    instrumentation.reset()
+
+
+def _items_used(metrics: GameMetrics) -> int:
+    return sum(value for (name, _), value in metrics.registry.collect().items() if name == "rpg_items_used_total")
+
+
+def _drink(character: Character) -> None:
+    character.inventory.add_item(HEALING_POTION)
+    character.inventory.use_consumable(HEALING_POTION.name, character)
+
+
+def test_enabled_phases_are_timed_and_disabling_restores_the_originals():
+    attack, use_consumable = vars(Character)["attack"], vars(Inventory)["use_consumable"]
+    enable_instrumentation()
+    hero, enemy = Character("Hero", 50, 10), Character("Enemy", 50, 5)
+    hero.attack(enemy)
+    with measure("custom"):
+        pass
+    phases = snapshot()
+    assert phases["damage"]["count"] == 1
+    assert phases["construction"]["count"] == 2
+    assert phases["custom"]["count"] == 1
+
+    disable_instrumentation()
+    assert vars(Character)["attack"] is attack and vars(Inventory)["use_consumable"] is use_consumable
+    hero.attack(enemy)
+    assert snapshot()["damage"]["count"] == 1
+
+
+def test_reentered_phases_count_once():
+    enable_instrumentation()
+    hero = Character("Hero", 50, 10)
+    instrumentation.reset()
+    # use_consumable removes the spent item, another inventory call inside the phase
+    _drink(hero)
+    assert snapshot()["inventory"]["count"] == 2
+
+
+def test_disabling_keeps_item_metrics_installed_after_it():
+    metrics = GameMetrics()
+    enable_instrumentation()
+    install_item_metrics(metrics)
+    disable_instrumentation()
+
+    hero = Character("Hero", 50, 10)
+    instrumentation.reset()
+    _drink(hero)
+    assert _items_used(metrics) == 1
+    # The instrumentation wrapper left inside the metrics one no longer times anything
+    assert "inventory" not in snapshot()
+
+    uninstall_item_metrics()
+    _drink(hero)
+    assert _items_used(metrics) == 1
+    assert "inventory" not in snapshot()
+
+
+def test_percentiles_come_from_power_of_two_buckets():
+    stats = PhaseStats()
+    for elapsed in (1, 3, 1000):
+        stats.record(elapsed)
+    assert stats.percentile(0.5) == 3
+    assert stats.percentile(0.99) == 1023
+    assert stats.to_dict()["count"] == 3
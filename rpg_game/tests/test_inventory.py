@@ -0,0 +1,77 @@
+"""The shared item catalog and per-owner inventories."""
+
+import pytest
+
+from character import Character
+from inventory import Consumable, Inventory
+from items import FIREBALL_SCROLL, HEALING_POTION, ITEM_CATALOG, LEATHER_ARMOR, ROCK, WEAPONS, get_item
+from weapon import Weapon
+
+
+def test_catalog_holds_one_template_per_name():
+    assert get_item("Healing Potion") is HEALING_POTION
+    assert all(isinstance(weapon, Weapon) for weapon in WEAPONS.values())
+    assert set(WEAPONS) <= set(ITEM_CATALOG)
+    with pytest.raises(KeyError):
+        get_item("Missing Item")
+
+
+def test_characters_share_templates_but_not_charges():
+    first, second = Character("A", 50, 5), Character("B", 50, 5)
+    assert first.inventory.items["Rock"] is second.inventory.items["Rock"] is ROCK
+    first.inventory.add_item(HEALING_POTION)
+    assert first.inventory.charges == {HEALING_POTION.name: 2}
+    assert second.inventory.charges == {}
+
+
+def test_consumables_stack_and_spend_charges():
+    inventory = Inventory()
+    character = Character("Hero", 10, 5)
+    assert inventory.add_item(HEALING_POTION) and inventory.add_item(HEALING_POTION)
+    assert inventory.use_consumable(HEALING_POTION.name, character) == f"Healed for {HEALING_POTION.value} HP"
+    assert HEALING_POTION.name in inventory.items and HEALING_POTION.name not in inventory.charges
+    inventory.use_consumable(HEALING_POTION.name, character)
+    assert HEALING_POTION.name not in inventory.items
+    assert inventory.use_consumable(HEALING_POTION.name, character) == "Item not found or not consumable"
+
+
+def test_other_items_do_not_stack():
+    inventory = Inventory()
+    assert inventory.add_item(ROCK) and inventory.add_item(ROCK)
+    assert list(inventory.items) == ["Rock"] and inventory.charges == {}
+
+
+def test_full_inventory_rejects_everything():
+    inventory = Inventory(max_size=2)
+    assert inventory.add_item(HEALING_POTION)
+    assert inventory.add_item(LEATHER_ARMOR)
+    revision = inventory.revision
+    assert not inventory.add_item(FIREBALL_SCROLL)
+    # Not even another charge of a held consumable
+    assert not inventory.add_item(HEALING_POTION)
+    assert inventory.charges == {} and inventory.revision == revision
+
+
+def test_equipping_tracks_bonuses():
+    inventory = Inventory()
+    assert not inventory.equip_weapon(WEAPONS["Dagger"])
+    inventory.add_item(WEAPONS["Dagger"])
+    inventory.add_item(LEATHER_ARMOR)
+    assert inventory.equip_weapon(WEAPONS["Dagger"]) and inventory.equip_armor(LEATHER_ARMOR)
+    assert (inventory.weapon_bonus, inventory.armor_bonus) == (WEAPONS["Dagger"].damage_bonus,
+                                                               LEATHER_ARMOR.defense_bonus)
+    inventory.clear()
+    assert (inventory.items, inventory.weapon_bonus, inventory.armor_bonus) == ({}, 0, 0)
+
+
+def test_display_shows_stack_sizes(capsys):
+    inventory = Inventory()
+    inventory.add_item(HEALING_POTION)
+    inventory.add_item(HEALING_POTION)
+    inventory.add_item(ROCK)
+    inventory.equip_weapon(ROCK)
+    inventory.display_inventory()
+    output = capsys.readouterr().out
+    assert f"{HEALING_POTION.name} (x2): {HEALING_POTION.description}" in output
+    assert "Weapon: Rock" in output and "Armor: None" in output
+    assert isinstance(HEALING_POTION, Consumable)
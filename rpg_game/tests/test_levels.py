@@ -0,0 +1,87 @@
+"""Lazily built level tables and level providers."""
+
+import pytest
+
+from boss import Boss
+from entity_pool import EntityPool
+from game import Game
+from levels import DefaultLevelProvider, LazyLevelTable, LevelProvider
+from villain import Goblin, Villain
+
+
+def test_table_builds_each_level_once_on_lookup():
+    built = []
+    table = LazyLevelTable(3, lambda level: built.append(level) or f"level {level}")
+    # Length, membership and iteration never build anything
+    assert len(table) == 3 and 2 in table and 4 not in table and 0 not in table
+    assert list(table) == [1, 2, 3]
+    assert built == []
+
+    assert table[2] == "level 2" and table[2] == "level 2"
+    assert built == [2] and table.is_built(2) and table.built_levels() == [2]
+    with pytest.raises(KeyError):
+        table[4]
+
+    assert table.discard(2) == "level 2" and table.discard(2) is None
+    table[2]
+    assert built == [2, 2]
+
+
+def test_new_games_build_no_levels():
+    game = Game(seed=1)
+    assert len(game.bosses) == DefaultLevelProvider().level_count()
+    assert game.bosses.built_levels() == [] and game.villains.built_levels() == []
+    assert isinstance(game.bosses[1], Boss)
+    assert game.bosses.built_levels() == [1] and game.villains.built_levels() == []
+
+
+def test_built_enemies_use_the_game_rng():
+    game = Game(seed=1)
+    assert all(villain.rng is game.rng for villain in game.villains[1])
+    assert game.bosses[1].rng is game.rng
+
+
+class TwoGoblins(LevelProvider):
+    def __init__(self):
+        self.released = []
+
+    def level_count(self) -> int:
+        return 2
+
+    def build_boss(self, level: int) -> Boss:
+        return Boss(f"Boss {level}", level, 10 * level, 1)
+
+    def build_villains(self, level: int):
+        return [Goblin(level)]
+
+    def release_enemies(self, enemies) -> None:
+        self.released.extend(enemies)
+
+
+def test_games_play_any_provider_and_hand_enemies_back():
+    provider = TwoGoblins()
+    game = Game(level_provider=provider, seed=1)
+    assert len(game.bosses) == 2 and game.bosses[2].name == "Boss 2"
+    villain = game.villains[1][0]
+    game.release_enemies()
+    assert villain in provider.released and len(provider.released) == 2
+    assert game.bosses.built_levels() == []
+
+
+def test_advancing_drops_cleared_levels_and_builds_one_ahead():
+    game = Game(level_provider=TwoGoblins(), seed=1)
+    game.villains[1], game.bosses[1]
+    game.advance_level()
+    assert game.bosses.built_levels() == [] and game.villains.built_levels() == []
+    game = Game(seed=1)
+    game.advance_level()
+    assert game.bosses.built_levels() == [3] and game.villains.built_levels() == [3]
+
+
+def test_default_provider_releases_to_its_pool():
+    pool = EntityPool()
+    provider = DefaultLevelProvider(pool=pool)
+    villains = provider.build_villains(1)
+    assert villains and all(isinstance(villain, Villain) for villain in villains)
+    provider.release_enemies(villains)
+    assert pool.free_count() == len(villains)
@@ -0,0 +1,111 @@
+"""Live game metrics and their Prometheus text exposition."""
+
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from character import Character
+from combat_engine import CombatEngine
+from items import HEALING_POTION
+from metrics import (CONTENT_TYPE, LEVEL_LABEL_LIMIT, GameMetrics, MetricsRegistry, install_item_metrics,
+                     level_label, start_metrics_server, stop_metrics_server, uninstall_item_metrics)
+
+
+def _values(metrics: GameMetrics, name: str) -> dict:
+    return {labels: value for (metric, labels), value in metrics.registry.collect().items() if metric == name}
+
+
+def test_exposition_format():
+    registry = MetricsRegistry()
+    hits = registry.counter("hits_total", "Hits.", ("who",))
+    sizes = registry.histogram("size", "Sizes.", (1, 5))
+    hits.inc('a"b', amount=2)
+    for value in (0.5, 3, 9):
+        sizes.observe(value)
+    assert registry.render() == "\n".join([
+        "# HELP hits_total Hits.",
+        "# TYPE hits_total counter",
+        'hits_total{who="a\\"b"} 2',
+        "# HELP size Sizes.",
+        "# TYPE size histogram",
+        'size_bucket{le="1.0"} 1',
+        'size_bucket{le="5.0"} 2',
+        'size_bucket{le="+Inf"} 3',
+        "size_sum 12.5",
+        "size_count 3",
+    ]) + "\n"
+
+
+def test_bad_definitions_are_refused():
+    registry = MetricsRegistry()
+    registry.counter("hits_total", "Hits.")
+    with pytest.raises(ValueError):
+        registry.counter("hits_total", "Again.")
+    with pytest.raises(ValueError):
+        registry.histogram("size", "Sizes.", (5, 1))
+
+
+def test_threads_record_into_their_own_shards():
+    registry = MetricsRegistry()
+    hits = registry.counter("hits_total", "Hits.")
+
+    def record():
+        for _ in range(1000):
+            hits.inc()
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert registry.collect() == {("hits_total", ()): 4000}
+
+
+def test_fights_are_counted_through_the_observer():
+    metrics = GameMetrics()
+    player, enemy = Character("Hero", 100, 20), Character("Dummy", 60, 5)
+    result = CombatEngine(observer=metrics.observer(2)).run(player, enemy)
+    assert _values(metrics, "rpg_combats_started_total") == {("2", "Character"): 1}
+    assert _values(metrics, "rpg_combats_won_total") == {("2", "Character"): 1}
+    damage = _values(metrics, "rpg_damage_dealt_total")
+    assert damage[("player", "Character")] == result.damage_dealt
+    assert damage[("enemy", "Character")] == result.damage_taken
+    rounds = _values(metrics, "rpg_combat_rounds")[("Character",)]
+    assert sum(rounds[:-1]) == 1 and rounds[-1] == result.rounds
+
+
+def test_item_metrics_count_consumables_only_while_installed():
+    metrics = GameMetrics()
+    hero = Character("Hero", 50, 5)
+    hero.inventory.add_item(HEALING_POTION)
+    install_item_metrics(metrics)
+    try:
+        hero.use_item(HEALING_POTION.name)
+        hero.use_item("Rock")
+    finally:
+        uninstall_item_metrics()
+    hero.use_item(HEALING_POTION.name)
+    assert _values(metrics, "rpg_items_used_total") == {(HEALING_POTION.name,): 1}
+
+
+def test_deep_levels_share_a_label():
+    assert level_label(LEVEL_LABEL_LIMIT) == str(LEVEL_LABEL_LIMIT)
+    assert level_label(LEVEL_LABEL_LIMIT + 1) == level_label(10 ** 9) == f"{LEVEL_LABEL_LIMIT}+"
+
+
+def test_server_serves_the_registry():
+    metrics = GameMetrics()
+    metrics.combats_started.inc("1", "Orc")
+    server = start_metrics_server(0, metrics=metrics)
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        with urllib.request.urlopen(f"{base}/metrics", timeout=5) as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            body = response.read().decode()
+        assert 'rpg_combats_started_total{level="1",enemy_class="Orc"} 1' in body
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{base}/other", timeout=5)
+    finally:
+        stop_metrics_server(server)
@@ -0,0 +1,63 @@
+"""Automatic player policies and headless campaigns."""
+
+import pickle
+import random
+
+from character import Character
+from combat_engine import CombatAction
+from inventory import Consumable
+from items import HEALING_POTION, LEATHER_ARMOR, WEAPONS
+from player_policies import POLICIES, RandomPolicy, ThresholdHealPolicy, greedy_policy, headless_campaign
+from replay import game_outcome
+
+
+def _pair():
+    return Character("Hero", 100, 10), Character("Enemy", 100, 5)
+
+
+def test_greedy_equips_upgrades_before_attacking():
+    player, enemy = _pair()
+    player.inventory.add_item(WEAPONS["Iron Sword"])
+    assert greedy_policy(player, enemy) == (CombatAction.EQUIP, "Iron Sword")
+    player.equip_item("Iron Sword")
+    # Leather armour is carried but not worn
+    assert greedy_policy(player, enemy) == (CombatAction.EQUIP, LEATHER_ARMOR.name)
+    player.equip_item(LEATHER_ARMOR.name)
+    assert greedy_policy(player, enemy) == (CombatAction.ATTACK, None)
+
+
+def test_heal_policy_drinks_below_the_threshold_only():
+    policy = ThresholdHealPolicy(threshold=50, fallback=lambda player, enemy: (CombatAction.ATTACK, None))
+    player, enemy = _pair()
+    assert policy(player, enemy) == (CombatAction.ATTACK, None)
+    player.set_health(49)
+    assert policy(player, enemy) == (CombatAction.USE_ITEM, HEALING_POTION.name)
+    player.inventory.remove_item(HEALING_POTION.name)
+    assert policy(player, enemy) == (CombatAction.ATTACK, None)
+
+
+def test_random_policy_only_offers_usable_choices():
+    player, enemy = _pair()
+    policy = RandomPolicy(random.Random(2))
+    for _ in range(50):
+        action, item_name = policy(player, enemy)
+        if action is CombatAction.USE_ITEM:
+            assert isinstance(player.inventory.items[item_name], Consumable)
+        elif action is CombatAction.EQUIP:
+            assert player.equip_item(item_name).startswith("Equipped")
+        else:
+            assert item_name is None
+
+
+def test_policies_pickle_for_worker_processes():
+    for policy in POLICIES.values():
+        assert pickle.loads(pickle.dumps(policy)) is not None
+
+
+def test_headless_campaigns_repeat_for_a_seed(capsys):
+    for name in ("greedy", "heal", "random"):
+        first = headless_campaign(POLICIES[name], seed=12)
+        second = headless_campaign(POLICIES[name], seed=12)
+        assert game_outcome(first) == game_outcome(second)
+        assert first.player is not None
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,105 @@
+"""The frame renderer and the console status screen."""
+
+import io
+import os
+
+import pytest
+
+import renderer
+from character import Character
+from game import ConsoleCombatObserver
+from items import LEATHER_ARMOR
+from renderer import CLEAR_BELOW, CLEAR_LINE, CLEAR_SCREEN, RESTORE_CURSOR, SAVE_CURSOR, FrameRenderer, move_cursor
+from villain import Orc
+
+
+class FakeTerminal(io.StringIO):
+    def isatty(self) -> bool:
+        return True
+
+    def take(self) -> str:
+        text = self.getvalue()
+        self.seek(0)
+        self.truncate()
+        return text
+
+
+@pytest.fixture
+def terminal(monkeypatch):
+    monkeypatch.setattr(renderer.shutil, "get_terminal_size", lambda: os.terminal_size((80, 40)))
+    return FakeTerminal()
+
+
+def test_plain_output_has_no_escape_codes():
+    stream = io.StringIO()
+    frame_renderer = FrameRenderer(stream)
+    frame_renderer.render(["a", "b"])
+    frame_renderer.settle()
+    frame_renderer.render(["a", "c"])
+    assert stream.getvalue() == "a\nb\na\nc\n"
+
+
+def test_first_frame_keeps_earlier_text_until_the_player_answers(terminal):
+    frame_renderer = FrameRenderer(terminal)
+    frame_renderer.render(["status", "hp 10"])
+    assert terminal.take() == "status\nhp 10\n"
+    frame_renderer.settle()
+    assert terminal.take() == CLEAR_SCREEN + "status\nhp 10\n"
+
+
+def test_later_frames_redraw_changed_lines_without_erasing_messages(terminal):
+    frame_renderer = FrameRenderer(terminal)
+    frame_renderer.render(["status", "hp 10"])
+    frame_renderer.settle()
+    terminal.take()
+
+    frame_renderer.render(["status", "hp 7"])
+    redraw = terminal.take()
+    assert redraw == SAVE_CURSOR + move_cursor(2) + "hp 7" + CLEAR_LINE + RESTORE_CURSOR
+    assert CLEAR_BELOW not in redraw and CLEAR_SCREEN not in redraw
+    frame_renderer.settle()
+    assert terminal.take() == move_cursor(3) + CLEAR_BELOW
+
+
+def test_frames_too_tall_for_the_screen_are_printed_in_place(terminal):
+    frame_renderer = FrameRenderer(terminal)
+    lines = [str(row) for row in range(40)]
+    for _ in range(2):
+        frame_renderer.render(lines)
+        frame_renderer.settle()
+        assert terminal.take() == "\n".join(lines) + "\n"
+
+
+def test_status_screen_matches_the_original_layout():
+    lines = []
+    player = Character("Hero", 100, 10)
+    player.inventory.add_item(LEATHER_ARMOR)
+    player.inventory.equip_armor(LEATHER_ARMOR)
+    enemy = Orc(1)
+    enemy.inventory.equipped_weapon = None
+    ConsoleCombatObserver(write=lines.append).on_round_start(player, enemy, 1)
+    assert lines == ["\n".join([
+        "",
+        "=============> COMBAT <=============",
+        "",
+        "Player Stats:",
+        "Name: Hero",
+        "Health: 100",
+        "Damage: 10",
+        f"Defense: {LEATHER_ARMOR.defense_bonus}",
+        "",
+        "Equipment:",
+        "Weapon: Rock (+2 Damage)",
+        f"Armor: Leather Armor (+{LEATHER_ARMOR.defense_bonus} Defense)",
+        "",
+        "Enemy Stats:",
+        f"Name: {enemy.name}",
+        f"Health: {enemy.get_health()}",
+        f"Damage: {enemy.damage}",
+        "Defense: 0",
+        "",
+        "Equipment:",
+        "Weapon: None",
+        "Armor: None",
+        "====================================",
+    ])]
@@ -0,0 +1,58 @@
+"""Seeded games and exact session replay."""
+
+import json
+import random
+
+import pytest
+
+from game import CountingRandom, Game
+from replay import (InputRecorder, ScriptedInput, SessionRecording, game_outcome, record_session,
+                    replay_session, verify_replay)
+
+INPUTS = ["Ann", "", "3", "", "attack", "1", "2", "Healing Potion", "1", "", "1"]
+
+
+def test_counting_random_rolls_like_random_random():
+    counting, plain = CountingRandom(9), random.Random(9)
+    assert [counting.randint(1, 6) for _ in range(20)] == [plain.randint(1, 6) for _ in range(20)]
+    draws = counting.draws
+    counting.random()
+    assert counting.draws == draws + 1
+
+
+def test_recorder_keeps_lines_and_end_of_input():
+    recorder = InputRecorder(ScriptedInput(["a", None, "b"]))
+    assert recorder("> ") == "a"
+    with pytest.raises(EOFError):
+        recorder("> ")
+    assert recorder("> ") == "b"
+    with pytest.raises(EOFError):
+        recorder("> ")
+    assert recorder.inputs == ["a", None, "b", None]
+
+
+def test_sessions_replay_to_the_recorded_outcome(tmp_path, capsys):
+    recording = record_session(seed=21, read=ScriptedInput(INPUTS))
+    path = str(tmp_path / "session.json")
+    recording.save(path)
+    loaded = SessionRecording.load(path)
+    assert (loaded.seed, loaded.inputs, loaded.outcome) == (21, recording.inputs, recording.outcome)
+    assert verify_replay(loaded)
+
+    game = replay_session(loaded)
+    assert game.player.name == "Ann"
+    assert game_outcome(game) == recording.outcome
+    assert capsys.readouterr().out.count("Welcome, Ann!") == 1
+
+
+def test_seed_decides_the_game():
+    first, second = (replay_session(SessionRecording(seed, list(INPUTS))) for seed in (4, 4))
+    assert game_outcome(first) == game_outcome(second)
+    assert Game(seed=4).rng.random() == Game(seed=4).rng.random()
+
+
+def test_unknown_recording_versions_are_refused(tmp_path):
+    path = tmp_path / "session.json"
+    path.write_text(json.dumps({"version": 99, "seed": 1, "inputs": []}))
+    with pytest.raises(ValueError):
+        SessionRecording.load(str(path))
@@ -0,0 +1,57 @@
+"""Seeded campaign simulations and their summaries."""
+
+from boss import Boss
+from combat_engine import CombatEngine
+from levels import DefaultLevelProvider
+from player_policies import POLICIES
+from simulation import CampaignResult, CampaignSummary, run_batch, run_campaign
+
+
+def _key(result: CampaignResult):
+    return result.won, result.level_reached, result.hp_after_level, result.level_progress
+
+
+def test_campaigns_repeat_for_a_seed():
+    assert _key(run_campaign(11)) == _key(run_campaign(11))
+    assert _key(run_campaign(11, POLICIES["heal"])) == _key(run_campaign(11, POLICIES["heal"]))
+
+
+def test_bosses_are_built_only_when_their_fight_comes(monkeypatch):
+    events = []
+    build_boss, run = DefaultLevelProvider.build_boss, CombatEngine.run
+
+    def record_build(provider, level):
+        events.append("build")
+        return build_boss(provider, level)
+
+    def record_fight(engine, player, enemy):
+        events.append("boss" if isinstance(enemy, Boss) else "villain")
+        return run(engine, player, enemy)
+
+    monkeypatch.setattr(DefaultLevelProvider, "build_boss", record_build)
+    monkeypatch.setattr(CombatEngine, "run", record_fight)
+    for seed in range(5):
+        events.clear()
+        run_campaign(seed, POLICIES["heal"])
+        # Each boss is built straight before its own fight, never while villains remain
+        for index, event in enumerate(events):
+            if event == "build":
+                assert events[index + 1:index + 2] in (["boss"], [])
+
+
+def test_batches_match_their_runs_on_any_worker_count():
+    summary = CampaignSummary()
+    for seed in range(5, 25):
+        summary.add(run_campaign(seed))
+    assert run_batch(20, workers=1, base_seed=5).to_dict() == summary.to_dict()
+    assert run_batch(20, workers=2, base_seed=5).to_dict() == summary.to_dict()
+
+
+def test_summary_rates():
+    summary = CampaignSummary()
+    summary.add(CampaignResult(0, True, 3, {1: 50, 2: 30}))
+    summary.add(CampaignResult(1, False, 2, {1: 70}, level_progress=0.5))
+    assert summary.win_rate == 0.5
+    assert summary.mean_hp_after_level() == {1: 60.0, 2: 30.0}
+    assert summary.level_win_rates(2) == {1: 1.0, 2: 0.5}
+    assert summary.level_progress_rates(2) == {1: 1.0, 2: 0.75}
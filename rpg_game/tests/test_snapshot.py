@@ -0,0 +1,141 @@
+"""Round trips through game snapshots, including snapshots written by format version 1."""
+
+import struct
+
+import pytest
+
+from character import Character
+from combat_engine import always_attack
+from inventory import Inventory
+from items import HEALING_POTION, LEATHER_ARMOR, WEAPONS
+from game import Game
+from snapshot import (ENEMY_SECTION, GAME_SECTION, HEADER, INVENTORY_SECTION, MAGIC, PLAYER_SECTION, SECTION,
+                      GameSnapshotter, SnapshotError, _text, restore_game, restore_inventory,
+                      snapshot_character, snapshot_game, snapshot_inventory)
+
+
+def _game() -> Game:
+    game = Game(seed=5, read_input=lambda prompt: "")
+    player = Character("Hero", 87, 12)
+    player.defense = 2
+    player.inventory.add_item(WEAPONS["Dagger"])
+    player.inventory.equip_weapon(WEAPONS["Dagger"])
+    player.inventory.add_item(LEATHER_ARMOR)
+    player.inventory.equip_armor(LEATHER_ARMOR)
+    game.player = player
+    game.bosses[1].set_health(11)
+    game.villains[1][0].set_health(3)
+    for _ in range(10):
+        game.rng.random()
+    return game
+
+
+def _section(tag: int, payload: bytes) -> bytes:
+    return SECTION.pack(tag, len(payload)) + payload
+
+
+def test_game_round_trip():
+    game = _game()
+    restored = restore_game(snapshot_game(game), read_input=lambda prompt: "")
+
+    assert restored.current_level == game.current_level
+    player, original = restored.player, game.player
+    assert (player.name, player.get_health(), player.damage, player.defense) == ("Hero", 87, 12, 2)
+    assert list(player.inventory.items) == list(original.inventory.items)
+    assert player.inventory.charges == original.inventory.charges
+    assert player.get_attack_power() == original.get_attack_power()
+    assert player.get_effective_defense() == original.get_effective_defense()
+    assert restored.bosses[1].get_health() == 11
+    assert [villain.get_health() for villain in restored.villains[1]] == \
+           [villain.get_health() for villain in game.villains[1]]
+    # The restored game rolls the numbers the original would have rolled next
+    assert [restored.rng.random() for _ in range(5)] == [game.rng.random() for _ in range(5)]
+
+
+def test_unchanged_sections_are_not_encoded_again():
+    game = _game()
+    snapshotter = GameSnapshotter(game)
+    first = snapshotter.snapshot()
+    encoded = snapshotter.sections_encoded
+    assert snapshotter.snapshot() is first
+    assert snapshotter.sections_encoded == encoded
+
+    game.rng.random()
+    game.player.inventory.add_item(HEALING_POTION)
+    changed = snapshotter.snapshot()
+    assert snapshotter.sections_encoded == encoded + 2
+    assert changed == snapshot_game(game)
+
+
+def test_version_1_snapshot_loads():
+    player = Character("Hero", 40, 9)
+    villains = Game().villains[2]
+    enemy_payload = struct.pack("<B", 2)
+    enemy_payload += struct.pack("<HHB", 1, 0xFFFF, 0)
+    enemy_payload += struct.pack(f"<HHB{len(villains)}H", 2, 17, len(villains), *range(1, len(villains) + 1))
+    data = (HEADER.pack(MAGIC, 1)
+            + _section(GAME_SECTION, struct.pack("<H", 2))
+            + _section(PLAYER_SECTION, snapshot_character(player))
+            + _section(INVENTORY_SECTION, snapshot_inventory(player.inventory))
+            + _section(ENEMY_SECTION, enemy_payload))
+
+    game = restore_game(data, read_input=lambda prompt: "")
+    assert game.current_level == 2
+    assert (game.player.name, game.player.get_health(), game.player.damage) == ("Hero", 40, 9)
+    assert game.bosses[2].get_health() == 17
+    assert [villain.get_health() for villain in game.villains[2]] == list(range(1, len(villains) + 1))
+    assert not game.bosses.is_built(1)
+
+
+@pytest.mark.parametrize("data", [b"", b"NOPE\x02\x00", HEADER.pack(MAGIC, 99), HEADER.pack(MAGIC, 2) + b"\x01"])
+def test_unreadable_snapshots_raise(data):
+    with pytest.raises(SnapshotError):
+        restore_game(data, read_input=lambda prompt: "")
+
+
+def test_long_names_are_cut_on_a_character_boundary():
+    encoded = _text("é" * 200)
+    assert encoded[0] == 254
+    assert encoded[1:].decode("utf-8") == "é" * 127
+
+
+def test_inventory_round_trip_and_revision():
+    inventory = Inventory()
+    inventory.add_item(HEALING_POTION)
+    inventory.add_item(HEALING_POTION)
+    inventory.add_item(WEAPONS["Staff"])
+    inventory.equip_weapon(WEAPONS["Staff"])
+    restored = restore_inventory(snapshot_inventory(inventory))
+    assert restored.items == inventory.items
+    assert restored.charges == inventory.charges
+    assert restored.weapon_bonus == WEAPONS["Staff"].damage_bonus
+    assert restored.revision != inventory.revision
+
+    revision = restored.revision
+    assert restored.remove_item("Missing Item") is None
+    assert restored.revision == revision
+    assert restored.remove_item("Staff") is not None
+    assert restored.revision != revision
+
+
+def test_restored_mid_level_game_plays_on(capsys):
+    game = Game(seed=5, read_input=lambda prompt: "", player_policy=always_attack, write=lambda text: None)
+    game.player = Character("Hero", 1000, 60)
+    flow = game.campaign()
+    first = next(flow)
+    assert game.combat(game.player, first)
+    second = flow.send(True)
+    assert first.get_health() <= 0
+
+    restored = restore_game(snapshot_game(game), read_input=lambda prompt: "")
+    restored.player_policy = always_attack
+    restored.write = lambda text: None
+    flow = restored.campaign()
+    enemy = next(flow)
+    # The villain beaten before the save is not fought again
+    assert enemy.name == second.name and enemy.get_health() == second.get_health()
+    try:
+        while True:
+            enemy = next(flow) if enemy is None else flow.send(restored.combat(restored.player, enemy))
+    except StopIteration as finished:
+        assert finished.value is True
@@ -0,0 +1,52 @@
+"""The balance tuner's scoring, caching and search."""
+
+import json
+
+import pytest
+
+from content import DEFAULT_CONTENT_PATH
+from tuner import (BalanceTuner, apply_coefficients, curve_error, progress_error, read_coefficients, score)
+
+TARGET = (0.9, 0.8, 0.7, 0.6)
+
+
+@pytest.fixture
+def data() -> dict:
+    with open(DEFAULT_CONTENT_PATH) as content_file:
+        return json.load(content_file)
+
+
+def test_coefficients_round_trip_without_touching_the_source(data):
+    coefficients = read_coefficients(data, ["Goblin"])
+    health_base, health_per_level, damage_base, damage_per_level = coefficients["Goblin"]
+    changed = apply_coefficients(data, {"Goblin": (health_base + 1, health_per_level, damage_base, 0)})
+    assert read_coefficients(changed, ["Goblin"]) == {"Goblin": (health_base + 1, health_per_level, damage_base, 0)}
+    assert read_coefficients(data, ["Goblin"]) == coefficients
+
+
+def test_scores_rank_clear_rates_then_progress():
+    assert curve_error([1.0, 0.5], [0.5, 0.5]) == 0.25
+    # Short of the target, further progress is better; past it, less is
+    assert progress_error([[0.0, 1.0], [0.3, 1.0]], [0.5, 0.5]) == pytest.approx(0.7 + 1.0)
+    stuck, closer = [[0.0], [0.2]], [[0.0], [0.6]]
+    assert score(closer, [0.5]) < score(stuck, [0.5])
+
+
+def test_target_must_cover_every_level(data):
+    with pytest.raises(ValueError):
+        BalanceTuner(data, [0.5], workers=1)
+
+
+def test_tuning_never_ends_worse_and_reuses_its_cache(data, tmp_path):
+    cache_path = str(tmp_path / "cache.json")
+    tuner = BalanceTuner(data, TARGET, runs=10, workers=1, enemy_ids=["Goblin"], cache_path=cache_path)
+    start_rates = tuner.evaluate([read_coefficients(data, ["Goblin"])])[0]
+    result = tuner.tune(max_iterations=2)
+    assert result.error <= curve_error(start_rates[0], TARGET)
+    assert result.evaluations == tuner.evaluations > 0
+    assert set(result.coefficients) == {"Goblin"}
+
+    again = BalanceTuner(data, TARGET, runs=10, workers=1, enemy_ids=["Goblin"], cache_path=cache_path)
+    repeated = again.tune(max_iterations=2)
+    assert again.evaluations == 0
+    assert (repeated.coefficients, repeated.error) == (result.coefficients, result.error)
@@ -0,0 +1,319 @@
+"""Module for tuning enemy stat formulas against a target win-rate curve.
+
+Design Decisions:
+- The coefficients tuned are the ones in the content file: base and
+  per-level health and damage of each enemy, so a tuned result is simply
+  a new content file
+- A candidate is scored by simulating campaigns and comparing the fraction
+  of players clearing each level with the target curve (sum of squared
+  differences); ties, such as every candidate losing level 1 outright, are
+  broken by how far into each level players got, so the search never
+  stalls on a flat stretch
+- Every candidate is played on the same seeds, so differences between
+  candidates come from their stats rather than from luck
+- The search is a pattern search over integers: each coefficient is nudged
+  up and down by its step, the best neighbour wins, and steps halve when
+  no neighbour improves; one iteration's neighbours are evaluated in
+  parallel across a process pool
+- Scores are cached by configuration, in memory and optionally in a JSON
+  file, so revisited candidates and repeated runs cost nothing
+
+Usage:
+    python tuner.py --target 0.9 0.8 0.7 0.6 --runs 1000 --workers 8 --write tuned_content.json
+"""
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from content import DEFAULT_CONTENT_PATH, parse_content
+from player_policies import POLICIES
+from simulation import run_batch
+
+# Coefficients of one enemy: health base, health per level, damage base, damage per level
+Coefficients = Tuple[int, int, int, int]
+COEFFICIENT_FIELDS = (("health", "base"), ("health", "per_level"), ("damage", "base"), ("damage", "per_level"))
+# Starting step for each coefficient, and the smallest value it may take
+INITIAL_STEPS = (16, 4, 4, 2)
+MINIMUMS = (1, 0, 1, 0)
+
+DEFAULT_TARGET = (0.9, 0.8, 0.7, 0.6)
+DEFAULT_RUNS = 1000
+DEFAULT_POLICY = "heal"
+DEFAULT_ITERATIONS = 30
+
+
+def read_coefficients(data: dict, enemy_ids: Optional[Sequence[str]] = None) -> Dict[str, Coefficients]:
+    """
+    Read the tunable coefficients out of raw content data.
+
+    Args:
+        data: Content as decoded from JSON
+        enemy_ids: Enemies to tune (every enemy if omitted)
+
+    Returns:
+        Dict mapping enemy id to its coefficients
+    """
+    enemies = data["enemies"]
+    return {enemy_id: tuple(int(enemies[enemy_id][stat][field]) for stat, field in COEFFICIENT_FIELDS)
+            for enemy_id in (enemy_ids or sorted(enemies))}
+
+
+def apply_coefficients(data: dict, coefficients: Dict[str, Coefficients]) -> dict:
+    """Return a copy of raw content data with the given coefficients written in."""
+    data = copy.deepcopy(data)
+    for enemy_id, values in coefficients.items():
+        for (stat, field), value in zip(COEFFICIENT_FIELDS, values):
+            data["enemies"][enemy_id][stat][field] = value
+    return data
+
+
+# Per-level clear rates and progress rates of one candidate
+Rates = List[List[float]]
+
+
+def evaluate_content(data: dict, runs: int, base_seed: int, policy_name: str) -> Rates:
+    """
+    Simulate campaigns on raw content data.
+
+    Runs in worker processes, so it takes only plain, picklable arguments.
+
+    Returns:
+        Clear rate and progress rate of each level, in level order
+    """
+    content = parse_content(data)
+    summary = run_batch(runs, workers=1, base_seed=base_seed, policy=POLICIES[policy_name], content=content)
+    level_count = len(content.levels)
+    return [list(summary.level_win_rates(level_count).values()),
+            list(summary.level_progress_rates(level_count).values())]
+
+
+def curve_error(rates: Sequence[float], target: Sequence[float]) -> float:
+    """Sum of squared differences between level rates and the target."""
+    return sum((rate - goal) ** 2 for rate, goal in zip(rates, target))
+
+
+def progress_error(rates: Rates, target: Sequence[float]) -> float:
+    """
+    How far players are from moving each level's clear rate towards its target.
+
+    Below target, failed runs should get further into the level; above it,
+    some runs should start to fall short, which lowers the progress rate.
+    """
+    error = 0.0
+    for clear_rate, progress_rate, goal in zip(*rates, target):
+        if clear_rate < goal:
+            error += 1.0 - progress_rate
+        elif clear_rate > goal:
+            error += progress_rate
+    return error
+
+
+def score(rates: Rates, target: Sequence[float]) -> Tuple[float, float]:
+    """Sort key of a candidate: clear rate error first, progress error to break ties."""
+    return curve_error(rates[0], target), progress_error(rates, target)
+
+
+class TuningResult:
+    """Best configuration found by a tuning run."""
+    def __init__(self, coefficients: Dict[str, Coefficients], rates: List[float], error: float,
+                 iterations: int, evaluations: int, cache_hits: int):
+        """
+        Args:
+            coefficients: Best coefficients per enemy
+            rates: Level clear rates they produce
+            error: Their distance from the target curve
+            iterations: Search iterations run
+            evaluations: Candidates simulated
+            cache_hits: Candidates answered from the cache
+        """
+        self.coefficients = coefficients
+        self.rates = rates
+        self.error = error
+        self.iterations = iterations
+        self.evaluations = evaluations
+        self.cache_hits = cache_hits
+
+
+class BalanceTuner:
+    """Pattern search over enemy coefficients with a shared result cache."""
+    def __init__(self, data: dict, target: Sequence[float], runs: int = DEFAULT_RUNS, base_seed: int = 0,
+                 policy_name: str = DEFAULT_POLICY, workers: Optional[int] = None,
+                 enemy_ids: Optional[Sequence[str]] = None, cache_path: Optional[str] = None):
+        """
+        Args:
+            data: Content to start from, as decoded from JSON
+            target: Desired clear rate for each level
+            runs: Campaigns simulated per candidate
+            base_seed: Seed of the first campaign; every candidate uses the same seeds
+            policy_name: Key in POLICIES of the player policy to simulate
+            workers: Worker processes (defaults to the CPU count)
+            enemy_ids: Enemies to tune (every enemy if omitted)
+            cache_path: JSON file to load cached scores from and save them to
+
+        Raises:
+            ValueError: If the target does not have one entry per level
+        """
+        if len(target) != len(data.get("levels", [])):
+            raise ValueError(f"Target has {len(target)} levels but the content has {len(data.get('levels', []))}")
+        self.data = data
+        self.target = tuple(target)
+        self.runs = runs
+        self.base_seed = base_seed
+        self.policy_name = policy_name
+        self.workers = workers or os.cpu_count() or 1
+        self.enemy_ids = list(enemy_ids or sorted(data["enemies"]))
+        self.cache_path = cache_path
+        # Identifies the starting content, so cached scores of other content files never match
+        self.content_digest = hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()
+        self.cache: Dict[str, Rates] = {}
+        self.evaluations = 0
+        self.cache_hits = 0
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path) as cache_file:
+                self.cache = json.load(cache_file)
+
+    def _cache_key(self, coefficients: Dict[str, Coefficients]) -> str:
+        settings = [self.content_digest, self.runs, self.base_seed, self.policy_name, coefficients]
+        return json.dumps(settings, sort_keys=True)
+
+    def save_cache(self) -> None:
+        """Write the cache to cache_path, if one was given."""
+        if self.cache_path:
+            with open(self.cache_path, "w") as cache_file:
+                json.dump(self.cache, cache_file)
+
+    def evaluate(self, candidates: List[Dict[str, Coefficients]],
+                 pool: Optional[ProcessPoolExecutor] = None) -> List[Rates]:
+        """
+        Level clear and progress rates for each candidate, simulating only those not cached.
+
+        Args:
+            candidates: Coefficients to score
+            pool: Worker pool to simulate in (in this process if omitted)
+        """
+        keys = [self._cache_key(candidate) for candidate in candidates]
+        missing = {}
+        for key, candidate in zip(keys, candidates):
+            if key in self.cache or key in missing:
+                self.cache_hits += 1
+            else:
+                missing[key] = apply_coefficients(self.data, candidate)
+        if missing:
+            arguments = (list(missing.values()), [self.runs] * len(missing),
+                         [self.base_seed] * len(missing), [self.policy_name] * len(missing))
+            results = pool.map(evaluate_content, *arguments) if pool else map(evaluate_content, *arguments)
+            self.cache.update(zip(missing, results))
+            self.evaluations += len(missing)
+        return [self.cache[key] for key in keys]
+
+    def _neighbours(self, coefficients: Dict[str, Coefficients],
+                    steps: Dict[str, List[int]]) -> List[Dict[str, Coefficients]]:
+        """Every configuration one step away in a single coefficient."""
+        neighbours = []
+        for enemy_id in self.enemy_ids:
+            values = coefficients[enemy_id]
+            for index, step in enumerate(steps[enemy_id]):
+                if not step:
+                    continue
+                for delta in (step, -step):
+                    value = values[index] + delta
+                    if value < MINIMUMS[index]:
+                        continue
+                    moved = dict(coefficients)
+                    moved[enemy_id] = values[:index] + (value,) + values[index + 1:]
+                    neighbours.append(moved)
+        return neighbours
+
+    def tune(self, max_iterations: int = DEFAULT_ITERATIONS) -> TuningResult:
+        """
+        Search for the coefficients closest to the target curve.
+
+        Args:
+            max_iterations: Upper bound on search iterations
+
+        Returns:
+            The best configuration found
+        """
+        best = read_coefficients(self.data, self.enemy_ids)
+        steps = {enemy_id: list(INITIAL_STEPS) for enemy_id in self.enemy_ids}
+        pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            best_rates = self.evaluate([best], pool)[0]
+            best_score = score(best_rates, self.target)
+            iterations = 0
+            while iterations < max_iterations and any(any(enemy_steps) for enemy_steps in steps.values()):
+                iterations += 1
+                neighbours = self._neighbours(best, steps)
+                scored = [(score(rates, self.target), candidate, rates)
+                          for candidate, rates in zip(neighbours, self.evaluate(neighbours, pool))]
+                candidate_score, candidate, rates = min(scored, key=lambda entry: entry[0],
+                                                        default=(None, None, None))
+                if candidate is not None and candidate_score < best_score:
+                    best, best_rates, best_score = candidate, rates, candidate_score
+                else:
+                    # Nothing better at this resolution; look closer
+                    for enemy_steps in steps.values():
+                        enemy_steps[:] = [step // 2 for step in enemy_steps]
+        finally:
+            if pool:
+                pool.shutdown()
+            self.save_cache()
+        return TuningResult(best, best_rates[0], best_score[0], iterations, self.evaluations, self.cache_hits)
+
+
+def print_result(result: TuningResult, target: Sequence[float], elapsed: float) -> None:
+    """Print a tuning result."""
+    print(f"Error: {result.error:.4f} after {result.iterations} iterations "
+          f"({result.evaluations} simulated, {result.cache_hits} cached, {elapsed:.1f}s)")
+    print("\nLevel clear rate (target):")
+    for level, (rate, goal) in enumerate(zip(result.rates, target), start=1):
+        print(f"  {level}: {rate:.2%} ({goal:.2%})")
+    print("\nCoefficients (health base + per level, damage base + per level):")
+    for enemy_id, (health_base, health_per_level, damage_base, damage_per_level) in result.coefficients.items():
+        print(f"  {enemy_id}: health {health_base} + {health_per_level}*level, "
+              f"damage {damage_base} + {damage_per_level}*level")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point for the balance tuner."""
+    parser = argparse.ArgumentParser(description="Tune enemy stat formulas against a target win-rate curve.")
+    parser.add_argument("--content", default=DEFAULT_CONTENT_PATH, help="content file to start from")
+    parser.add_argument("--target", type=float, nargs="+", default=list(DEFAULT_TARGET),
+                        help="desired clear rate of each level")
+    parser.add_argument("--enemies", nargs="+", default=None, help="enemy ids to tune (default: all)")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="campaigns per candidate")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first campaign")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default=DEFAULT_POLICY, help="player policy")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="maximum search iterations")
+    parser.add_argument("--cache", default=None, help="JSON file caching candidate scores between runs")
+    parser.add_argument("--write", default=None, help="write the tuned content to this file")
+    args = parser.parse_args(argv)
+
+    with open(args.content) as content_file:
+        data = json.load(content_file)
+    unknown = [enemy_id for enemy_id in args.enemies or [] if enemy_id not in data["enemies"]]
+    if unknown:
+        parser.error(f"unknown enemies: {', '.join(unknown)}")
+    try:
+        tuner = BalanceTuner(data, args.target, args.runs, args.seed, args.policy,
+                             args.workers, args.enemies, args.cache)
+    except ValueError as error:
+        parser.error(str(error))
+
+    start = time.perf_counter()
+    result = tuner.tune(args.iterations)
+    print_result(result, args.target, time.perf_counter() - start)
+    if args.write:
+        with open(args.write, "w") as output:
+            json.dump(apply_coefficients(data, result.coefficients), output, indent=2)
+        print(f"\nWrote {args.write}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,27 @@
 import os
-from typing import List, Optional
+import sys
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+from renderer import CLEAR_SCREEN, enable_ansi
 
 def clear_screen() -> None:
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # Nothing to clear when output is redirected, e.g. during headless replays
+    if not sys.stdout.isatty():
+        return
+    # Consoles older than Windows 10 cannot take escape codes, so only they
+    # still start a shell to clear the screen
+    if not enable_ansi():
+        os.system('cls')
+        return
+    # An escape code avoids starting a shell just to clear the screen
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
 
-def press_enter() -> None:
+def press_enter(read: Callable[[str], str] = input) -> None:
     """Prompt the user to press Enter to continue."""
     try:
-        input("\nPress Enter to continue...\n")
+        read("\nPress Enter to continue...\n")
     except EOFError:
         print("\nContinuing automatically...")
         return True
@@ -17,23 +30,35 @@ def print_border(length: int = 80, char: str = "-") -> None:
     """Print a border for visual separation."""
     print(char * length)
 
-def get_valid_input(prompt: str, options: List[str]) -> int:
+@lru_cache(maxsize=64)
+def _option_indices(options: Tuple[str, ...]) -> Dict[str, int]:
+    """Map each option to its first index, built once per option list."""
+    indices: Dict[str, int] = {}
+    for index, option in enumerate(options):
+        indices.setdefault(option, index)
+    return indices
+
+def get_valid_input(prompt: str, options: List[str], read: Callable[[str], str] = input) -> int:
     """
     Get valid user input from a list of options.
     
+    For typed commands with aliases and prefixes, use commands.read_command.
+    
     Args:
         prompt: Input prompt message
         options: List of valid options
+        read: Reads one line of input for a prompt
         
     Returns:
         Index of the chosen option
     """
+    indices = _option_indices(tuple(options))
     while True:
         try:
-            user_input = input(prompt).strip().lower()
-            if user_input in options:
-                return options.index(user_input)
-            print("Invalid input, please try again.")
+            index = indices.get(read(prompt).strip().lower())
         except EOFError:
-            print("\nUsing default option: attack")
-            return 0  # Return first option as default (attack)
+            print(f"\nUsing default option: {options[0]}")
+            return 0
+        if index is not None:
+            return index
+        print("Invalid input, please try again.")
@@ -1,5 +1,16 @@
 from character import Character
 from typing import Optional
+from content import EnemyStats, enemy_stats
+from entity_pool import ENEMY_POOL
+
+# Special attack tuning
+GOBLIN_DODGE_CHANCE = 0.3
+ORC_STUN_CHANCE = 0.2
+NECROMANCER_SUMMON_CHANCE = 0.1
+SKELETON_HEALTH = 20
+SKELETON_DAMAGE = 4
+# Skeletons are the same at every level
+SKELETON_STATS = EnemyStats("Skeleton", "Skeleton", "Skeleton", SKELETON_HEALTH, 0, SKELETON_DAMAGE, 0)
 
 class Villain(Character):
     """Base class for regular enemies."""
@@ -16,6 +27,17 @@ class Villain(Character):
         super().__init__(name, health, damage)
         self.level = level
 
+    def respawn(self, level: int, stats: EnemyStats) -> None:
+        """
+        Turn this villain back into a fresh one, as its constructor would.
+        
+        Args:
+            level: Level to spawn it at
+            stats: Compiled stats of its enemy type
+        """
+        self.reset(stats.name, stats.health_at(level), stats.damage_at(level))
+        self.level = level
+
     def attack(self, enemy) -> int:
         """
         Attack an enemy character.
@@ -26,17 +48,15 @@ class Villain(Character):
         Returns:
             The total damage dealt
         """
-        total_damage = self.damage + (self.inventory.equipped_weapon.damage_bonus if self.inventory.equipped_weapon else 0)
-        current_health = enemy.get_health()
-        effective_defense = enemy.get_effective_defense()
-        damage_dealt = max(0, total_damage - effective_defense)
-        enemy.set_health(current_health - damage_dealt)
+        damage_dealt = max(0, self.damage + self.inventory.weapon_bonus - enemy.get_effective_defense())
+        enemy.set_health(enemy.get_health() - damage_dealt)
         return damage_dealt
 
 class Goblin(Villain):
     """A small but quick enemy."""
-    def __init__(self, level: int):
-        super().__init__("Goblin", level, 30 + (5 * level), 5 + level)
+    def __init__(self, level: int, stats: Optional[EnemyStats] = None):
+        stats = stats or enemy_stats("Goblin")
+        super().__init__(stats.name, level, stats.health_at(level), stats.damage_at(level))
 
     def goblin_attack(self, enemy) -> int:
         """
@@ -48,15 +68,16 @@ class Goblin(Villain):
         Returns:
             The damage dealt
         """
-        if random.random() < 0.3:  # 30% chance to dodge
-            print(f"{self.name} dodged the attack!")
+        if self.rng.random() < GOBLIN_DODGE_CHANCE:
+            self.narrate(f"{self.name} dodged the attack!")
             return 0
         return self.attack(enemy)
 
 class Orc(Villain):
     """A powerful but slow enemy."""
-    def __init__(self, level: int):
-        super().__init__("Orc", level, 50 + (5 * level), 8 + level)
+    def __init__(self, level: int, stats: Optional[EnemyStats] = None):
+        stats = stats or enemy_stats("Orc")
+        super().__init__(stats.name, level, stats.health_at(level), stats.damage_at(level))
 
     def orc_attack(self, enemy) -> int:
         """
@@ -68,23 +89,33 @@ class Orc(Villain):
         Returns:
             The damage dealt
         """
-        if random.random() < 0.2:  # 20% chance to stun
-            print(f"{self.name} stunned you!")
+        if self.rng.random() < ORC_STUN_CHANCE:
+            self.narrate(f"{self.name} stunned you!")
         return self.attack(enemy)
 
+class Skeleton(Villain):
+    """A minion summoned by a Necromancer."""
+    def __init__(self, level: int, stats: Optional[EnemyStats] = None):
+        stats = stats or SKELETON_STATS
+        super().__init__(stats.name, level, stats.health_at(level), stats.damage_at(level))
+
 class Necromancer(Villain):
     """A magical enemy that can summon skeletons."""
-    def __init__(self, level: int):
-        super().__init__("Necromancer", level, 40 + (5 * level), 6 + level)
+    def __init__(self, level: int, stats: Optional[EnemyStats] = None):
+        stats = stats or enemy_stats("Necromancer")
+        super().__init__(stats.name, level, stats.health_at(level), stats.damage_at(level))
 
-    def summon_skeleton(self) -> Villain:
+    def summon_skeleton(self) -> Skeleton:
         """
         Summon a skeleton minion.
         
+        Skeletons come from the shared enemy pool; hand them back with
+        ENEMY_POOL.release() once they are done.
+        
         Returns:
-            A new Skeleton villain
+            A fresh Skeleton villain
         """
-        return Villain("Skeleton", self.level - 1, 20, 4)
+        return ENEMY_POOL.acquire(Skeleton, self.level - 1, SKELETON_STATS)
 
     def necromancer_attack(self, enemy) -> int:
         """
@@ -96,8 +127,11 @@ class Necromancer(Villain):
         Returns:
             The damage dealt
         """
-        if random.random() < 0.1:  # 10% chance to summon
+        if self.rng.random() < NECROMANCER_SUMMON_CHANCE:
             skeleton = self.summon_skeleton()
-            print(f"{self.name} summoned a skeleton!")
-            return skeleton.attack(enemy)
+            self.narrate(f"{self.name} summoned a skeleton!")
+            damage_dealt = skeleton.attack(enemy)
+            # The skeleton only lives for this one attack
+            ENEMY_POOL.release(skeleton)
+            return damage_dealt
         return self.attack(enemy)